@@ -0,0 +1,1064 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Empathic-01 Benchmarks
+
+Microbenchmarks for the per-frame hot paths of the vision pipeline.
+Each subcommand prints per-call cost so changes can be compared
+before/after on the target hardware.
+
+Usage:
+    python benchmark.py emotion-post
+    python benchmark.py emotion-model [--image face.jpg]
+    python benchmark.py face-detectors --input frames/
+    python benchmark.py face-alloc
+    python benchmark.py gesture-classify
+    python benchmark.py gesture-backends
+    python benchmark.py gesture-motion
+    python benchmark.py hand-scale --input recording.mp4
+    python benchmark.py overlay
+    python benchmark.py detect-concurrency --input recording.mp4
+    python benchmark.py headless
+    python benchmark.py frame-alloc
+    python benchmark.py pipeline [--input recording.mp4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.config import EmotionLabel, GestureLabel
+
+
+def _time_per_call(fn: Callable[[], object], iterations: int, warmup: int = 100) -> float:
+    """Return mean wall time per call in microseconds."""
+    for _ in range(warmup):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def _report(name: str, us_per_call: float, baseline_us: float = 0.0) -> None:
+    """Print a single benchmark line."""
+    line = f"  {name:<40} {us_per_call:10.2f} us/frame"
+    if baseline_us > 0:
+        line += f"  ({baseline_us / us_per_call:.1f}x)"
+    print(line)
+
+
+def _iter_frames(path: str, limit: int) -> Iterator[np.ndarray]:
+    """Yield up to limit BGR frames from an image directory, a video file or "synthetic"."""
+    from senses.frame_sources import create_frame_source
+
+    source = create_frame_source(path, realtime=False)
+    if not source.open():
+        return
+    try:
+        for _ in range(limit):
+            ret, frame = source.read()
+            if not ret:
+                break
+            yield frame
+    finally:
+        source.release()
+
+
+# =============================================================================
+# Emotion score post-processing
+# =============================================================================
+
+class _DictScorePostprocessor:
+    """Reference dict/Counter implementation, kept for comparison."""
+
+    def __init__(self):
+        self._smoothed: Dict[str, float] = {}
+        self._history: deque = deque(maxlen=5)
+        self._stable = EmotionLabel.NEUTRAL
+
+    def __call__(self, scores: Dict[str, float]):
+        if not self._smoothed:
+            self._smoothed = scores
+        else:
+            self._smoothed = {
+                k: 0.3 * v + 0.7 * self._smoothed.get(k, v) for k, v in scores.items()
+            }
+        dominant = max(self._smoothed, key=self._smoothed.get)
+        emotion = EmotionLabel(dominant)
+        self._history.append(emotion)
+        if len(self._history) >= 3:
+            label, count = Counter(self._history).most_common(1)[0]
+            if count >= 3:
+                self._stable = label
+            emotion = self._stable
+        return emotion, self._smoothed[dominant], {
+            k: float(v) for k, v in self._smoothed.items()
+        }
+
+
+def bench_emotion_post(args: argparse.Namespace) -> None:
+    """Per-frame cost of smoothing, dominant label and stability filtering."""
+    from senses.vision_face import EmotionResult, FaceTrack, scores_to_dict, NUM_EMOTIONS
+
+    rng = np.random.default_rng(0)
+    raw = rng.dirichlet(np.ones(NUM_EMOTIONS), size=256).astype(np.float32)
+    raw_dicts = [scores_to_dict(row) for row in raw]
+
+    track = FaceTrack(track_id=1, box=(0, 0, 100, 100))
+    reference = _DictScorePostprocessor()
+    frame = [0]
+
+    def run_vector():
+        i = frame[0] = (frame[0] + 1) & 255
+        track.postprocess(raw[i])
+
+    def run_vector_with_output():
+        i = frame[0] = (frame[0] + 1) & 255
+        _, _, smoothed = track.postprocess(raw[i])
+        scores_to_dict(smoothed)
+
+    def run_dict():
+        i = frame[0] = (frame[0] + 1) & 255
+        reference(raw_dicts[i])
+
+    # Per-frame end to end: post-processing plus the EmotionResult detect_all() returns
+    def run_vector_result():
+        i = frame[0] = (frame[0] + 1) & 255
+        emotion, confidence, smoothed = track.postprocess(raw[i])
+        EmotionResult(emotion=emotion, confidence=confidence, all_scores=scores_to_dict(smoothed),
+                      face_box=track.box, timestamp=time.time(), inference_time_ms=0.0)
+
+    def run_dict_result():
+        i = frame[0] = (frame[0] + 1) & 255
+        emotion, confidence, scores = reference(raw_dicts[i])
+        EmotionResult(emotion=emotion, confidence=confidence, all_scores=scores,
+                      face_box=track.box, timestamp=time.time(), inference_time_ms=0.0)
+
+    print(f"Emotion post-processing ({args.iterations} frames)")
+    baseline = _time_per_call(run_dict, args.iterations)
+    _report("dict + Counter (reference)", baseline)
+    _report("score vector", _time_per_call(run_vector, args.iterations), baseline)
+    _report("score vector + dict output view", _time_per_call(run_vector_with_output, args.iterations), baseline)
+
+    print("Per-frame result (post-processing + EmotionResult)")
+    baseline = _time_per_call(run_dict_result, args.iterations)
+    _report("dict + Counter (reference)", baseline)
+    _report("score vector", _time_per_call(run_vector_result, args.iterations), baseline)
+
+
+# =============================================================================
+# Emotion model invocation
+# =============================================================================
+
+def bench_emotion_model(args: argparse.Namespace) -> None:
+    """Per-crop latency of DeepFace.analyze versus direct batched model calls."""
+    import cv2 as cv
+    from senses.vision_face import FaceEmotionDetector, FaceTrack
+
+    detector = FaceEmotionDetector(use_deepface=True)
+    if not detector._deepface_available:
+        print("DeepFace is not installed - nothing to compare")
+        return
+
+    if args.image:
+        image = cv.imread(args.image)
+        if image is None:
+            print(f"Could not read {args.image}")
+            return
+    else:
+        image = np.random.default_rng(0).integers(0, 256, (540, 960, 3), dtype=np.uint8)
+    gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY)
+
+    # Centered face box covering a third of the frame
+    h, w = gray.shape
+    size = min(h, w) // 3
+    face_box = ((w - size) // 2, (h - size) // 2, size, size)
+
+    print(f"Emotion model invocation ({args.iterations} crops, {size}x{size} face)")
+    baseline = _time_per_call(
+        lambda: detector._analyze_with_deepface(image, face_box), args.iterations, warmup=5
+    )
+    _report("DeepFace.analyze", baseline)
+
+    if detector._emotion_model is None:
+        print("  Direct emotion model could not be built")
+        return
+
+    for batch_size in (1, 2, 4, 8):
+        tracks = [FaceTrack(i, face_box) for i in range(batch_size)]
+        per_batch = _time_per_call(
+            lambda: detector._classify_faces(image, gray, tracks),
+            max(1, args.iterations // batch_size),
+            warmup=5,
+        )
+        _report(f"direct predict, batch of {batch_size} (per crop)", per_batch / batch_size, baseline)
+
+
+# =============================================================================
+# Face detector backends
+# =============================================================================
+
+def _largest_box(faces) -> Optional[Tuple[int, int, int, int]]:
+    """Bounding box of the largest detected face, if any."""
+    if not faces:
+        return None
+    return max(faces, key=lambda f: f.bounding_box[2] * f.bounding_box[3]).bounding_box
+
+
+def bench_face_detectors(args: argparse.Namespace) -> None:
+    """ms/frame and agreement with a reference backend for every face detector."""
+    import cv2 as cv
+    from core.config import VisionConfig
+    from senses.face_detectors import box_iou, create_face_detector
+
+    config = VisionConfig()
+    backends = {}
+    for name in args.backends.split(","):
+        try:
+            backends[name] = create_face_detector(name, config)
+        except (ValueError, FileNotFoundError) as e:
+            print(f"  Skipping {name}: {e}")
+    if not backends:
+        return
+    reference = args.reference if args.reference in backends else next(iter(backends))
+
+    # Largest face per frame for each backend
+    boxes: Dict[str, List[Optional[Tuple[int, int, int, int]]]] = {name: [] for name in backends}
+    frame_times: Dict[str, List[float]] = {name: [] for name in backends}
+    frame_count = 0
+    for frame in _iter_frames(args.input, args.limit):
+        gray = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        for name, backend in backends.items():
+            faces = backend.detect(frame, gray)
+            boxes[name].append(_largest_box(faces))
+            frame_times[name].append(backend.last_inference_ms)
+        frame_count += 1
+
+    if frame_count == 0:
+        print(f"No frames read from {args.input}")
+        return
+
+    print(f"Face detector backends ({frame_count} frames, reference: {reference})")
+    print(f"  {'backend':<10} {'mean ms':>9} {'p95 ms':>9} {'detected':>9} {'agreement':>10}")
+    for name in backends:
+        times = np.array(frame_times[name])
+        agree = 0
+        for box, ref_box in zip(boxes[name], boxes[reference]):
+            if box is None and ref_box is None:
+                agree += 1
+            elif box is not None and ref_box is not None and box_iou(box, ref_box) >= args.iou:
+                agree += 1
+        detected = sum(box is not None for box in boxes[name])
+        print(
+            f"  {name:<10} {times.mean():9.2f} {np.percentile(times, 95):9.2f} "
+            f"{detected / frame_count:9.0%} {agree / frame_count:10.0%}"
+        )
+
+
+# =============================================================================
+# Face preprocessing allocations
+# =============================================================================
+
+def _allocations_per_frame(fn: Callable[[], object], frames: int) -> Tuple[float, float]:
+    """
+    Measure Python/NumPy heap allocations per call with tracemalloc.
+
+    Returns:
+        Tuple of (mean, max) transient peak bytes allocated during a call
+    """
+    import tracemalloc
+
+    fn()  # Warm up lazily allocated buffers
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+    finally:
+        tracemalloc.stop()
+    return float(np.mean(peaks)), float(np.max(peaks))
+
+
+def bench_face_alloc(args: argparse.Namespace) -> None:
+    """Per-frame allocation churn of face preprocessing and detect()."""
+    import cv2 as cv
+    from core.config import VisionConfig
+    from senses.vision_face import FaceEmotionDetector, FacePreprocessor, EMOTION_INPUT_SIZE
+
+    config = VisionConfig()
+    frame = np.random.default_rng(0).integers(
+        0, 256, (config.frame_height, config.frame_width, 3), dtype=np.uint8
+    )
+    face_box = (config.frame_width // 3, config.frame_height // 4, 200, 200)
+
+    def naive_preprocess():
+        gray = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        x, y, w, h = face_box
+        crop = gray[y:y + h, x:x + w].copy()
+        face = cv.resize(crop, EMOTION_INPUT_SIZE)
+        return (face.astype(np.float32) / 255.0)[np.newaxis, :, :, np.newaxis]
+
+    preprocessor = FacePreprocessor(config.frame_width, config.frame_height)
+
+    def pooled_preprocess():
+        gray = preprocessor.to_gray(frame)
+        return preprocessor.emotion_batch(gray, [face_box])
+
+    detector = FaceEmotionDetector(config, use_deepface=False)
+
+    print(f"Face preprocessing allocations ({args.frames} frames, "
+          f"{config.frame_width}x{config.frame_height})")
+    for name, fn in (
+        ("allocating preprocessing", naive_preprocess),
+        ("buffered preprocessing", pooled_preprocess),
+        ("FaceEmotionDetector.detect()", lambda: detector.detect(frame)),
+    ):
+        mean_bytes, max_bytes = _allocations_per_frame(fn, args.frames)
+        print(f"  {name:<32} {mean_bytes / 1024:10.1f} KiB/frame (max {max_bytes / 1024:.1f} KiB)")
+
+
+# =============================================================================
+# Hand gesture classification
+# =============================================================================
+
+def _synthetic_hands(count: int, noise: float = 0.005) -> List[np.ndarray]:
+    """Noisy single hands cycling through the canonical gesture poses."""
+    from evaluation.gesture_data import GESTURE_ORDER, canonical_pose
+
+    poses = [pose[0] for pose in map(canonical_pose, GESTURE_ORDER) if pose is not None and len(pose) == 1]
+    rng = np.random.default_rng(0)
+    hands = []
+    for i in range(count):
+        hand = poses[i % len(poses)].copy()
+        hand[:, :2] += rng.normal(0, noise, (21, 2))
+        hands.append(hand)
+    return hands
+
+
+def _per_joint_angles(landmarks: np.ndarray) -> List[float]:
+    """Reference: one small np.array pair per joint angle."""
+    from senses.vision_hands import ANGLE_TRIPLETS
+
+    angles = []
+    for a, b, c in ANGLE_TRIPLETS:
+        ab = np.array([landmarks[a, 0] - landmarks[b, 0], landmarks[a, 1] - landmarks[b, 1]])
+        cb = np.array([landmarks[c, 0] - landmarks[b, 0], landmarks[c, 1] - landmarks[b, 1]])
+        angles.append(abs(np.degrees(np.arctan2(ab[0] * cb[1] - ab[1] * cb[0], np.dot(ab, cb)))))
+    return angles
+
+
+def bench_gesture_classify(args: argparse.Namespace) -> None:
+    """Per-frame cost of rule-based gesture classification, original vs vectorized."""
+    from evaluation.gesture_reference import ReferenceGestureRules, to_landmark_list
+    from senses.vision_hands import HandGestureDetector, HandFeatures, hand_geometry
+
+    hands = _synthetic_hands(256)
+    stacked = np.stack(hands)
+    point_lists = [to_landmark_list(hand) for hand in hands]
+    detector = HandGestureDetector()
+    reference = ReferenceGestureRules()
+    frame = [0]
+
+    # Both paths must agree on every hand before their timings mean anything
+    mismatches = [
+        i for i, (hand, points) in enumerate(zip(hands, point_lists))
+        if detector._classify_gesture(HandFeatures(hand)) != reference.classify(points)
+    ]
+    print(f"Labels: {len(hands) - len(mismatches)}/{len(hands)} hands identical to the original rules")
+
+    def next_index():
+        i = frame[0] = (frame[0] + 1) & 255
+        return i
+
+    def run_detect_path():
+        features = HandFeatures(hands[next_index()])
+        detector._classify_gesture(features)
+        features.finger_states
+
+    def run_reference_detect_path():
+        points = point_lists[next_index()]
+        reference.classify(points)
+        reference.finger_states(points)
+
+    print(f"Gesture classification ({args.iterations} frames)")
+    baseline = _time_per_call(lambda: reference.classify(point_lists[next_index()]), args.iterations)
+    _report("original _classify_gesture (reference)", baseline)
+    _report("_classify_gesture()",
+            _time_per_call(lambda: detector._classify_gesture(HandFeatures(hands[next_index()])), args.iterations),
+            baseline)
+    baseline = _time_per_call(run_reference_detect_path, args.iterations)
+    _report("original + finger states (reference)", baseline)
+    _report("classify + finger states (detect path)", _time_per_call(run_detect_path, args.iterations), baseline)
+
+    baseline = _time_per_call(lambda: _per_joint_angles(hands[next_index()]), args.iterations)
+    _report("per-joint angles (reference)", baseline)
+    _report("hand_geometry()", _time_per_call(lambda: hand_geometry(hands[next_index()]), args.iterations), baseline)
+    for n in (2, 8):
+        per_batch = _time_per_call(lambda: hand_geometry(stacked[:n]), args.iterations // n)
+        _report(f"hand_geometry(), batch of {n} (per hand)", per_batch / n)
+
+    def run_two_hands():
+        features = HandFeatures.batch(stacked[:2])
+        for hand in features:
+            detector._classify_gesture(hand)
+        detector._classify_two_hand_gesture(features)
+
+    _report("two hands: batch + classify + two-hand",
+            _time_per_call(run_two_hands, args.iterations // 2))
+    detector.close()
+    if mismatches:
+        print(f"Label mismatches on hands {mismatches[:10]}")
+        sys.exit(1)
+
+
+def bench_gesture_backends(args: argparse.Namespace) -> None:
+    """Per-hand latency of rule-based vs keypoint classifier gesture backends."""
+    from core.config import VisionConfig
+    from senses.gesture_classifiers import KeypointClassifier
+    from senses.vision_hands import HandGestureDetector, HandFeatures
+
+    hands = _synthetic_hands(256)
+    stacked = np.stack(hands)
+    image_size = (VisionConfig.frame_width, VisionConfig.frame_height)
+    detector = HandGestureDetector(VisionConfig(gesture_classifier="rules"))
+
+    try:
+        keypoint = KeypointClassifier()
+    except (ImportError, FileNotFoundError) as e:
+        print(f"Keypoint classifier unavailable: {e}")
+        keypoint = None
+
+    print(f"Gesture classifier backends ({args.iterations} frames)")
+    for n in (1, 2):
+        batch = stacked[:n]
+
+        def run_rules():
+            for hand in HandFeatures.batch(batch):
+                detector._classify_gesture(hand)
+
+        iterations = args.iterations // n
+        baseline = _time_per_call(run_rules, iterations) / n
+        _report(f"rules, {n} hand(s) (per hand)", baseline)
+        if keypoint is not None:
+            per_hand = _time_per_call(lambda: keypoint.classify(batch, image_size), iterations) / n
+            _report(f"keypoint model, {n} hand(s) (per hand)", per_hand, baseline)
+
+    if keypoint is not None:
+        # Agreement on the poses both backends can name
+        rules = [detector._classify_gesture(HandFeatures(hand))[0] for hand in hands]
+        learned = [label for label, _ in keypoint.classify(stacked, image_size)]
+        agree = sum(a == b for a, b in zip(rules, learned))
+        print(f"  label agreement on synthetic poses: {agree}/{len(hands)}")
+    detector.close()
+
+
+def bench_gesture_motion(args: argparse.Namespace) -> None:
+    """Per-frame cost of point history upkeep and motion classification."""
+    from senses.gesture_classifiers import PointHistoryClassifier
+    from senses.vision_hands import PointHistory
+
+    length = PointHistoryClassifier.HISTORY_LENGTH
+    image_size = (960, 540)
+    trail = [(480 + int(100 * np.cos(t / 3)), 270 + int(100 * np.sin(t / 3))) for t in range(64)]
+    frame = [0]
+
+    tuples: deque = deque(maxlen=length)
+
+    def run_deque():
+        i = frame[0] = (frame[0] + 1) & 63
+        tuples.append(trail[i])
+        points = np.array(tuples, dtype=np.float32)
+        return (points - points[0]).ravel()
+
+    history = PointHistory(length)
+    ordered = np.zeros((length, 2), dtype=np.int32)
+
+    def run_ring():
+        i = frame[0] = (frame[0] + 1) & 63
+        history.append(trail[i])
+        return history.ordered(ordered)
+
+    print(f"Point history ({args.iterations} frames)")
+    baseline = _time_per_call(run_deque, args.iterations)
+    _report("deque of tuples -> array (reference)", baseline)
+    _report("ring buffer", _time_per_call(run_ring, args.iterations), baseline)
+
+    try:
+        classifier = PointHistoryClassifier()
+    except (ImportError, FileNotFoundError) as e:
+        print(f"Motion classifier unavailable: {e}")
+        return
+    _report("motion classifier, pointing frame",
+            _time_per_call(lambda: classifier.classify(run_ring(), image_size), args.iterations // 4))
+
+
+def bench_hand_scale(args: argparse.Namespace) -> None:
+    """Hand stage latency (preprocessing + MediaPipe + classification) per inference scale."""
+    from core.config import VisionConfig
+    from senses.vision_hands import HandGestureDetector
+
+    if args.input:
+        frames = list(_iter_frames(args.input, args.limit))
+    else:
+        # Without recordings only the palm detector runs: the no-hand cost
+        rng = np.random.default_rng(0)
+        frames = [rng.integers(0, 256, (540, 960, 3), dtype=np.uint8) for _ in range(min(args.limit, 30))]
+    if not frames:
+        print(f"No frames read from {args.input}")
+        return
+    h, w = frames[0].shape[:2]
+
+    print(f"Hand stage ({len(frames)} frames, {w}x{h}, ROI tracking {'on' if args.roi else 'off'})")
+    baseline = 0.0
+    for scale in (float(s) for s in args.scales.split(",")):
+        detector = HandGestureDetector(VisionConfig(
+            hand_inference_scale=scale,
+            hand_roi_tracking=args.roi,
+            motion_gesture_classifier=False,
+        ))
+        preprocessor = detector._preprocessor
+        prepare_us = _time_per_call(lambda: preprocessor.prepare(frames[0]), 200, warmup=10)
+
+        hands_found = 0
+        start = time.perf_counter()
+        for frame in frames:
+            hands_found += len(detector.detect_all(frame))
+        per_frame = (time.perf_counter() - start) / len(frames) * 1e6
+        detector.close()
+
+        baseline = baseline or per_frame
+        _report(f"scale {scale:.2f} ({round(w * scale)}x{round(h * scale)})", per_frame, baseline)
+        print(f"      preprocessing {prepare_us:.1f} us, hands/frame {hands_found / len(frames):.2f}")
+
+
+HAND_CONNECTIONS = [
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (0, 9), (9, 10), (10, 11), (11, 12),
+    (0, 13), (13, 14), (14, 15), (15, 16),
+    (0, 17), (17, 18), (18, 19), (19, 20),
+    (5, 9), (9, 13), (13, 17),
+]
+
+
+def _per_point_hand_overlay(image: np.ndarray, landmarks: np.ndarray) -> None:
+    """Reference: two cv.line per connection and two cv.circle per landmark."""
+    import cv2 as cv
+
+    h, w = image.shape[:2]
+    for start, end in HAND_CONNECTIONS:
+        pt1 = (int(landmarks[start, 0] * w), int(landmarks[start, 1] * h))
+        pt2 = (int(landmarks[end, 0] * w), int(landmarks[end, 1] * h))
+        cv.line(image, pt1, pt2, (255, 255, 255), 2)
+        cv.line(image, pt1, pt2, (142, 85, 114), 1)
+    for i, lm in enumerate(landmarks):
+        cx, cy = int(lm[0] * w), int(lm[1] * h)
+        size = 8 if i in [4, 8, 12, 16, 20] else 5
+        cv.circle(image, (cx, cy), size, (255, 255, 255), -1)
+        cv.circle(image, (cx, cy), size, (142, 85, 114), 2)
+
+
+def _full_frame_info_panel(frame: np.ndarray, fps: float, mood: str, message: str) -> None:
+    """Reference: info panel drawn via a full-frame copy and full-frame addWeighted."""
+    import cv2 as cv
+
+    h = frame.shape[0]
+    overlay = frame.copy()
+    cv.rectangle(overlay, (10, 10), (290, 190), (0, 0, 0), -1)
+    cv.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+    cv.putText(frame, "EMPATHIC-01", (20, 35), cv.FONT_HERSHEY_SIMPLEX, 0.7, (142, 85, 114), 2)
+    cv.putText(frame, f"FPS: {fps:.1f}", (20, 65), cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    cv.putText(frame, f"Mood: {mood}", (20, 90), cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    cv.putText(frame, "Emotion: --", (20, 115), cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    cv.putText(frame, "Gesture: --", (20, 140), cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    cv.putText(frame, message[:30], (20, 170), cv.FONT_HERSHEY_SIMPLEX, 0.4, (152, 251, 152), 1)
+    cv.putText(frame, "ESC: Quit | SPACE: Pause | D: Debug", (10, h - 10),
+               cv.FONT_HERSHEY_SIMPLEX, 0.4, (150, 150, 150), 1)
+
+
+def _overlay_hand_results(image_size: Tuple[int, int]) -> list:
+    """Two hands side by side, with pixel landmarks as detect_all() provides them."""
+    from senses.vision_hands import HandGestureDetector, HandGestureResult, pixel_landmarks
+
+    w, h = image_size
+    hands = _synthetic_hands(2)
+    hands[1][:, 0] += 0.25
+    results = []
+    for hand in hands:
+        points = pixel_landmarks(hand, (w, h))
+        results.append(HandGestureResult(
+            gesture=GestureLabel.OPEN_PALM,
+            confidence=0.9,
+            landmarks=hand,
+            bounding_box=HandGestureDetector._calc_bounding_box(points, w, h),
+            handedness="Right",
+            finger_states={},
+            pixel_landmarks=points,
+            frame_size=(w, h),
+        ))
+    return results
+
+
+def _overlay_face_result():
+    """A face result with all emotion scores, for drawing."""
+    from senses.vision_face import EMOTION_LABELS, EmotionResult
+
+    return EmotionResult(
+        emotion=EmotionLabel.HAPPY,
+        confidence=0.8,
+        all_scores={label.value: 1.0 / len(EMOTION_LABELS) for label in EMOTION_LABELS},
+        face_box=(300, 150, 200, 200),
+        timestamp=0.0,
+        inference_time_ms=0.0,
+    )
+
+
+def bench_overlay(args: argparse.Namespace) -> None:
+    """Overlay rendering cost per frame, as a share of the frame budget."""
+    from core.config import VisionConfig
+    from senses.vision_face import FaceEmotionDetector
+    from senses.vision_hands import HandGestureDetector, draw_skeletons
+
+    h, w = 540, 960
+    budget_us = 1e6 / args.fps
+    canvas = np.zeros((h, w, 3), dtype=np.uint8)
+    image = canvas.copy()
+    detector = HandGestureDetector(VisionConfig(motion_gesture_classifier=False))
+    results = _overlay_hand_results((w, h))
+    hands = [result.landmarks for result in results]
+
+    def reset_image():
+        np.copyto(image, canvas)
+
+    def report(name, fn, baseline=0.0):
+        us = _time_per_call(lambda: (reset_image(), fn()), args.iterations) - reset_us
+        _report(name, us, baseline)
+        print(f"      {us / budget_us:.2%} of a {args.fps:.0f} fps frame")
+        return us
+
+    reset_us = _time_per_call(reset_image, args.iterations)
+    print(f"Overlay rendering ({args.iterations} frames, {w}x{h})")
+    pixels = [result.pixel_landmarks for result in results]
+    for n in (1, 2):
+        baseline = report(f"{n} hand skeleton(s), per-point (reference)",
+                          lambda: [_per_point_hand_overlay(image, hand) for hand in hands[:n]])
+        report(f"{n} hand skeleton(s), polylines", lambda: draw_skeletons(image, pixels[:n]), baseline)
+    report("draw_all_landmarks(), 2 hands", lambda: detector.draw_all_landmarks(image, results))
+    detector.close()
+
+    face = _overlay_face_result()
+    face_detector = object.__new__(FaceEmotionDetector)  # draw_result() needs no models
+    report("face draw_result()", lambda: face_detector.draw_result(image, face))
+    report("face draw_result(), with scores", lambda: face_detector.draw_result(image, face, draw_scores=True))
+
+    from overlay import InfoPanelCompositor
+
+    compositor = InfoPanelCompositor()
+    message = "That's wonderful! Let's celebrate together!"
+    fps_values = iter(np.tile(np.arange(25.0, 35.0, 0.1), args.iterations))
+    baseline = report("info panel, full-frame blend (reference)",
+                      lambda: _full_frame_info_panel(image, 30.0, "joyful", message))
+    report("info panel, compositor (text cached)",
+           lambda: compositor.draw(image, 30.0, "joyful", message=message), baseline)
+    report("info panel, compositor (text changes)",
+           lambda: compositor.draw(image, next(fps_values), "joyful", message=message), baseline)
+
+
+def _ui_system(image_size: Tuple[int, int]):
+    """
+    An EmpathicSystem with only the pieces the per-frame UI path touches
+    (no camera, models or audio), and a FrameData with two hands and a face.
+    """
+    from core.config import EmpathicConfig
+    from core.state_machine import EmpatheticStateMachine
+    from main import EmpathicSystem, FrameData
+    from overlay import InfoPanelCompositor
+    from senses.frame_pool import FrameBufferPool
+    from senses.vision_face import FaceEmotionDetector
+
+    w, h = image_size
+    system = object.__new__(EmpathicSystem)
+    system.config = EmpathicConfig()
+    system.config.vision.frame_width, system.config.vision.frame_height = w, h
+    system.face_detector = object.__new__(FaceEmotionDetector)
+    system.hand_detector = None  # Hands are drawn with draw_hand_results
+    system.state_machine = EmpatheticStateMachine(system.config.state_machine)
+    system._detect_pool = None
+    system._scheduler = None
+    system._info_panel = InfoPanelCompositor()
+    system._frame_pool = FrameBufferPool.from_config(system.config.vision)
+    system._capture_buffer = None
+
+    rng = np.random.default_rng(0)
+    gesture_results = _overlay_hand_results((w, h))
+    frame_data = FrameData(
+        frame=rng.integers(0, 256, (h, w, 3), dtype=np.uint8),
+        emotion_result=_overlay_face_result(),
+        gesture_result=gesture_results[0],
+        gesture_results=gesture_results,
+        fps=30.0,
+    )
+    return system, frame_data
+
+
+def bench_headless(args: argparse.Namespace) -> None:
+    """Per-frame cost of the UI path that headless mode skips, vs publishing results."""
+    import cv2 as cv
+    from result_publisher import UdpResultPublisher, frame_data_to_dict
+
+    h, w = 540, 960
+    budget_us = 1e6 / args.fps
+    system, frame_data = _ui_system((w, h))
+
+    def draw_ui():
+        system._frame_pool.release(system._draw_ui(frame_data))
+
+    def show():
+        display_frame = system._draw_ui(frame_data)
+        cv.imshow("Empathic-01 benchmark", display_frame)
+        system._frame_pool.release(display_frame)
+        cv.waitKey(1)
+
+    print(f"UI vs headless ({args.iterations} frames, {w}x{h})")
+    ui_us = _time_per_call(draw_ui, args.iterations)
+    _report("_draw_ui() (copy, overlays, panel blend)", ui_us)
+    # Qt builds abort the process (not raise) without a display, so check first
+    has_display = not sys.platform.startswith("linux") or any(
+        os.environ.get(name) for name in ("DISPLAY", "WAYLAND_DISPLAY")
+    )
+    try:
+        if not has_display:
+            raise cv.error("no display")
+        show()
+    except cv.error:
+        print("  imshow + waitKey: unavailable (no display or no GUI support in this OpenCV build)")
+    else:
+        ui_us = _time_per_call(show, args.iterations // 4, warmup=10)
+        _report("_draw_ui() + imshow + waitKey(1)", ui_us)
+        cv.destroyAllWindows()
+
+    publisher = UdpResultPublisher(args.publish)
+    mood = system.state_machine.current_mood.value
+    publish_us = _time_per_call(
+        lambda: publisher.publish(frame_data_to_dict(frame_data, mood)), args.iterations
+    )
+    _report("headless: JSON + UDP publish", publish_us)
+    publisher.close()
+
+    saved = ui_us - publish_us
+    print(f"  headless saves {saved:.0f} us/frame ({saved / budget_us:.1%} of a {args.fps:.0f} fps frame)")
+
+
+def bench_frame_alloc(args: argparse.Namespace) -> None:
+    """Full-frame allocations per loop iteration: per-stage arrays vs the frame buffer pool."""
+    import cv2 as cv
+    from main import FrameData
+    from senses.frame_sources import SyntheticSource
+    from senses.vision_hands import draw_hand_results
+
+    h, w = 540, 960
+    frame_bytes = h * w * 3
+    system, template = _ui_system((w, h))
+    source = SyntheticSource(w, h, frames=0, realtime=False)
+    source.open()
+    system.camera = source
+
+    def result_for(frame: np.ndarray) -> FrameData:
+        return FrameData(
+            frame=frame,
+            emotion_result=template.emotion_result,
+            gesture_result=template.gesture_result,
+            gesture_results=template.gesture_results,
+            fps=30.0,
+        )
+
+    def allocating():
+        # Before the pool: read, flip, display copy and full-frame panel blend each allocate
+        _, frame = source.read()
+        mirrored = cv.flip(frame, 1)
+        display = mirrored.copy()
+        draw_hand_results(display, template.gesture_results)
+        _full_frame_info_panel(display, 30.0, "joyful", "")
+
+    def pooled():
+        _, frame = system._read_frame()
+        mirrored = system._mirror(frame)
+        frame_data = result_for(mirrored)
+        display = system._draw_ui(frame_data)
+        system._frame_pool.release(display)
+        system._frame_pool.release(mirrored)
+
+    print(f"Frame allocations per iteration ({args.frames} frames, {w}x{h}, "
+          f"1 frame = {frame_bytes / 1024:.0f} KiB)")
+    for name, fn in (("per-stage arrays (reference)", allocating), ("frame buffer pool", pooled)):
+        mean_bytes, max_bytes = _allocations_per_frame(fn, args.frames)
+        print(f"  {name:<32} {mean_bytes / frame_bytes:6.2f} frames/iteration "
+              f"(max {max_bytes / frame_bytes:.2f})")
+    print(f"  pool: {system._frame_pool.allocations} buffers allocated, {system._frame_pool.free} free")
+    source.release()
+
+
+def bench_detect_concurrency(args: argparse.Namespace) -> None:
+    """Per-frame face + hand detection latency, sequential vs on two threads."""
+    from concurrent.futures import ThreadPoolExecutor
+    from core.config import VisionConfig
+    from senses.vision_face import FaceEmotionDetector
+    from senses.vision_hands import HandGestureDetector
+
+    if args.input:
+        frames = list(_iter_frames(args.input, args.limit))
+    else:
+        rng = np.random.default_rng(0)
+        frames = [rng.integers(0, 256, (540, 960, 3), dtype=np.uint8) for _ in range(min(args.limit, 30))]
+    if not frames:
+        print(f"No frames read from {args.input}")
+        return
+    h, w = frames[0].shape[:2]
+
+    config = VisionConfig(face_detector_backend=args.backend)
+    face_detector = FaceEmotionDetector(config)
+    hand_detector = HandGestureDetector(config)
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="detect")
+
+    def timed(fn, frame):
+        start = time.perf_counter()
+        fn(frame)
+        return time.perf_counter() - start
+
+    def run(concurrent: bool) -> Tuple[float, float, float]:
+        face_s = hands_s = 0.0
+        start = time.perf_counter()
+        for frame in frames:
+            if concurrent:
+                face = pool.submit(timed, face_detector.detect, frame)
+                hands = pool.submit(timed, hand_detector.detect_all, frame)
+                face_s += face.result()
+                hands_s += hands.result()
+            else:
+                face_s += timed(face_detector.detect, frame)
+                hands_s += timed(hand_detector.detect_all, frame)
+        n = len(frames)
+        return (time.perf_counter() - start) / n * 1e6, face_s / n * 1e6, hands_s / n * 1e6
+
+    run(False)  # Warm up models and trackers
+    print(f"Face + hand detection ({len(frames)} frames, {w}x{h}, {args.backend} faces)")
+    baseline = 0.0
+    for concurrent in (False, True):
+        per_frame, face_us, hands_us = run(concurrent)
+        baseline = baseline or per_frame
+        _report("concurrent (2 threads)" if concurrent else "sequential", per_frame, baseline)
+        print(f"      face {face_us / 1000:.1f} ms, hands {hands_us / 1000:.1f} ms")
+
+    pool.shutdown()
+    hand_detector.close()
+
+
+def bench_pipeline(args: argparse.Namespace) -> None:
+    """End-to-end frames/sec and per-stage cost of EmpathicSystem over a replayed input."""
+    from core.config import EmpathicConfig
+    from main import EmpathicSystem
+    from senses.frame_sources import create_frame_source
+
+    config = EmpathicConfig()
+    config.vision.face_detector_backend = args.backend
+    config.vision.concurrent_detection = args.concurrent
+    config.vision.frame_budget_ms = args.budget
+    config.headless = args.headless
+
+    source = create_frame_source(args.input, config.vision, realtime=False)
+    if not source.open():
+        print(f"Could not open {source}")
+        return
+
+    system = EmpathicSystem(config)  # Audio engine is created but never started
+    stages = ("capture", "mirror", "face", "hands", "detect", "state", "draw", "total")
+    times: Dict[str, List[float]] = {stage: [] for stage in stages}
+
+    frames = 0
+    wall_start = 0.0
+    while frames < args.warmup + args.limit:
+        if frames == args.warmup:
+            wall_start = time.perf_counter()  # Models and trackers are warm from here on
+        start = time.perf_counter()
+        ret, frame = source.read()
+        read_done = time.perf_counter()
+        if not ret:
+            break
+        mirrored = system._mirror(frame)
+        mirror_done = time.perf_counter()
+        frame_data = system._analyze_frame(mirrored)
+        analyze_done = time.perf_counter()
+        if not args.headless:
+            system._frame_pool.release(system._draw_ui(frame_data))
+        end = time.perf_counter()
+        system._frame_pool.release(mirrored)
+
+        frames += 1
+        if frames <= args.warmup:
+            continue
+        t = frame_data.timings
+        times["capture"].append((read_done - start) * 1000)
+        times["mirror"].append((mirror_done - read_done) * 1000)
+        times["face"].append(t.face_ms)
+        times["hands"].append(t.hands_ms)
+        times["detect"].append(t.detect_ms)
+        times["state"].append(t.state_ms)
+        times["draw"].append((end - analyze_done) * 1000)
+        times["total"].append((end - start) * 1000)
+
+    wall_s = time.perf_counter() - wall_start
+    measured = len(times["total"])
+    scheduler = system._scheduler
+    source.release()
+    system.cleanup()
+    if measured == 0:
+        print(f"Not enough frames in {source} (warmup {args.warmup})")
+        return
+
+    mode = "concurrent" if args.concurrent else "sequential"
+    if scheduler is not None:
+        mode += f", {args.budget:.0f} ms budget"
+    print(f"Pipeline ({measured} frames after {args.warmup} warmup, {source}, "
+          f"{args.backend} faces, {mode}{', headless' if args.headless else ''})")
+    print(f"  {'stage':<10} {'mean ms':>9} {'p95 ms':>9} {'share':>7}")
+    total_mean = float(np.mean(times["total"]))
+    for stage in stages:
+        values = np.array(times[stage])
+        # Face and hands are parts of detect (overlapping when concurrent)
+        name = f"  {stage}" if stage in ("face", "hands") else stage
+        print(f"  {name:<10} {values.mean():9.2f} {np.percentile(values, 95):9.2f} "
+              f"{values.mean() / total_mean:7.1%}")
+    print(f"  end to end: {measured / wall_s:.1f} frames/s")
+    if scheduler is not None:
+        print(f"  scheduler: {scheduler.summary()}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Empathic-01 benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    emotion_post = subparsers.add_parser(
+        "emotion-post", help="Emotion score smoothing/stabilization cost per frame"
+    )
+    emotion_post.add_argument("--iterations", type=int, default=100_000)
+    emotion_post.set_defaults(func=bench_emotion_post)
+
+    emotion_model = subparsers.add_parser(
+        "emotion-model", help="DeepFace.analyze vs direct emotion model latency per crop"
+    )
+    emotion_model.add_argument("--iterations", type=int, default=200)
+    emotion_model.add_argument("--image", help="Image containing a centered face (default: noise)")
+    emotion_model.set_defaults(func=bench_emotion_model)
+
+    face_detectors = subparsers.add_parser(
+        "face-detectors", help="Latency and detection agreement of face detector backends"
+    )
+    face_detectors.add_argument("--input", required=True, help="Image directory or video file")
+    face_detectors.add_argument("--limit", type=int, default=500, help="Maximum frames to read")
+    face_detectors.add_argument("--backends", default="haar,dnn_ssd,yunet")
+    face_detectors.add_argument("--reference", default="yunet", help="Backend treated as ground truth")
+    face_detectors.add_argument("--iou", type=float, default=0.5, help="IoU for two boxes to agree")
+    face_detectors.set_defaults(func=bench_face_detectors)
+
+    face_alloc = subparsers.add_parser(
+        "face-alloc", help="tracemalloc allocation churn per frame for face preprocessing"
+    )
+    face_alloc.add_argument("--frames", type=int, default=100)
+    face_alloc.set_defaults(func=bench_face_alloc)
+
+    gesture_classify = subparsers.add_parser(
+        "gesture-classify", help="Rule-based hand gesture classification cost per frame"
+    )
+    gesture_classify.add_argument("--iterations", type=int, default=20_000)
+    gesture_classify.set_defaults(func=bench_gesture_classify)
+
+    gesture_backends = subparsers.add_parser(
+        "gesture-backends", help="Rule-based vs keypoint classifier latency per hand"
+    )
+    gesture_backends.add_argument("--iterations", type=int, default=5_000)
+    gesture_backends.set_defaults(func=bench_gesture_backends)
+
+    gesture_motion = subparsers.add_parser(
+        "gesture-motion", help="Point history and motion gesture classifier cost per frame"
+    )
+    gesture_motion.add_argument("--iterations", type=int, default=20_000)
+    gesture_motion.set_defaults(func=bench_gesture_motion)
+
+    hand_scale = subparsers.add_parser(
+        "hand-scale", help="Hand stage latency at several MediaPipe inference scales"
+    )
+    hand_scale.add_argument("--input", help="Image directory or video file (default: noise frames)")
+    hand_scale.add_argument("--limit", type=int, default=300, help="Maximum frames to read")
+    hand_scale.add_argument("--scales", default="1.0,0.75,0.5,0.35")
+    hand_scale.add_argument("--roi", action="store_true", help="Enable ROI tracking")
+    hand_scale.set_defaults(func=bench_hand_scale)
+
+    overlay = subparsers.add_parser(
+        "overlay", help="Hand and face overlay rendering cost per frame"
+    )
+    overlay.add_argument("--iterations", type=int, default=2_000)
+    overlay.add_argument("--fps", type=float, default=30.0, help="Frame rate for the budget share")
+    overlay.set_defaults(func=bench_overlay)
+
+    headless = subparsers.add_parser(
+        "headless", help="UI rendering + display cost saved per frame by headless mode"
+    )
+    headless.add_argument("--iterations", type=int, default=1_000)
+    headless.add_argument("--fps", type=float, default=30.0, help="Frame rate for the budget share")
+    headless.add_argument("--publish", default="127.0.0.1:5005", help="UDP destination for the publish cost")
+    headless.set_defaults(func=bench_headless)
+
+    frame_alloc = subparsers.add_parser(
+        "frame-alloc", help="tracemalloc full-frame allocations per loop iteration (frame buffer pool)"
+    )
+    frame_alloc.add_argument("--frames", type=int, default=100)
+    frame_alloc.set_defaults(func=bench_frame_alloc)
+
+    detect_concurrency = subparsers.add_parser(
+        "detect-concurrency", help="Face + hand detection latency, sequential vs concurrent"
+    )
+    detect_concurrency.add_argument("--input", help="Image directory or video file (default: noise frames)")
+    detect_concurrency.add_argument("--limit", type=int, default=300, help="Maximum frames to read")
+    detect_concurrency.add_argument("--backend", default="haar", help="Face detector backend")
+    detect_concurrency.set_defaults(func=bench_detect_concurrency)
+
+    pipeline = subparsers.add_parser(
+        "pipeline", help="End-to-end fps and per-stage cost over a video, image directory or synthetic input"
+    )
+    pipeline.add_argument("--input", default="synthetic",
+                          help="Video file, image directory or synthetic[:frames] (default: synthetic)")
+    pipeline.add_argument("--limit", type=int, default=300, help="Frames to measure")
+    pipeline.add_argument("--warmup", type=int, default=10, help="Frames to run before measuring")
+    pipeline.add_argument("--backend", default="haar", help="Face detector backend")
+    pipeline.add_argument("--concurrent", action="store_true", help="Face and hand detection on two threads")
+    pipeline.add_argument("--headless", action="store_true", help="Skip UI drawing")
+    pipeline.add_argument("--budget", type=float, default=0.0,
+                          help="Detector scheduler frame budget in ms (default: off)")
+    pipeline.set_defaults(func=bench_pipeline)
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
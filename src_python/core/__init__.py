@@ -4,6 +4,7 @@ Core Module - Configuration and State Management
 This module contains the core logic:
 - config: All configuration and constants
 - state_machine: Emotion-gesture bridge and mood management
+- scheduler: Latency-budget detector scheduling
 """
 
 from .config import (
@@ -30,6 +31,8 @@ from .state_machine import (
     EmpatheticOrchestrator,
 )
 
+from .scheduler import StageSchedule, DetectorScheduler
+
 __all__ = [
     # Config
     "EmotionLabel",
@@ -51,4 +54,7 @@ __all__ = [
     "MoodHistory",
     "EmpatheticStateMachine",
     "EmpatheticOrchestrator",
+    # Scheduler
+    "StageSchedule",
+    "DetectorScheduler",
 ]
@@ -33,9 +33,19 @@ class GestureLabel(Enum):
     CLOSED_FIST = "closed_fist"   # None/Neutral
     OK_SIGN = "ok_sign"           # OK gesture
     PEACE_SIGN = "peace_sign"     # Peace/Victory gesture
+    TWO_HAND_HEART = "two_hand_heart"  # Two-handed heart, stronger affection
     NONE = "none"                 # No gesture detected
 
 
+class MotionGestureLabel(Enum):
+    """Dynamic gestures traced by the index finger tip."""
+    STOP = "stop"                 # Finger held still
+    CLOCKWISE = "clockwise"       # Circle, clockwise
+    COUNTER_CLOCKWISE = "counter_clockwise"  # Circle, counter-clockwise
+    MOVE = "move"                 # Swipe / free movement
+    NONE = "none"                 # Not pointing or not recognized
+
+
 class MoodState(Enum):
     """Overall mood states for the system."""
     CALM = "calm"
@@ -55,18 +65,46 @@ class VisionConfig:
     frame_width: int = 960
     frame_height: int = 540
     frame_rate: int = 30
+    threaded_capture: bool = True  # Read the camera on a background thread, keep only the newest frame
+    capture_ring_size: int = 3  # Preallocated frames in the capture ring (min 3)
+    frame_pool_size: int = 4  # Preallocated mirrored/display frames; grows if the pipeline holds more
+    input_source: str = ""  # Video file, image directory or "synthetic[:frames]" instead of the camera
+    replay_realtime: bool = True  # Replay input_source at its frame rate; False = as fast as possible
 
     # MediaPipe Hands settings
     max_num_hands: int = 2
     min_detection_confidence: float = 0.7
     min_tracking_confidence: float = 0.5
     static_image_mode: bool = False
+    hand_track_max_missed_frames: int = 5  # Drop a hand's smoothing state after this many frames unseen
+    gesture_classifier: str = "rules"  # "rules" or "keypoint" (bundled keypoint_classifier.tflite)
+    motion_gesture_classifier: bool = True  # Classify index tip motion (point_history_classifier.tflite)
+    hand_inference_scale: float = 1.0  # Downscale the MediaPipe input (e.g. 0.5 = half resolution)
+    hand_roi_tracking: bool = False  # While tracking, run MediaPipe on a padded crop around the hands
+    hand_roi_padding: float = 0.5  # ROI padding, as a fraction of the hands' box size
+    hand_roi_full_frame_interval: int = 15  # Full-frame pass every N frames to pick up new hands
 
     # Face detection settings
+    face_detector_backend: str = "haar"  # "haar", "dnn_ssd" or "yunet"
     face_detection_confidence: float = 0.5
+    max_num_faces: int = 4
+    face_track_max_missed_frames: int = 5  # Drop a face track after this many frames unseen
+    face_track_iou_threshold: float = 0.3  # Min IoU to match a detection to a track
+
+    # Face emotion settings
+    emotion_inference_mode: str = "direct"  # "direct" (model predict) or "analyze" (DeepFace.analyze)
+    emotion_max_batch_size: int = 4  # Faces per emotion model call
+    emotion_change_threshold: float = 3.0  # Mean abs gray-level change to re-run the model (0 = always)
+    emotion_max_reuse_frames: int = 15  # Re-run the model at least every N frames
+    emotion_cascade: bool = False  # Cheap TFLite CNN first, DeepFace only when unsure
+    emotion_cascade_threshold: float = 0.7  # Cheap tier confidence needed to skip DeepFace
+    emotion_cheap_model_path: str = ""  # TFLite model, FER2013 label order; empty = bundled mini-Xception
 
     # Inference throttling
-    inference_interval_ms: int = 50  # ~20 FPS for detection
+    inference_interval_ms: int = 50  # Scheduler runs face detection at most this often (~20 FPS)
+    concurrent_detection: bool = False  # Run face and hand detection on two threads per frame
+    frame_budget_ms: float = 0.0  # Detector scheduler budget per frame (e.g. 33 = 30 FPS); 0 = run all every frame
+    detector_max_age_ms: int = 500  # Scheduler refreshes each detector's result at least this often
 
     # Smoothing
     landmark_smoothing_alpha: float = 0.4  # EMA smoothing factor
@@ -142,6 +180,16 @@ EMOTION_GESTURE_REACTIONS: Dict[tuple, Dict] = {
         "mood": MoodState.JOYFUL,
         "message": "Spreading joy together!",
     },
+    (EmotionLabel.SAD, GestureLabel.TWO_HAND_HEART): {
+        "sfx": "compassionate_chime.wav",
+        "mood": MoodState.EMPATHETIC,
+        "message": "Sending that love right back to you.",
+    },
+    (EmotionLabel.HAPPY, GestureLabel.TWO_HAND_HEART): {
+        "sfx": "love_sparkle.wav",
+        "mood": MoodState.JOYFUL,
+        "message": "Right back at you, with both hands!",
+    },
     (EmotionLabel.SURPRISE, GestureLabel.OPEN_PALM): {
         "sfx": "discovery_chime.wav",
         "mood": MoodState.JOYFUL,
@@ -190,6 +238,11 @@ class EmpathicConfig:
     show_landmarks: bool = True
     log_detections: bool = False
 
+    # Pipeline
+    staged_pipeline: bool = False  # Capture, face and hand detection in separate processes (staged_pipeline.py)
+    headless: bool = False  # No window, overlays or keyboard; results via callbacks / publisher only
+    publish_address: str = ""  # "host:port" to send per-frame results as UDP/JSON; empty = off
+
     @classmethod
     def from_env(cls) -> "EmpathicConfig":
         """Create config from environment variables."""
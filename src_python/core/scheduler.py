@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Detector Scheduler for Empathic-01 System
+
+Decides per frame which detectors run, so the loop holds a target frame
+rate on CPUs too slow to run every detector on every frame. Skipped
+detectors' last results are reused by the caller.
+
+Each frame earns `budget_ms` minus the measured non-detector work (UI
+drawing) as credit; a detector runs when the credit covers its measured
+latency (an EMA). Cheap detectors therefore run every frame and expensive
+ones every few frames, and the average frame time stays near the budget.
+A detector given a `min_interval_ms` runs no more often than that, and
+one whose result is older than `max_age_ms` runs regardless of the budget.
+
+Intervals and ages are measured on a frame clock that advances by the
+real time between frames, but at least `budget_ms`: a frame that came
+early (unpaced replay) counts as a frame at the target rate, so replays
+schedule the same way the live loop would.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+import time
+
+
+@dataclass
+class StageSchedule:
+    """Scheduling state and counters for one detector."""
+    latency_ms: float = 0.0  # EMA of measured latency; 0 until first measured
+    min_interval_ms: float = 0.0  # Minimum frame clock time between runs
+    last_run_ms: float = float("-inf")  # Frame clock time of the last run
+    runs: int = 0
+    skips: int = 0
+
+
+class DetectorScheduler:
+    """
+    Latency-budget scheduler for per-frame detector stages.
+
+    Usage per frame: plan() -> run the returned stages -> record() each
+    one's latency; record_overhead() with the frame's non-detector work.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[str],
+        budget_ms: float,
+        min_interval_ms: Optional[Dict[str, float]] = None,
+        max_age_ms: float = 500.0,
+        concurrent: bool = False,
+        smoothing: float = 0.2
+    ):
+        """
+        Args:
+            stages: Detector names, highest priority first
+            budget_ms: Target time per frame (e.g. 33 for 30 FPS)
+            min_interval_ms: Minimum time between runs, per detector (the
+                others may run every frame)
+            max_age_ms: Run a detector whose result is this old even over budget
+            concurrent: Detectors run in parallel, so a frame costs the slowest
+                one instead of the sum
+            smoothing: EMA factor for measured latencies
+        """
+        min_interval_ms = min_interval_ms or {}
+        self.stages: Dict[str, StageSchedule] = {
+            stage: StageSchedule(min_interval_ms=min_interval_ms.get(stage, 0.0)) for stage in stages
+        }
+        self.budget_ms = budget_ms
+        self.max_age_ms = max_age_ms
+        self.concurrent = concurrent
+        self.smoothing = smoothing
+        self.overhead_ms = 0.0  # EMA of non-detector work per frame
+        self.frames = 0
+        self._credit_ms = 0.0
+        self._clock_ms = 0.0
+        self._last_plan: Optional[float] = None
+
+    def plan(self) -> List[str]:
+        """
+        Pick the detectors to run on this frame.
+
+        Returns:
+            Stage names to run, in priority order (may be empty)
+        """
+        now = time.perf_counter()
+        if self._last_plan is not None:
+            self._clock_ms += max(self.budget_ms, (now - self._last_plan) * 1000)
+        self._last_plan = now
+        now_ms = self._clock_ms
+        self.frames += 1
+
+        # Bank this frame's slack; cap it so saved-up credit pays for at most
+        # one run of the most expensive detector on top of a normal frame
+        cap = self.budget_ms + max(s.latency_ms for s in self.stages.values())
+        self._credit_ms = min(cap, self._credit_ms + self.budget_ms - self.overhead_ms)
+
+        # Stale results first, then priority order
+        order = sorted(
+            self.stages.items(),
+            key=lambda item: now_ms - item[1].last_run_ms < self.max_age_ms,
+        )
+        chosen: List[str] = []
+        cost_ms = 0.0
+        for stage, schedule in order:
+            age_ms = now_ms - schedule.last_run_ms
+            if age_ms < schedule.min_interval_ms:
+                schedule.skips += 1
+                continue
+            new_cost_ms = max(cost_ms, schedule.latency_ms) if self.concurrent else cost_ms + schedule.latency_ms
+            # Unmeasured detectors (latency 0) always fit, which measures them
+            if age_ms >= self.max_age_ms or new_cost_ms <= self._credit_ms:
+                chosen.append(stage)
+                cost_ms = new_cost_ms
+            else:
+                schedule.skips += 1
+
+        self._credit_ms -= cost_ms
+        return [stage for stage in self.stages if stage in chosen]
+
+    def record(self, stage: str, latency_ms: float) -> None:
+        """Record that a planned detector ran on this frame and how long it took."""
+        schedule = self.stages[stage]
+        schedule.last_run_ms = self._clock_ms
+        schedule.runs += 1
+        if schedule.latency_ms == 0.0:
+            schedule.latency_ms = latency_ms
+        else:
+            schedule.latency_ms += self.smoothing * (latency_ms - schedule.latency_ms)
+
+    def record_overhead(self, elapsed_ms: float) -> None:
+        """Record the frame's non-detector work (drawing, display)."""
+        self.overhead_ms += self.smoothing * (elapsed_ms - self.overhead_ms)
+
+    def summary(self) -> str:
+        """One-line run counts and latencies, for logs."""
+        return ", ".join(
+            f"{stage} ran {s.runs}/{self.frames} frames ({s.latency_ms:.1f} ms)"
+            for stage, s in self.stages.items()
+        )
@@ -187,7 +187,7 @@ class EmpatheticStateMachine:
                 return EMOTION_GESTURE_REACTIONS[combo]["mood"]
 
         # Gesture-based mood modifications
-        if gesture == GestureLabel.HEART_HAND:
+        if gesture in (GestureLabel.HEART_HAND, GestureLabel.TWO_HAND_HEART):
             return MoodState.SUPPORTIVE
         elif gesture == GestureLabel.THUMB_UP:
             if emotion == EmotionLabel.HAPPY:
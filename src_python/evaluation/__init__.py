@@ -0,0 +1,32 @@
+"""
+Evaluation Module - Offline Gesture Evaluation
+
+Camera-free evaluation of the hand gesture pipeline:
+- gesture_data: Synthetic canonical poses and .npz landmark sequences
+- gesture_eval: Throughput and per-label agreement (rules vs learned)
+- gesture_reference: Original per-landmark gesture rules (baseline)
+"""
+
+from .gesture_data import (
+    GestureSequence,
+    canonical_pose,
+    load_sequences,
+    save_sequences,
+    synthetic_dataset,
+    synthetic_hand,
+    synthetic_sequence,
+)
+from .gesture_reference import HandLandmark, ReferenceGestureRules, to_landmark_list
+
+__all__ = [
+    "GestureSequence",
+    "canonical_pose",
+    "load_sequences",
+    "save_sequences",
+    "synthetic_dataset",
+    "synthetic_hand",
+    "synthetic_sequence",
+    "HandLandmark",
+    "ReferenceGestureRules",
+    "to_landmark_list",
+]
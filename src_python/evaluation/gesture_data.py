@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Gesture Evaluation Data for Empathic-01 System
+
+Landmark sequences for offline gesture evaluation:
+- Synthetic generator with a canonical pose for every GestureLabel
+- Compact .npz storage for recorded or generated sequences
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import GestureLabel
+
+
+# Label order used for the uint8 label codes in .npz files
+GESTURE_ORDER: Tuple[GestureLabel, ...] = tuple(GestureLabel)
+GESTURE_CODE: Dict[GestureLabel, int] = {label: i for i, label in enumerate(GESTURE_ORDER)}
+
+
+@dataclass
+class GestureSequence:
+    """Landmark frames of one or two hands with the expected gesture per frame."""
+    name: str
+    landmarks: np.ndarray  # (frames, hands, 21, 3) float32, normalized
+    labels: np.ndarray  # (frames,) uint8 codes into GESTURE_ORDER
+    image_size: Tuple[int, int] = (960, 540)  # width, height the landmarks refer to
+
+    @property
+    def num_hands(self) -> int:
+        return self.landmarks.shape[1]
+
+    def expected(self, frame: int) -> GestureLabel:
+        """Expected gesture for a frame."""
+        return GESTURE_ORDER[self.labels[frame]]
+
+
+def save_sequences(path: Path, sequences: List[GestureSequence]) -> None:
+    """
+    Save sequences to a compressed .npz file.
+
+    Landmarks are stored as float16 (plenty for normalized coordinates),
+    labels as uint8 codes with the label names stored alongside.
+    """
+    arrays = {
+        "names": np.array([seq.name for seq in sequences]),
+        "image_sizes": np.array([seq.image_size for seq in sequences], dtype=np.int32),
+        "label_names": np.array([label.value for label in GESTURE_ORDER]),
+    }
+    for i, seq in enumerate(sequences):
+        arrays[f"landmarks_{i}"] = seq.landmarks.astype(np.float16)
+        arrays[f"labels_{i}"] = seq.labels.astype(np.uint8)
+    np.savez_compressed(path, **arrays)
+
+
+def load_sequences(path: Path) -> List[GestureSequence]:
+    """Load sequences saved by save_sequences()."""
+    with np.load(path) as data:
+        # Remap codes in case GestureLabel gained members since the file was written
+        stored = [GestureLabel(value) for value in data["label_names"]]
+        remap = np.array([GESTURE_CODE[label] for label in stored], dtype=np.uint8)
+
+        sequences = []
+        for i, name in enumerate(data["names"]):
+            sequences.append(GestureSequence(
+                name=str(name),
+                landmarks=data[f"landmarks_{i}"].astype(np.float32),
+                labels=remap[data[f"labels_{i}"]],
+                image_size=tuple(int(v) for v in data["image_sizes"][i]),
+            ))
+    return sequences
+
+
+# =============================================================================
+# Synthetic hands
+# =============================================================================
+
+# Per finger: (first landmark, base xy, direction, segment lengths), right hand, palm facing camera
+HAND_CHAINS = (
+    (1, (0.44, 0.74), (-0.7, -0.7), (0.04, 0.035, 0.03)),   # Thumb
+    (5, (0.44, 0.60), (0.0, -1.0), (0.05, 0.03, 0.025)),    # Index
+    (9, (0.50, 0.59), (0.0, -1.0), (0.055, 0.035, 0.028)),  # Middle
+    (13, (0.56, 0.60), (0.0, -1.0), (0.05, 0.032, 0.025)),  # Ring
+    (17, (0.61, 0.63), (0.0, -1.0), (0.04, 0.025, 0.02)),   # Pinky
+)
+WRIST_XY = (0.5, 0.8)
+
+THUMB_TIP, INDEX_TIP = 4, 8
+
+
+def synthetic_hand(
+    bends: Tuple[float, ...],
+    thumb_direction: Optional[Tuple[float, float]] = None
+) -> np.ndarray:
+    """
+    Build a (21, 3) hand by bending each finger chain.
+
+    Args:
+        bends: Bend in degrees at each finger's two upper joints, thumb..pinky
+        thumb_direction: Override for the thumb's base direction
+
+    Returns:
+        (21, 3) float32 normalized landmarks
+    """
+    landmarks = np.zeros((21, 3), dtype=np.float32)
+    landmarks[0, :2] = WRIST_XY
+    for finger, ((first, base, direction, lengths), bend) in enumerate(zip(HAND_CHAINS, bends)):
+        if finger == 0 and thumb_direction is not None:
+            direction = thumb_direction
+        point = np.array(base)
+        d = np.array(direction) / np.hypot(*direction)
+        rad = np.radians(bend)
+        rotation = np.array([[np.cos(rad), -np.sin(rad)], [np.sin(rad), np.cos(rad)]])
+        landmarks[first, :2] = point
+        for k, length in enumerate(lengths):
+            if k > 0:
+                d = rotation @ d
+            point = point + d * length
+            landmarks[first + k + 1, :2] = point
+    return landmarks
+
+
+def _touch_thumb_to_index(landmarks: np.ndarray) -> np.ndarray:
+    """Bring the thumb tip onto the index tip (OK sign, heart)."""
+    mcp = landmarks[2, :2]
+    tip = landmarks[INDEX_TIP, :2] + (-0.005, 0.005)
+    landmarks[3, :2] = mcp + (tip - mcp) * 0.55 + (-0.01, 0.0)
+    landmarks[THUMB_TIP, :2] = tip
+    return landmarks
+
+
+def _canonical_two_hand_heart() -> np.ndarray:
+    """Two mirrored hands with index tips touching above touching thumb tips."""
+    right = synthetic_hand((60, 100, 100, 100, 100))
+    right[INDEX_TIP, :2] = (0.505, 0.45)
+    right[THUMB_TIP, :2] = (0.495, 0.62)
+    left = right.copy()
+    left[:, 0] = 1.0 - left[:, 0]
+    return np.stack([right, left])
+
+
+def canonical_pose(label: GestureLabel) -> Optional[np.ndarray]:
+    """
+    Canonical landmarks for a gesture.
+
+    Returns:
+        (hands, 21, 3) landmarks (two hands for two-hand gestures),
+        or None for labels without a pose (NONE)
+    """
+    if label == GestureLabel.OPEN_PALM:
+        hand = synthetic_hand((0, 0, 0, 0, 0))
+    elif label == GestureLabel.CLOSED_FIST:
+        hand = synthetic_hand((110, 100, 100, 100, 100))
+    elif label == GestureLabel.THUMB_UP:
+        hand = synthetic_hand((0, 100, 100, 100, 100), thumb_direction=(0.0, -1.0))
+    elif label == GestureLabel.INDEX_POINTING:
+        hand = synthetic_hand((60, 0, 100, 100, 100))
+    elif label == GestureLabel.PEACE_SIGN:
+        hand = synthetic_hand((60, 0, 0, 100, 100))
+    elif label == GestureLabel.OK_SIGN:
+        hand = _touch_thumb_to_index(synthetic_hand((40, -70, 0, 0, 0)))
+    elif label == GestureLabel.HEART_HAND:
+        hand = _touch_thumb_to_index(synthetic_hand((40, -40, 100, 100, 100)))
+    elif label == GestureLabel.TWO_HAND_HEART:
+        return _canonical_two_hand_heart()
+    else:
+        return None
+    return hand[np.newaxis]
+
+
+def synthetic_sequence(
+    label: GestureLabel,
+    frames: int,
+    rng: np.random.Generator,
+    noise: float = 0.004,
+    drift: float = 0.002,
+    image_size: Tuple[int, int] = (960, 540),
+) -> Optional[GestureSequence]:
+    """
+    A held gesture with camera-like jitter.
+
+    The canonical pose gets a random global scale and rotation, drifts
+    slowly across the frame, and every landmark gets per-frame noise.
+
+    Returns:
+        GestureSequence, or None for labels without a pose
+    """
+    pose = canonical_pose(label)
+    if pose is None:
+        return None
+
+    scale = rng.uniform(0.8, 1.2)
+    angle = np.radians(rng.uniform(-15, 15))
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    center = pose[..., :2].reshape(-1, 2).mean(axis=0)
+    base = (pose[..., :2] - center) @ rotation.T * scale + center
+
+    offsets = np.cumsum(rng.normal(0, drift, (frames, 1, 1, 2)), axis=0)
+    landmarks = np.zeros((frames, *pose.shape), dtype=np.float32)
+    landmarks[..., :2] = base + offsets + rng.normal(0, noise, (frames, *base.shape))
+
+    return GestureSequence(
+        name=f"synthetic_{label.value}",
+        landmarks=landmarks,
+        labels=np.full(frames, GESTURE_CODE[label], dtype=np.uint8),
+        image_size=image_size,
+    )
+
+
+def synthetic_dataset(
+    frames_per_label: int = 120,
+    sequences_per_label: int = 4,
+    seed: int = 0,
+    noise: float = 0.004,
+) -> List[GestureSequence]:
+    """Synthetic sequences for every gesture that has a canonical pose."""
+    rng = np.random.default_rng(seed)
+    sequences = []
+    for label in GESTURE_ORDER:
+        for _ in range(sequences_per_label):
+            seq = synthetic_sequence(label, frames_per_label, rng, noise=noise)
+            if seq is not None:
+                sequences.append(seq)
+    return sequences
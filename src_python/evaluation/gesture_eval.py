@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Offline Gesture Evaluation for Empathic-01 System
+
+Replays landmark sequences (recorded or synthetic) through the gesture
+pipeline without a camera: per-hand smoothing, classification and
+stability filtering. Reports throughput, per-label agreement with the
+expected gesture, and latency of the rule-based vs learned classifier.
+
+Usage:
+    python -m evaluation.gesture_eval run [--data recordings.npz] [--samples 1000000]
+    python -m evaluation.gesture_eval synthesize --out synthetic.npz
+    python -m evaluation.gesture_eval record --label thumb_up --out recordings.npz
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import GestureLabel, VisionConfig
+from .gesture_data import (
+    GESTURE_CODE,
+    GESTURE_ORDER,
+    GestureSequence,
+    load_sequences,
+    save_sequences,
+    synthetic_dataset,
+)
+
+
+@dataclass
+class LabelStats:
+    """Agreement counts for one expected label."""
+    frames: int = 0
+    raw_correct: int = 0  # Per-frame classifier output matches
+    stable_correct: int = 0  # Output after stability filtering matches
+    supported: bool = True  # Classifier can produce this label at all
+
+
+@dataclass
+class EvaluationResult:
+    """Outcome of one classifier over the dataset."""
+    name: str
+    hands: int
+    classify_seconds: float  # Time spent in the classifier only
+    pipeline_seconds: float  # Smoothing + classification + stability
+    per_label: Dict[GestureLabel, LabelStats]
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.pipeline_seconds if self.pipeline_seconds else 0.0
+
+    @property
+    def classify_us_per_hand(self) -> float:
+        return self.classify_seconds / self.hands * 1e6 if self.hands else 0.0
+
+
+# Classifies all hands of one frame: (n, 21, 3) landmarks -> (label, confidence) per hand
+FrameClassifier = Callable[[np.ndarray], List[Tuple[GestureLabel, float]]]
+
+
+def evaluate(
+    name: str,
+    sequences: List[GestureSequence],
+    classify_frame: FrameClassifier,
+    samples: int,
+    supported: Optional[set] = None,
+    smoothing_alpha: float = VisionConfig.landmark_smoothing_alpha,
+) -> EvaluationResult:
+    """
+    Run the gesture pipeline over the sequences until `samples` hands are processed.
+
+    Each pass over a sequence starts with fresh per-hand state. The first
+    hand's label is compared with the expected one (two-hand gestures are
+    reported on both hands).
+    """
+    from senses.vision_hands import HandTrack
+
+    per_label = {GESTURE_ORDER[code]: LabelStats() for seq in sequences for code in np.unique(seq.labels)}
+    if supported is not None:
+        for label, stats in per_label.items():
+            stats.supported = label in supported
+
+    hands = 0
+    classify_seconds = 0.0
+    start = time.perf_counter()
+    while hands < samples:
+        for seq in sequences:
+            tracks = [HandTrack(f"hand{i}", smoothing_alpha) for i in range(seq.num_hands)]
+            for frame in range(len(seq.landmarks)):
+                landmarks = np.stack([
+                    track.smooth(hand) for track, hand in zip(tracks, seq.landmarks[frame])
+                ])
+
+                classify_start = time.perf_counter()
+                gestures = classify_frame(landmarks)
+                classify_seconds += time.perf_counter() - classify_start
+
+                stable = tracks[0].stabilize(gestures[0][0])
+                for track, (gesture, _) in zip(tracks[1:], gestures[1:]):
+                    track.stabilize(gesture)
+
+                expected = GESTURE_ORDER[seq.labels[frame]]
+                stats = per_label[expected]
+                stats.frames += 1
+                stats.raw_correct += gestures[0][0] == expected
+                stats.stable_correct += stable == expected
+                hands += seq.num_hands
+            if hands >= samples:
+                break
+
+    return EvaluationResult(
+        name=name,
+        hands=hands,
+        classify_seconds=classify_seconds,
+        pipeline_seconds=time.perf_counter() - start,
+        per_label=per_label,
+    )
+
+
+def rules_frame_classifier(detector) -> FrameClassifier:
+    """Rule-based classification of a frame, as HandGestureDetector.detect_all() does it."""
+    from senses.vision_hands import HandFeatures
+
+    def classify(landmarks: np.ndarray) -> List[Tuple[GestureLabel, float]]:
+        features = HandFeatures.batch(landmarks)
+        gestures = [detector._classify_gesture(hand) for hand in features]
+        two_hand = detector._classify_two_hand_gesture(features)
+        if two_hand is not None:
+            gestures[0] = gestures[1] = two_hand
+        return gestures
+
+    return classify
+
+
+def keypoint_frame_classifier(classifier, image_size: Tuple[int, int]) -> FrameClassifier:
+    """Learned keypoint classification of a frame (all hands in one call)."""
+    def classify(landmarks: np.ndarray) -> List[Tuple[GestureLabel, float]]:
+        return classifier.classify(landmarks, image_size)
+
+    return classify
+
+
+def print_report(results: List[EvaluationResult]) -> None:
+    """Print throughput, latency and per-label agreement for each classifier."""
+    print("\nThroughput")
+    baseline = results[0].classify_us_per_hand if results else 0.0
+    for result in results:
+        speedup = f"  ({baseline / result.classify_us_per_hand:.1f}x)" if result.classify_us_per_hand else ""
+        print(f"  {result.name:<10} {result.hands_per_second:12,.0f} hands/s   "
+              f"classifier {result.classify_us_per_hand:8.2f} us/hand{speedup}")
+
+    labels = sorted(
+        {label for result in results for label in result.per_label},
+        key=GESTURE_CODE.get,
+    )
+    print("\nAgreement with expected label (raw / after stability)")
+    header = "  " + f"{'label':<16}" + "".join(f"{r.name:>22}" for r in results)
+    print(header)
+    for label in labels:
+        row = f"  {label.value:<16}"
+        for result in results:
+            stats = result.per_label.get(label)
+            if stats is None or stats.frames == 0:
+                row += f"{'-':>22}"
+            elif not stats.supported:
+                row += f"{'unsupported':>22}"
+            else:
+                raw = stats.raw_correct / stats.frames
+                stable = stats.stable_correct / stats.frames
+                row += f"{raw:>14.1%} / {stable:>5.1%}"
+        print(row)
+
+
+def _load_data(paths: List[str], noise: float) -> List[GestureSequence]:
+    """Sequences from .npz files, or the synthetic dataset when none are given."""
+    if not paths:
+        return synthetic_dataset(noise=noise)
+    sequences = []
+    for path in paths:
+        sequences.extend(load_sequences(Path(path)))
+    return sequences
+
+
+def run(args: argparse.Namespace) -> None:
+    """Evaluate the configured classifiers."""
+    from senses.vision_hands import HandGestureDetector
+
+    sequences = _load_data(args.data, args.noise)
+    if not sequences:
+        print("No sequences to evaluate")
+        return
+    frames = sum(len(seq.landmarks) for seq in sequences)
+    print(f"Gesture evaluation: {len(sequences)} sequences, {frames} frames, {args.samples:,} hand samples")
+
+    results = []
+    names = args.classifiers.split(",")
+    if "rules" in names:
+        detector = HandGestureDetector(VisionConfig(motion_gesture_classifier=False))
+        results.append(evaluate("rules", sequences, rules_frame_classifier(detector), args.samples))
+        detector.close()
+
+    if "keypoint" in names:
+        from senses.gesture_classifiers import KeypointClassifier
+        try:
+            classifier = KeypointClassifier()
+        except (ImportError, FileNotFoundError) as e:
+            print(f"Skipping keypoint classifier: {e}")
+        else:
+            results.append(evaluate(
+                "keypoint",
+                sequences,
+                keypoint_frame_classifier(classifier, sequences[0].image_size),
+                args.samples,
+                supported=set(classifier.labels),
+            ))
+
+    print_report(results)
+
+
+def synthesize(args: argparse.Namespace) -> None:
+    """Write the synthetic dataset to .npz."""
+    sequences = synthetic_dataset(args.frames, args.sequences, args.seed, args.noise)
+    save_sequences(Path(args.out), sequences)
+    print(f"Wrote {len(sequences)} sequences to {args.out}")
+
+
+def record(args: argparse.Namespace) -> None:
+    """Record raw landmarks of a held gesture from the camera and append them to .npz."""
+    import cv2 as cv
+    from senses.vision_hands import HandGestureDetector
+
+    label = GestureLabel(args.label)
+    num_hands = 2 if label == GestureLabel.TWO_HAND_HEART else 1
+
+    # Smoothing alpha 1.0 keeps landmarks raw; evaluation applies its own smoothing
+    config = VisionConfig(landmark_smoothing_alpha=1.0, motion_gesture_classifier=False)
+    detector = HandGestureDetector(config)
+    cap = cv.VideoCapture(args.camera)
+    cap.set(cv.CAP_PROP_FRAME_WIDTH, config.frame_width)
+    cap.set(cv.CAP_PROP_FRAME_HEIGHT, config.frame_height)
+
+    frames = []
+    image_size = (config.frame_width, config.frame_height)
+    print(f"Hold '{label.value}' with {num_hands} hand(s); recording {args.frames} frames...")
+    try:
+        while len(frames) < args.frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame = cv.flip(frame, 1)
+            image_size = (frame.shape[1], frame.shape[0])
+            results = detector.detect_all(frame)
+            if len(results) >= num_hands:
+                frames.append(np.stack([r.landmarks for r in results[:num_hands]]))
+    finally:
+        cap.release()
+        detector.close()
+
+    if not frames:
+        print("No frames recorded")
+        return
+
+    out = Path(args.out)
+    sequences = load_sequences(out) if out.exists() else []
+    sequences.append(GestureSequence(
+        name=f"recorded_{label.value}_{len(sequences)}",
+        landmarks=np.stack(frames),
+        labels=np.full(len(frames), GESTURE_CODE[label], dtype=np.uint8),
+        image_size=image_size,
+    ))
+    save_sequences(out, sequences)
+    print(f"Saved {len(frames)} frames to {out} ({len(sequences)} sequences)")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Empathic-01 offline gesture evaluation")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Evaluate classifiers over landmark sequences")
+    run_parser.add_argument("--data", nargs="*", default=[], help=".npz files (default: synthetic)")
+    run_parser.add_argument("--samples", type=int, default=200_000, help="Hands to process per classifier")
+    run_parser.add_argument("--classifiers", default="rules,keypoint")
+    run_parser.add_argument("--noise", type=float, default=0.004, help="Synthetic landmark noise")
+    run_parser.set_defaults(func=run)
+
+    synth_parser = subparsers.add_parser("synthesize", help="Save the synthetic dataset")
+    synth_parser.add_argument("--out", required=True)
+    synth_parser.add_argument("--frames", type=int, default=120, help="Frames per sequence")
+    synth_parser.add_argument("--sequences", type=int, default=4, help="Sequences per label")
+    synth_parser.add_argument("--seed", type=int, default=0)
+    synth_parser.add_argument("--noise", type=float, default=0.004)
+    synth_parser.set_defaults(func=synthesize)
+
+    record_parser = subparsers.add_parser("record", help="Record a labeled sequence from the camera")
+    record_parser.add_argument("--label", required=True, choices=[g.value for g in GestureLabel])
+    record_parser.add_argument("--out", required=True)
+    record_parser.add_argument("--frames", type=int, default=150)
+    record_parser.add_argument("--camera", type=int, default=0)
+    record_parser.set_defaults(func=record)
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
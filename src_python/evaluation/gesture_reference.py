@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Reference Gesture Rules for Empathic-01 System
+
+The original per-landmark implementation of the single-hand gesture rules:
+landmarks as a list of point objects, every angle and distance computed
+on its own, finger states recomputed by each rule. Only unused locals were
+dropped. Kept as the baseline that the vectorized HandFeatures path is
+timed and checked against; not used at runtime.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+import math
+
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import GestureLabel
+
+
+@dataclass
+class HandLandmark:
+    """A single hand landmark point."""
+    x: float
+    y: float
+    z: float = 0.0
+
+
+def to_landmark_list(landmarks: np.ndarray) -> List[HandLandmark]:
+    """Convert a (21, 3) landmark array to the original list of points."""
+    return [HandLandmark(float(x), float(y), float(z)) for x, y, z in landmarks]
+
+
+class ReferenceGestureRules:
+    """Original rule-based single-hand classifier, one landmark at a time."""
+
+    WRIST = 0
+    THUMB_CMC, THUMB_MCP, THUMB_IP, THUMB_TIP = 1, 2, 3, 4
+    INDEX_MCP, INDEX_PIP, INDEX_DIP, INDEX_TIP = 5, 6, 7, 8
+    MIDDLE_MCP, MIDDLE_PIP, MIDDLE_DIP, MIDDLE_TIP = 9, 10, 11, 12
+    RING_MCP, RING_PIP, RING_DIP, RING_TIP = 13, 14, 15, 16
+    PINKY_MCP, PINKY_PIP, PINKY_DIP, PINKY_TIP = 17, 18, 19, 20
+
+    def _distance(self, p1: HandLandmark, p2: HandLandmark) -> float:
+        """Calculate Euclidean distance between two landmarks."""
+        return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
+
+    def _angle(self, a: HandLandmark, b: HandLandmark, c: HandLandmark) -> float:
+        """Calculate angle at point b formed by points a-b-c (in degrees)."""
+        ab = np.array([a.x - b.x, a.y - b.y])
+        cb = np.array([c.x - b.x, c.y - b.y])
+
+        dot = np.dot(ab, cb)
+        cross = ab[0] * cb[1] - ab[1] * cb[0]
+
+        return abs(math.atan2(cross, dot) * (180 / math.pi))
+
+    def angles(self, landmarks: List[HandLandmark]) -> List[float]:
+        """Joint angles in the order of vision_hands.ANGLE_TRIPLETS."""
+        triplets = [
+            (self.THUMB_CMC, self.THUMB_MCP, self.THUMB_IP),
+            (self.INDEX_MCP, self.INDEX_PIP, self.INDEX_DIP), (self.INDEX_PIP, self.INDEX_DIP, self.INDEX_TIP),
+            (self.MIDDLE_MCP, self.MIDDLE_PIP, self.MIDDLE_DIP), (self.MIDDLE_PIP, self.MIDDLE_DIP, self.MIDDLE_TIP),
+            (self.RING_MCP, self.RING_PIP, self.RING_DIP), (self.RING_PIP, self.RING_DIP, self.RING_TIP),
+            (self.PINKY_MCP, self.PINKY_PIP, self.PINKY_DIP), (self.PINKY_PIP, self.PINKY_DIP, self.PINKY_TIP),
+        ]
+        return [self._angle(landmarks[a], landmarks[b], landmarks[c]) for a, b, c in triplets]
+
+    def distances(self, landmarks: List[HandLandmark]) -> List[float]:
+        """Key distances in the order of vision_hands.DISTANCE_PAIRS."""
+        pairs = [
+            (self.THUMB_TIP, self.INDEX_MCP),
+            (self.INDEX_MCP, self.PINKY_MCP),
+            (self.THUMB_TIP, self.INDEX_TIP),
+            (self.WRIST, self.MIDDLE_MCP),
+        ]
+        return [self._distance(landmarks[i], landmarks[j]) for i, j in pairs]
+
+    def _is_finger_extended(
+        self,
+        landmarks: List[HandLandmark],
+        mcp: int,
+        pip: int,
+        dip: int,
+        tip: int
+    ) -> bool:
+        """
+        Check if a finger is extended using angle-based detection.
+        A finger is extended if both joints are relatively straight.
+        """
+        pip_angle = self._angle(landmarks[mcp], landmarks[pip], landmarks[dip])
+        dip_angle = self._angle(landmarks[pip], landmarks[dip], landmarks[tip])
+
+        # Extended = both joints are straight (angle > 150 degrees)
+        return pip_angle > 150 and dip_angle > 150
+
+    def _is_finger_curled(
+        self,
+        landmarks: List[HandLandmark],
+        mcp: int,
+        pip: int,
+        dip: int,
+        tip: int
+    ) -> bool:
+        """Check if a finger is curled (bent inward)."""
+        pip_angle = self._angle(landmarks[mcp], landmarks[pip], landmarks[dip])
+        dip_angle = self._angle(landmarks[pip], landmarks[dip], landmarks[tip])
+
+        # Curled = at least one joint is bent (angle < 130 degrees)
+        return pip_angle < 130 or dip_angle < 130
+
+    def _is_thumb_extended(self, landmarks: List[HandLandmark]) -> bool:
+        """Check if thumb is extended using angle and position."""
+        thumb_tip = landmarks[self.THUMB_TIP]
+        thumb_ip = landmarks[self.THUMB_IP]
+        thumb_mcp = landmarks[self.THUMB_MCP]
+        index_mcp = landmarks[self.INDEX_MCP]
+
+        # Check thumb angle
+        thumb_angle = self._angle(
+            landmarks[self.THUMB_CMC],
+            thumb_mcp,
+            thumb_ip
+        )
+
+        # Check if thumb tip is far from palm
+        thumb_to_index = self._distance(thumb_tip, index_mcp)
+        palm_width = self._distance(landmarks[self.INDEX_MCP], landmarks[self.PINKY_MCP])
+
+        return thumb_angle > 120 and thumb_to_index > palm_width * 0.6
+
+    def _is_thumb_up_gesture(self, landmarks: List[HandLandmark]) -> bool:
+        """
+        Detect thumb up gesture.
+        Thumb extended upward, all other fingers curled.
+        """
+        thumb_tip = landmarks[self.THUMB_TIP]
+        thumb_mcp = landmarks[self.THUMB_MCP]
+
+        # Thumb should be above the MCP (pointing up)
+        thumb_pointing_up = thumb_tip.y < thumb_mcp.y - 0.05
+
+        # All other fingers should be curled
+        index_curled = self._is_finger_curled(landmarks, self.INDEX_MCP, self.INDEX_PIP, self.INDEX_DIP, self.INDEX_TIP)
+        middle_curled = self._is_finger_curled(landmarks, self.MIDDLE_MCP, self.MIDDLE_PIP, self.MIDDLE_DIP, self.MIDDLE_TIP)
+        ring_curled = self._is_finger_curled(landmarks, self.RING_MCP, self.RING_PIP, self.RING_DIP, self.RING_TIP)
+        pinky_curled = self._is_finger_curled(landmarks, self.PINKY_MCP, self.PINKY_PIP, self.PINKY_DIP, self.PINKY_TIP)
+
+        return thumb_pointing_up and index_curled and middle_curled and ring_curled and pinky_curled
+
+    def _is_heart_hand_gesture(self, landmarks: List[HandLandmark]) -> bool:
+        """
+        Detect heart hand gesture.
+        Thumb and index fingers form a heart shape (tips close together, curved).
+        """
+        thumb_tip = landmarks[self.THUMB_TIP]
+        index_tip = landmarks[self.INDEX_TIP]
+        index_mcp = landmarks[self.INDEX_MCP]
+
+        # Thumb and index tips should be close
+        tip_distance = self._distance(thumb_tip, index_tip)
+        palm_size = self._distance(landmarks[self.WRIST], landmarks[self.MIDDLE_MCP])
+
+        tips_close = tip_distance < palm_size * 0.3
+
+        # Index should be curved (not fully extended)
+        index_pip = landmarks[self.INDEX_PIP]
+        index_dip = landmarks[self.INDEX_DIP]
+
+        index_angle = self._angle(index_mcp, index_pip, index_dip)
+        index_curved = 90 < index_angle < 160
+
+        # Other fingers should be curled or semi-curled
+        middle_not_extended = not self._is_finger_extended(landmarks, self.MIDDLE_MCP, self.MIDDLE_PIP, self.MIDDLE_DIP, self.MIDDLE_TIP)
+        ring_not_extended = not self._is_finger_extended(landmarks, self.RING_MCP, self.RING_PIP, self.RING_DIP, self.RING_TIP)
+
+        return tips_close and index_curved and (middle_not_extended or ring_not_extended)
+
+    def finger_states(self, landmarks: List[HandLandmark]) -> Dict[str, bool]:
+        """Get the extension state of each finger."""
+        return {
+            "thumb": self._is_thumb_extended(landmarks),
+            "index": self._is_finger_extended(landmarks, self.INDEX_MCP, self.INDEX_PIP, self.INDEX_DIP, self.INDEX_TIP),
+            "middle": self._is_finger_extended(landmarks, self.MIDDLE_MCP, self.MIDDLE_PIP, self.MIDDLE_DIP, self.MIDDLE_TIP),
+            "ring": self._is_finger_extended(landmarks, self.RING_MCP, self.RING_PIP, self.RING_DIP, self.RING_TIP),
+            "pinky": self._is_finger_extended(landmarks, self.PINKY_MCP, self.PINKY_PIP, self.PINKY_DIP, self.PINKY_TIP),
+        }
+
+    def classify(self, landmarks: List[HandLandmark]) -> Tuple[GestureLabel, float]:
+        """
+        Classify hand gesture from landmarks.
+
+        Returns:
+            Tuple of (gesture label, confidence score)
+        """
+        if len(landmarks) != 21:
+            return GestureLabel.NONE, 0.0
+
+        finger_states = self.finger_states(landmarks)
+        extended_count = sum(finger_states.values())
+
+        # 1. Thumb Up - thumb extended up, others curled
+        if self._is_thumb_up_gesture(landmarks):
+            return GestureLabel.THUMB_UP, 0.92
+
+        # 2. Heart Hand - thumb and index forming heart
+        if self._is_heart_hand_gesture(landmarks):
+            return GestureLabel.HEART_HAND, 0.88
+
+        # 3. OK Sign - thumb and index tips touching, others extended
+        thumb_index_dist = self._distance(landmarks[self.THUMB_TIP], landmarks[self.INDEX_TIP])
+        palm_size = self._distance(landmarks[self.WRIST], landmarks[self.MIDDLE_MCP])
+
+        if (thumb_index_dist < palm_size * 0.2 and
+            finger_states["middle"] and
+            finger_states["ring"] and
+            finger_states["pinky"]):
+            return GestureLabel.OK_SIGN, 0.90
+
+        # 4. Index Pointing - only index extended
+        if (finger_states["index"] and
+            not finger_states["middle"] and
+            not finger_states["ring"] and
+            not finger_states["pinky"]):
+            return GestureLabel.INDEX_POINTING, 0.88
+
+        # 5. Peace Sign - index and middle extended, others curled
+        if (finger_states["index"] and
+            finger_states["middle"] and
+            not finger_states["ring"] and
+            not finger_states["pinky"]):
+            return GestureLabel.PEACE_SIGN, 0.85
+
+        # 6. Open Palm - most fingers extended (4-5)
+        if extended_count >= 4:
+            return GestureLabel.OPEN_PALM, 0.80 + (extended_count - 4) * 0.05
+
+        # 7. Closed Fist - most fingers curled
+        if extended_count <= 1:
+            return GestureLabel.CLOSED_FIST, 0.82
+
+        # Default - partial gesture
+        if extended_count >= 3:
+            return GestureLabel.OPEN_PALM, 0.60
+        else:
+            return GestureLabel.CLOSED_FIST, 0.55
@@ -17,8 +17,9 @@ import argparse
 import signal
 import sys
 import time
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Union, Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import cv2 as cv
@@ -34,6 +35,7 @@ from core.config import (
     MoodState,
     DEFAULT_CONFIG,
 )
+from core.scheduler import DetectorScheduler
 from core.state_machine import (
     EmpatheticStateMachine,
     EmpatheticOrchestrator,
@@ -41,19 +43,37 @@ from core.state_machine import (
     Reaction,
 )
 from senses.vision_face import FaceEmotionDetector, EmotionResult
-from senses.vision_hands import HandGestureDetector, HandGestureResult
+from senses.vision_hands import HandGestureDetector, HandGestureResult, PointHistory, draw_hand_results
+from senses.frame_capture import ThreadedCapture
+from senses.frame_pool import FrameBufferPool
+from senses.frame_sources import FrameSource, create_frame_source
+from overlay import InfoPanelCompositor, PANEL_ORIGIN, PANEL_SIZE
+from result_publisher import UdpResultPublisher, frame_data_to_dict
 from senses.audio_output import MoodAudioEngine, create_audio_engine
 
 
+@dataclass
+class StageTimings:
+    """Wall time of each per-frame stage, in milliseconds."""
+    face_ms: float = 0.0
+    hands_ms: float = 0.0
+    detect_ms: float = 0.0  # Both detectors; ~max(face, hands) when concurrent; capture to fusion when staged
+    state_ms: float = 0.0
+    reused: Tuple[str, ...] = ()  # Detectors the scheduler skipped; their last result was reused
+
+
 @dataclass
 class FrameData:
     """Container for a single frame's processing results."""
     frame: np.ndarray
     emotion_result: Optional[EmotionResult] = None
-    gesture_result: Optional[HandGestureResult] = None
+    gesture_result: Optional[HandGestureResult] = None  # First hand, drives the state machine
+    gesture_results: List[HandGestureResult] = field(default_factory=list)  # All hands
     reaction: Optional[Reaction] = None
     fps: float = 0.0
     timestamp: float = 0.0
+    timings: StageTimings = field(default_factory=StageTimings)
+    point_history: Optional[PointHistory] = None  # Pointing trail from a hands process (staged pipeline)
 
 
 class EmpathicSystem:
@@ -70,9 +90,15 @@ class EmpathicSystem:
         """Initialize the Empathic system."""
         self.config = config or DEFAULT_CONFIG
 
-        # Initialize components
-        self.face_detector = FaceEmotionDetector(self.config.vision)
-        self.hand_detector = HandGestureDetector(self.config.vision)
+        # Initialize components (in the staged pipeline detection runs in the
+        # stage processes: the face detector only draws, without DeepFace, and
+        # hands are drawn with draw_hand_results, without MediaPipe or TFLite)
+        self.face_detector = FaceEmotionDetector(
+            self.config.vision, use_deepface=not self.config.staged_pipeline
+        )
+        self.hand_detector: Optional[HandGestureDetector] = None
+        if not self.config.staged_pipeline:
+            self.hand_detector = HandGestureDetector(self.config.vision)
         self.state_machine = EmpatheticStateMachine(
             config=self.config.state_machine,
             on_reaction=self._handle_reaction,
@@ -80,8 +106,38 @@ class EmpathicSystem:
         )
         self.audio_engine = create_audio_engine(use_mock=False)
 
-        # Camera
-        self.camera: Optional[cv.VideoCapture] = None
+        # Face and hand detection run in parallel when enabled; both release the GIL
+        # for their heavy work (OpenCV, TensorFlow, MediaPipe)
+        self._detect_pool: Optional[ThreadPoolExecutor] = None
+        if self.config.vision.concurrent_detection:
+            self._detect_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="detect")
+        self._last_timings = StageTimings()
+
+        # With a frame budget, a scheduler picks the detectors to run per frame;
+        # only the face detector is throttled (hands are cheap enough to run every frame)
+        # (not used by the staged pipeline, where each detector has its own process)
+        vision = self.config.vision
+        self._scheduler: Optional[DetectorScheduler] = None
+        if vision.frame_budget_ms > 0 and not self.config.staged_pipeline:
+            self._scheduler = DetectorScheduler(
+                ("hands", "face"),
+                vision.frame_budget_ms,
+                min_interval_ms={"face": vision.inference_interval_ms},
+                max_age_ms=vision.detector_max_age_ms,
+                concurrent=vision.concurrent_detection,
+            )
+        self._last_emotion_result: Optional[EmotionResult] = None
+        self._last_gesture_results: List[HandGestureResult] = []
+
+        # Info panel: ROI-only blend, text re-rendered only when it changes
+        self._info_panel = InfoPanelCompositor()
+
+        # Input (ThreadedCapture or a FrameSource read inline, same read() API)
+        self.camera: Optional[Union[ThreadedCapture, FrameSource]] = None
+        self._capture_buffer: Optional[np.ndarray] = None  # Inline reads decode into this
+
+        # Mirrored and display frames come from a pool instead of per-frame allocations
+        self._frame_pool = FrameBufferPool.from_config(self.config.vision, size=self.config.vision.frame_pool_size)
 
         # State
         self._running = False
@@ -90,10 +146,23 @@ class EmpathicSystem:
         self._frame_count = 0
         self._fps = 0.0
         self._fps_update_time = 0.0
+        self._run_start = 0.0
+        self._processed_frames = 0
+
+        # Frames dropped by run_async's bounded stage queues; only live and
+        # real-time input drops them, unpaced replay waits for every frame
+        self._stale_frames = {"capture": 0, "display": 0}
+        self._realtime_input = True
 
         # Callbacks
         self._on_frame_processed: Optional[callable] = None
 
+        # Per-frame results over UDP/JSON (mainly for headless deployments)
+        self._publisher: Optional[UdpResultPublisher] = None
+        if self.config.publish_address:
+            self._publisher = UdpResultPublisher(self.config.publish_address)
+            print(f"[Empathic] Publishing results to udp://{self._publisher.address[0]}:{self._publisher.address[1]}")
+
     def _handle_reaction(self, reaction: Reaction) -> None:
         """Handle reaction from state machine."""
         if self.config.debug_mode:
@@ -114,17 +183,26 @@ class EmpathicSystem:
         self.audio_engine.set_mood_ambience(new_mood)
 
     def _init_camera(self) -> bool:
-        """Initialize camera capture."""
-        self.camera = cv.VideoCapture(self.config.vision.camera_device)
-        if not self.camera.isOpened():
-            print("[Empathic] ERROR: Could not open camera")
+        """Initialize the camera, or the configured input_source instead."""
+        vision = self.config.vision
+        source = create_frame_source(
+            vision.input_source or vision.camera_device, vision, realtime=vision.replay_realtime
+        )
+        # Unpaced replay should process every frame, so it is read inline rather
+        # than through the capture thread (which would drop what the loop can't keep up with)
+        threaded = vision.threaded_capture and (source.live or source.realtime)
+        if threaded:
+            self.camera = ThreadedCapture(vision, source=source, ring_size=vision.capture_ring_size)
+        else:
+            self.camera = source
+        if not self.camera.open():
+            print(f"[Empathic] ERROR: Could not open {source}")
+            self.camera = None
             return False
 
-        self.camera.set(cv.CAP_PROP_FRAME_WIDTH, self.config.vision.frame_width)
-        self.camera.set(cv.CAP_PROP_FRAME_HEIGHT, self.config.vision.frame_height)
-        self.camera.set(cv.CAP_PROP_FPS, self.config.vision.frame_rate)
-
-        print(f"[Empathic] Camera initialized: {self.config.vision.frame_width}x{self.config.vision.frame_height}")
+        self._realtime_input = source.live or source.realtime
+        pacing = "" if source.live else ", real time" if source.realtime else ", as fast as possible"
+        print(f"[Empathic] Input initialized: {source} ({'threaded' if threaded else 'inline'}{pacing})")
         return True
 
     def _update_fps(self) -> None:
@@ -137,18 +215,88 @@ class EmpathicSystem:
             self._frame_count = 0
             self._fps_update_time = now
 
+    @staticmethod
+    def _timed(fn: Callable[[np.ndarray], Any], frame: np.ndarray) -> Tuple[Any, float]:
+        """Run one detector stage, returning its result and wall time in ms."""
+        start = time.perf_counter()
+        result = fn(frame)
+        return result, (time.perf_counter() - start) * 1000
+
+    def _detect(
+        self,
+        frame: np.ndarray,
+        timings: StageTimings
+    ) -> Tuple[Optional[EmotionResult], List[HandGestureResult]]:
+        """
+        Run face and hand detection, concurrently when a detection pool is set.
+
+        With a scheduler, only the detectors it picks run; the others'
+        last results are returned again and listed in timings.reused.
+        """
+        start = time.perf_counter()
+        stages = ("face", "hands") if self._scheduler is None else self._scheduler.plan()
+        emotion_result = self._last_emotion_result
+        gesture_results = self._last_gesture_results
+        if self._detect_pool is not None and len(stages) == 2:
+            face_future = self._detect_pool.submit(self._timed, self.face_detector.detect, frame)
+            hands_future = self._detect_pool.submit(self._timed, self.hand_detector.detect_all, frame)
+            emotion_result, timings.face_ms = face_future.result()
+            gesture_results, timings.hands_ms = hands_future.result()
+        else:
+            if "face" in stages:
+                emotion_result, timings.face_ms = self._timed(self.face_detector.detect, frame)
+            if "hands" in stages:
+                gesture_results, timings.hands_ms = self._timed(self.hand_detector.detect_all, frame)
+        timings.detect_ms = (time.perf_counter() - start) * 1000
+
+        if self._scheduler is not None:
+            if "face" in stages:
+                self._scheduler.record("face", timings.face_ms)
+            if "hands" in stages:
+                self._scheduler.record("hands", timings.hands_ms)
+            timings.reused = tuple(stage for stage in ("face", "hands") if stage not in stages)
+            self._last_emotion_result = emotion_result
+            self._last_gesture_results = gesture_results
+        return emotion_result, gesture_results
+
+    def _read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Read the next camera frame; inline sources decode into a reused buffer."""
+        if isinstance(self.camera, FrameSource):
+            ret, frame = self.camera.read(self._capture_buffer)
+            if ret:
+                self._capture_buffer = frame  # Same buffer unless the first frame or a new size
+            return ret, frame
+        return self.camera.read()
+
+    def _mirror(self, frame: np.ndarray) -> np.ndarray:
+        """Mirror a frame into a pooled buffer (release it with the frame's data)."""
+        mirrored = self._frame_pool.acquire(frame.shape)
+        cv.flip(frame, 1, dst=mirrored)
+        return mirrored
+
     def _process_frame(self, frame: np.ndarray) -> FrameData:
         """Process a single camera frame."""
-        self._update_fps()
-
         # Mirror the frame
-        frame = cv.flip(frame, 1)
-
-        # Detect emotion
-        emotion_result = self.face_detector.detect(frame)
-
-        # Detect gesture
-        gesture_result = self.hand_detector.detect(frame)
+        return self._analyze_frame(self._mirror(frame))
+
+    def _analyze_frame(self, frame: np.ndarray) -> FrameData:
+        """Detect and fuse on an already mirrored frame."""
+        # Detect emotion and gestures (all hands; two-hand gestures are reported on both)
+        timings = StageTimings()
+        emotion_result, gesture_results = self._detect(frame, timings)
+        return self._fuse(frame, emotion_result, gesture_results, timings)
+
+    def _fuse(
+        self,
+        frame: np.ndarray,
+        emotion_result: Optional[EmotionResult],
+        gesture_results: List[HandGestureResult],
+        timings: StageTimings,
+        point_history: Optional[PointHistory] = None
+    ) -> FrameData:
+        """Feed detector results to the state machine and collect the frame's data."""
+        self._update_fps()
+        gesture_result = gesture_results[0] if gesture_results else None
 
         # Extract values for state machine
         emotion = emotion_result.emotion if emotion_result else None
@@ -165,91 +313,117 @@ class EmpathicSystem:
         )
 
         # Process through state machine
+        start = time.perf_counter()
         reaction = self.state_machine.process_input(sensory_input)
+        timings.state_ms = (time.perf_counter() - start) * 1000
+        self._last_timings = timings
 
         return FrameData(
             frame=frame,
             emotion_result=emotion_result,
             gesture_result=gesture_result,
+            gesture_results=gesture_results,
             reaction=reaction,
             fps=self._fps,
             timestamp=time.time(),
+            timings=timings,
+            point_history=point_history,
         )
 
     def _draw_ui(self, frame_data: FrameData) -> np.ndarray:
-        """Draw UI overlay on frame."""
-        frame = frame_data.frame.copy()
+        """
+        Draw UI overlay on a copy of the frame.
+
+        The copy is a pooled display buffer; release it to the frame pool
+        once shown. This copy is the loop's only full-frame copy; the
+        mirror writes into a pooled buffer and overlays draw in place.
+        """
+        start = time.perf_counter()
+        frame = self._frame_pool.acquire(frame_data.frame.shape)
+        np.copyto(frame, frame_data.frame)
         h, w = frame.shape[:2]
 
         # Draw face emotion
         if frame_data.emotion_result:
             frame = self.face_detector.draw_result(frame, frame_data.emotion_result)
 
-        # Draw hand gesture
-        if frame_data.gesture_result:
-            frame = self.hand_detector.draw_landmarks(frame, frame_data.gesture_result)
+        # Draw hand gestures
+        if frame_data.gesture_results:
+            point_history = frame_data.point_history
+            if point_history is None and self.hand_detector is not None:
+                point_history = self.hand_detector.point_history
+            frame = draw_hand_results(frame, frame_data.gesture_results, point_history)
 
         # Draw info panel
         self._draw_info_panel(frame, frame_data)
 
+        # Drawing comes out of the same frame budget as detection
+        if self._scheduler is not None:
+            self._scheduler.record_overhead((time.perf_counter() - start) * 1000)
+
         return frame
 
     def _draw_info_panel(self, frame: np.ndarray, frame_data: FrameData) -> None:
         """Draw information panel overlay."""
-        h, w = frame.shape[:2]
-
-        # Background panel
-        panel_width = 280
-        panel_height = 180
-        panel_x = 10
-        panel_y = 10
-
-        overlay = frame.copy()
-        cv.rectangle(overlay, (panel_x, panel_y),
-                    (panel_x + panel_width, panel_y + panel_height),
-                    (0, 0, 0), -1)
-        cv.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
-
-        # Title
-        cv.putText(frame, "EMPATHIC-01", (panel_x + 10, panel_y + 25),
-                  cv.FONT_HERSHEY_SIMPLEX, 0.7, (142, 85, 114), 2)
-
-        # FPS
-        cv.putText(frame, f"FPS: {frame_data.fps:.1f}", (panel_x + 10, panel_y + 55),
-                  cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-
-        # Current mood
-        mood = self.state_machine.current_mood
-        cv.putText(frame, f"Mood: {mood.value}", (panel_x + 10, panel_y + 80),
-                  cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-
-        # Current emotion
         emotion = frame_data.emotion_result
-        emotion_text = f"Emotion: {emotion.emotion.value}" if emotion else "Emotion: --"
-        cv.putText(frame, emotion_text, (panel_x + 10, panel_y + 105),
-                  cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-
-        # Current gesture
         gesture = frame_data.gesture_result
-        gesture_text = f"Gesture: {gesture.gesture.value}" if gesture else "Gesture: --"
-        cv.putText(frame, gesture_text, (panel_x + 10, panel_y + 130),
-                  cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-
-        # Reaction message
-        if frame_data.reaction and frame_data.reaction.message:
-            cv.putText(frame, frame_data.reaction.message[:30], (panel_x + 10, panel_y + 160),
-                      cv.FONT_HERSHEY_SIMPLEX, 0.4, (152, 251, 152), 1)
+        reaction = frame_data.reaction
+        self._info_panel.draw(
+            frame,
+            fps=frame_data.fps,
+            mood=self.state_machine.current_mood.value,
+            emotion=emotion.emotion.value if emotion else None,
+            gesture=gesture.gesture.value if gesture else None,
+            message=reaction.message if reaction else None,
+        )
 
-        # Controls hint
-        cv.putText(frame, "ESC: Quit | SPACE: Pause | D: Debug",
-                  (10, h - 10), cv.FONT_HERSHEY_SIMPLEX, 0.4, (150, 150, 150), 1)
+        # Stage timings (debug; changes every frame, so drawn directly)
+        if self.config.debug_mode:
+            t = frame_data.timings
+            mode = "concurrent" if self._detect_pool is not None else "sequential"
+            if t.reused:
+                mode += f", reused {'+'.join(t.reused)}"
+            panel_x, panel_y = PANEL_ORIGIN
+            cv.putText(frame, f"Face {t.face_ms:.1f} | Hands {t.hands_ms:.1f} | "
+                              f"Detect {t.detect_ms:.1f} ms ({mode})",
+                      (panel_x, panel_y + PANEL_SIZE[1] + 20), cv.FONT_HERSHEY_SIMPLEX, 0.4, (150, 150, 150), 1)
+
+    def _emit(self, frame_data: FrameData) -> None:
+        """Hand a processed frame to the callback and the result publisher."""
+        self._processed_frames += 1
+        if self._on_frame_processed:
+            self._on_frame_processed(frame_data)
+        if self._publisher is not None:
+            self._publisher.publish(frame_data_to_dict(frame_data, self.state_machine.current_mood.value))
+
+    @property
+    def _quit_hint(self) -> str:
+        return "Press Ctrl+C to stop (headless)." if self.config.headless else "Press ESC to quit."
+
+    def _handle_key(self, key: int) -> bool:
+        """Apply a keyboard command; returns False when the user quits."""
+        if key == 27:  # ESC
+            return False
+        elif key == 32:  # SPACE
+            self._paused = not self._paused
+            print(f"[Empathic] {'Paused' if self._paused else 'Resumed'}")
+        elif key == ord('d'):
+            self.config.debug_mode = not self.config.debug_mode
+            print(f"[Empathic] Debug mode: {self.config.debug_mode}")
+        return True
 
     def run(self) -> None:
         """
         Run the main detection loop (synchronous).
 
-        Press ESC to quit, SPACE to pause.
+        Press ESC to quit, SPACE to pause. In headless mode nothing is drawn
+        or shown; results go to the callback and publisher only, and the
+        loop runs until a shutdown signal.
         """
+        if self.config.staged_pipeline:
+            self.run_staged()
+            return
+
         if not self._init_camera():
             return
 
@@ -260,43 +434,41 @@ class EmpathicSystem:
         self.audio_engine.set_mood_ambience(MoodState.NEUTRAL)
 
         self._running = True
-        self._fps_update_time = time.time()
-        print("[Empathic] Starting main loop. Press ESC to quit.")
+        self._fps_update_time = self._run_start = time.time()
+        print(f"[Empathic] Starting main loop. {self._quit_hint}")
 
         try:
             while self._running:
                 # Handle keyboard input
-                key = cv.waitKey(1) & 0xFF
-                if key == 27:  # ESC
+                if not self.config.headless and not self._handle_key(cv.waitKey(1) & 0xFF):
                     break
-                elif key == 32:  # SPACE
-                    self._paused = not self._paused
-                    print(f"[Empathic] {'Paused' if self._paused else 'Resumed'}")
-                elif key == ord('d'):
-                    self.config.debug_mode = not self.config.debug_mode
-                    print(f"[Empathic] Debug mode: {self.config.debug_mode}")
 
                 if self._paused:
                     continue
 
                 # Capture frame
-                ret, frame = self.camera.read()
+                ret, frame = self._read_frame()
                 if not ret:
+                    if not self.camera.isOpened():
+                        print("[Empathic] Input ended")
+                        break
                     print("[Empathic] WARNING: Frame capture failed")
                     continue
 
                 # Process frame
                 frame_data = self._process_frame(frame)
 
-                # Draw UI
-                display_frame = self._draw_ui(frame_data)
+                if not self.config.headless:
+                    # Draw UI
+                    display_frame = self._draw_ui(frame_data)
 
-                # Show frame
-                cv.imshow("Empathic-01", display_frame)
+                    # Show frame (imshow copies it, so the buffer can go back right away)
+                    cv.imshow("Empathic-01", display_frame)
+                    self._frame_pool.release(display_frame)
 
-                # Callback if set
-                if self._on_frame_processed:
-                    self._on_frame_processed(frame_data)
+                # Callback and publisher
+                self._emit(frame_data)
+                self._frame_pool.release(frame_data.frame)
 
         except KeyboardInterrupt:
             print("\n[Empathic] Interrupted by user")
@@ -304,55 +476,251 @@ class EmpathicSystem:
         finally:
             self.cleanup()
 
-    async def run_async(self) -> None:
+    def run_staged(self, source: Union[int, str, None] = None) -> None:
         """
-        Run the main detection loop (asynchronous).
+        Run with capture, face and hand detection in separate processes.
+
+        This process does fusion, UI and audio only. Each detector result is
+        paired with the other detector's latest result and drawn on the
+        frame it came from; unpaced replay fuses every frame once both
+        detectors have reported it. An ended source is drained first.
 
-        Allows for integration with other async systems.
+        Args:
+            source: Camera index, video file, image directory or "synthetic"
+                (default: input_source, else the configured camera)
         """
-        if not self._init_camera():
-            return
+        from staged_pipeline import StagedPipeline
+
+        vision = self.config.vision
+        if source is None and vision.input_source:
+            source = vision.input_source
+        pipeline = StagedPipeline(vision, source=source, realtime=vision.replay_realtime)
+        pipeline.start()
 
         self.audio_engine.start()
         self.audio_engine.set_mood_ambience(MoodState.NEUTRAL)
 
         self._running = True
-        self._fps_update_time = time.time()
-        print("[Empathic] Starting async main loop")
+        self._fps_update_time = self._run_start = time.time()
+        latest: Dict[str, Any] = {}
+        print(f"[Empathic] Starting staged pipeline. {self._quit_hint}")
 
         try:
             while self._running:
-                # Check for keyboard input (non-blocking)
-                key = cv.waitKey(1) & 0xFF
-                if key == 27:
+                if not self.config.headless and not self._handle_key(cv.waitKey(1) & 0xFF):
                     break
-                elif key == 32:
-                    self._paused = not self._paused
 
-                if self._paused:
-                    await asyncio.sleep(0.1)
-                    continue
+                results = pipeline.poll(timeout=0.02)
+                running = pipeline.check_stages()
+                for stage in pipeline.disabled_stages():
+                    latest.pop(stage, None)  # Empty results from here on, not its last ones
+                if not self._paused:
+                    # Results that came in with the source's end are still shown
+                    for batch in pipeline.frame_results(results, flush=not running):
+                        self._show_staged(pipeline, batch, latest)
+                if not running:
+                    if pipeline.finished:
+                        print("[Empathic] Input ended")
+                    break
 
-                # Capture frame
-                ret, frame = self.camera.read()
-                if not ret:
-                    await asyncio.sleep(0.01)
-                    continue
+        except KeyboardInterrupt:
+            print("\n[Empathic] Interrupted by user")
 
-                # Process frame (could be made fully async with threadpool)
-                frame_data = self._process_frame(frame)
+        finally:
+            pipeline.stop()
+            self.cleanup()
 
-                # Draw and show
-                display_frame = self._draw_ui(frame_data)
+    def _show_staged(self, pipeline: Any, results: List[Any], latest: Dict[str, Any]) -> None:
+        """Fuse, draw and emit the newest frame of a batch of stage results."""
+        for result in results:
+            latest[result.stage] = result
+        newest = max(results, key=lambda result: result.frame.sequence)
+        buffer = self._frame_pool.acquire(pipeline.shape)
+        frame = pipeline.frame(newest.frame, out=buffer)
+        if frame is None:
+            self._frame_pool.release(buffer)
+            return  # Lapped by the capture process; the next result is newer
+
+        face = latest.get("face")
+        hands = latest.get("hands")
+        gesture_results, point_history = hands.payload if hands else ([], None)
+        timings = StageTimings(
+            face_ms=face.inference_ms if face else 0.0,
+            hands_ms=hands.inference_ms if hands else 0.0,
+            detect_ms=(time.time() - newest.frame.timestamp) * 1000,
+        )
+        frame_data = self._fuse(
+            frame, face.payload if face else None, gesture_results, timings, point_history
+        )
+
+        if not self.config.headless:
+            display_frame = self._draw_ui(frame_data)
+            cv.imshow("Empathic-01", display_frame)
+            self._frame_pool.release(display_frame)
+        self._emit(frame_data)
+        self._frame_pool.release(frame)
+
+    @staticmethod
+    def _put_latest(stage_queue: asyncio.Queue, item: Any) -> Optional[Any]:
+        """Put into a bounded queue, dropping the oldest item if full; returns the dropped item."""
+        dropped = None
+        if stage_queue.full():
+            dropped = stage_queue.get_nowait()
+        stage_queue.put_nowait(item)
+        return dropped
+
+    async def _capture_stage(self, frames: asyncio.Queue, executor: ThreadPoolExecutor) -> None:
+        """
+        Read and mirror frames off the event loop.
+
+        Live and real-time input keeps only the newest frame queued;
+        unpaced replay waits for room, so every frame is processed. At the
+        end of the input a None follows the last frame.
+        """
+        loop = asyncio.get_running_loop()
+
+        def read_mirrored() -> Optional[np.ndarray]:
+            # Mirror in the capture thread: the flip goes to a pooled buffer, so
+            # the camera (ThreadedCapture ring, inline buffer) may reuse its own right away
+            ret, frame = self._read_frame()
+            return self._mirror(frame) if ret else None
+
+        while self._running:
+            if self._paused:
+                await asyncio.sleep(0.1)
+                continue
+            frame = await loop.run_in_executor(executor, read_mirrored)
+            if frame is None:
+                if not self.camera.isOpened():
+                    print("[Empathic] Input ended")
+                    await frames.put(None)  # Downstream stages drain, then finish
+                    return
+                await asyncio.sleep(0.01)
+                continue
+            if not self._realtime_input:
+                await frames.put(frame)
+                continue
+            stale = self._put_latest(frames, frame)
+            if stale is not None:
+                self._stale_frames["capture"] += 1
+                self._frame_pool.release(stale)
+
+    async def _process_stage(
+        self,
+        frames: asyncio.Queue,
+        display: Optional[asyncio.Queue],
+        executor: ThreadPoolExecutor
+    ) -> None:
+        """Detection, fusion and UI drawing (unless headless) for the newest frame, in a worker thread."""
+        loop = asyncio.get_running_loop()
+
+        def process(frame: np.ndarray) -> Tuple[FrameData, Optional[np.ndarray]]:
+            frame_data = self._analyze_frame(frame)
+            return frame_data, None if display is None else self._draw_ui(frame_data)
+
+        while self._running:
+            frame = await frames.get()
+            if frame is None:
+                if display is not None:
+                    await display.put(None)
+                return
+            frame_data, display_frame = await loop.run_in_executor(executor, process, frame)
+            if display is not None:
+                stale = self._put_latest(display, display_frame)
+                if stale is not None:
+                    self._stale_frames["display"] += 1
+                    self._frame_pool.release(stale)
+
+            # Callback and publisher run on the event loop thread
+            self._emit(frame_data)
+            self._frame_pool.release(frame)
+
+    async def _display_stage(self, display: asyncio.Queue, executor: ThreadPoolExecutor) -> None:
+        """Show frames and poll the keyboard; HighGUI calls stay on one thread."""
+        loop = asyncio.get_running_loop()
+
+        def show(display_frame: Optional[np.ndarray]) -> int:
+            if display_frame is not None:
                 cv.imshow("Empathic-01", display_frame)
+            return cv.waitKey(1) & 0xFF
+
+        while self._running:
+            try:
+                display_frame = await asyncio.wait_for(display.get(), timeout=0.05)
+            except asyncio.TimeoutError:
+                display_frame = None  # Keep the window and keyboard responsive
+            else:
+                if display_frame is None:
+                    return  # End of input
+            key = await loop.run_in_executor(executor, show, display_frame)
+            self._frame_pool.release(display_frame)
+            if not self._handle_key(key):
+                self._running = False
 
-                # Yield to event loop
-                await asyncio.sleep(0.001)
+    async def run_async(self) -> None:
+        """
+        Run the main detection loop (asynchronous).
+
+        Capture, processing and display are separate tasks joined by
+        one-slot queues that drop stale frames (except unpaced replay, where
+        capture waits for processing), and every blocking call (camera
+        read, detection, drawing, HighGUI) runs in an executor thread. The
+        event loop stays free, so the system can live inside a larger async
+        service. When the input ends, the last frames are drained through
+        every stage before the loop returns.
+        """
+        if not self._init_camera():
+            return
+
+        self.audio_engine.start()
+        self.audio_engine.set_mood_ambience(MoodState.NEUTRAL)
+
+        self._running = True
+        self._fps_update_time = self._run_start = time.time()
+        print("[Empathic] Starting async main loop")
+
+        # One thread per stage: detectors and HighGUI are not safe to call concurrently
+        stages = ("capture", "process") if self.config.headless else ("capture", "process", "display")
+        executors = {
+            stage: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"async-{stage}")
+            for stage in stages
+        }
+        frames: asyncio.Queue = asyncio.Queue(maxsize=1)
+        display: Optional[asyncio.Queue] = None if self.config.headless else asyncio.Queue(maxsize=1)
+        tasks = [
+            asyncio.create_task(self._capture_stage(frames, executors["capture"])),
+            asyncio.create_task(self._process_stage(frames, display, executors["process"])),
+        ]
+        if display is not None:
+            tasks.append(asyncio.create_task(self._display_stage(display, executors["display"])))
+
+        try:
+            # A quit (key, shutdown signal) or a failing stage stops the others; at the
+            # end of the input each stage returns once it has passed the last frame on
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if not self._running or any(task.exception() for task in done):
+                    break
+            self._running = False
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task in tasks:
+                if not task.cancelled():
+                    task.result()
 
         except asyncio.CancelledError:
             print("[Empathic] Async loop cancelled")
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+            print(f"[Empathic] Stale frames dropped: {self._stale_frames['capture']} before processing, "
+                  f"{self._stale_frames['display']} before display")
             self.cleanup()
 
     def cleanup(self) -> None:
@@ -361,18 +729,44 @@ class EmpathicSystem:
 
         self._running = False
 
+        if self._run_start and self._processed_frames:
+            elapsed = time.time() - self._run_start
+            print(f"[Empathic] Processed {self._processed_frames} frames in {elapsed:.1f} s "
+                  f"({self._processed_frames / elapsed:.1f} fps end to end)")
+
         if self.camera:
+            if isinstance(self.camera, ThreadedCapture):
+                print(f"[Empathic] Capture: {self.camera.frames_read} frames read, "
+                      f"{self.camera.dropped_frames} dropped")
             self.camera.release()
             self.camera = None
 
         self.audio_engine.stop()
-        self.hand_detector.close()
-
-        cv.destroyAllWindows()
+        if self._detect_pool is not None:
+            self._detect_pool.shutdown(wait=True)
+            self._detect_pool = None
+        if self.hand_detector is not None:
+            self.hand_detector.close()
+
+        if self._scheduler is not None:
+            print(f"[Empathic] Scheduler: {self._scheduler.summary()}")
+
+        if self._publisher is not None:
+            print(f"[Empathic] Published {self._publisher.sent} results ({self._publisher.dropped} dropped)")
+            self._publisher.close()
+            self._publisher = None
+
+        if not self.config.headless:
+            cv.destroyAllWindows()
         print("[Empathic] Cleanup complete")
 
     def on_frame_processed(self, callback: callable) -> None:
-        """Set callback for frame processing completion."""
+        """
+        Set callback for frame processing completion.
+
+        FrameData.frame is a pooled buffer that is reused after the callback
+        returns; copy it to keep it.
+        """
         self._on_frame_processed = callback
 
     def get_status(self) -> Dict[str, Any]:
@@ -381,6 +775,16 @@ class EmpathicSystem:
             "running": self._running,
             "paused": self._paused,
             "fps": self._fps,
+            "processed_frames": self._processed_frames,
+            "dropped_frames": getattr(self.camera, "dropped_frames", 0),
+            "stale_frames": dict(self._stale_frames),
+            "stage_ms": {
+                "face": self._last_timings.face_ms,
+                "hands": self._last_timings.hands_ms,
+                "detect": self._last_timings.detect_ms,
+                "state": self._last_timings.state_ms,
+            },
+            "reused": list(self._last_timings.reused),
             "mood": self.state_machine.current_mood.value,
             "emotion": self.state_machine.current_emotion.value if self.state_machine.current_emotion else None,
             "gesture": self.state_machine.current_gesture.value if self.state_machine.current_gesture else None,
@@ -399,6 +803,13 @@ Examples:
   python main.py --debug            # Enable debug mode
   python main.py --camera 1         # Use camera device 1
   python main.py --no-audio         # Disable audio
+  python main.py --no-threaded-capture  # Read the camera inline
+  python main.py --concurrent       # Face and hand detection in parallel
+  python main.py --staged           # Capture, face and hands in separate processes
+  python main.py --budget 33        # Schedule detectors to hold ~30 FPS
+  python main.py --headless --publish 127.0.0.1:5005  # No display, results over UDP
+  python main.py --input recording.mp4  # Replay a video file instead of the camera
+  python main.py --input synthetic --fast-replay --headless  # Pipeline throughput, no webcam
         """
     )
 
@@ -409,6 +820,19 @@ Examples:
         help="Camera device index (default: 0)"
     )
 
+    parser.add_argument(
+        "--input", "-i",
+        metavar="SOURCE",
+        default="",
+        help="Video file, image directory or 'synthetic[:frames]' instead of the camera"
+    )
+
+    parser.add_argument(
+        "--fast-replay",
+        action="store_true",
+        help="Replay --input as fast as possible instead of at its frame rate"
+    )
+
     parser.add_argument(
         "--width",
         type=int,
@@ -435,6 +859,45 @@ Examples:
         help="Disable audio output"
     )
 
+    parser.add_argument(
+        "--no-threaded-capture",
+        action="store_true",
+        help="Read the camera inline in the main loop"
+    )
+
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Run face and hand detection in parallel threads"
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.0,
+        metavar="MS",
+        help="Frame time budget; detectors that don't fit reuse their last result (e.g. 33 for 30 FPS)"
+    )
+
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Run capture, face and hand detection in separate processes"
+    )
+
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="No window or overlay rendering; results via callbacks / --publish"
+    )
+
+    parser.add_argument(
+        "--publish",
+        metavar="HOST:PORT",
+        default="",
+        help="Send per-frame results as JSON over UDP (e.g. 127.0.0.1:5005)"
+    )
+
     parser.add_argument(
         "--async",
         action="store_true",
@@ -452,16 +915,33 @@ def main():
     # Create configuration
     config = EmpathicConfig()
     config.vision.camera_device = args.camera
+    config.vision.input_source = args.input
+    config.vision.replay_realtime = not args.fast_replay
     config.vision.frame_width = args.width
     config.vision.frame_height = args.height
+    config.vision.threaded_capture = not args.no_threaded_capture
+    config.vision.concurrent_detection = args.concurrent
+    config.vision.frame_budget_ms = args.budget
+    config.staged_pipeline = args.staged
+    config.headless = args.headless
+    config.publish_address = args.publish
     config.debug_mode = args.debug
 
     print("=" * 50)
     print("  EMPATHIC-01: Multimodal Emotion AI System")
     print("=" * 50)
-    print(f"  Camera: Device {args.camera} ({args.width}x{args.height})")
+    if args.input:
+        replay = "as fast as possible" if args.fast_replay else "real time"
+        print(f"  Input: {args.input} ({replay})")
+    else:
+        print(f"  Camera: Device {args.camera} ({args.width}x{args.height})")
     print(f"  Debug: {'Enabled' if args.debug else 'Disabled'}")
     print(f"  Audio: {'Disabled' if args.no_audio else 'Enabled'}")
+    mode = "Staged (multi-process)" if args.staged else "Concurrent" if args.concurrent else "Sequential"
+    if args.budget > 0 and not args.staged:
+        mode += f", scheduled ({args.budget:.0f} ms/frame budget)"
+    print(f"  Detection: {mode}")
+    print(f"  Display: {'Headless' if args.headless else 'Window'}")
     print("=" * 50)
 
     # Create and run system
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Empathic-01 UI Overlay
+
+Info panel compositor for EmpathicSystem's display. The panel used to be
+drawn by copying the whole frame, drawing a rectangle on the copy and
+alpha-blending the full frames back together. The compositor darkens only
+the panel's region of interest and stamps pre-rendered text onto it:
+- the panel text is rendered into a cached layer (colors + mask) that is
+  rebuilt only when one of its lines changes (FPS, mood, emotion, ...)
+- the controls hint is cached per frame height
+
+With OpenCV 4, whose putText writes opaque LINE_8 pixels by default, the
+output is pixel-identical to the full-frame version. Where putText
+anti-aliases (OpenCV 5), layers keep the text coverage and blend with it,
+within two gray levels of drawing in place.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+import cv2 as cv
+
+
+PANEL_ORIGIN = (10, 10)
+PANEL_SIZE = (280, 180)  # width, height
+PANEL_ALPHA = 0.7  # Opacity of the black panel background
+TITLE_COLOR = (142, 85, 114)
+TEXT_COLOR = (255, 255, 255)
+MESSAGE_COLOR = (152, 251, 152)
+HINT_COLOR = (150, 150, 150)
+CONTROLS_HINT = "ESC: Quit | SPACE: Pause | D: Debug"
+
+
+@dataclass(frozen=True)
+class TextItem:
+    """One putText call, in frame coordinates."""
+    text: str
+    org: Tuple[int, int]  # Baseline start, as for cv.putText
+    scale: float
+    color: Tuple[int, int, int]
+    thickness: int = 1
+
+
+class TextLayer:
+    """
+    Text rendered once into a small color image and coverage mask, then
+    copied (opaque text) or blended (anti-aliased text) onto frames. The
+    layer covers the union of its items' bounding boxes.
+    """
+
+    def __init__(self, items: List[TextItem], frame_size: Tuple[int, int]):
+        """
+        Args:
+            items: Text to render
+            frame_size: (width, height) of the frames the layer is applied to
+        """
+        w, h = frame_size
+        boxes = []
+        for item in items:
+            (tw, th), baseline = cv.getTextSize(item.text, cv.FONT_HERSHEY_SIMPLEX, item.scale, item.thickness)
+            pad = item.thickness + 1
+            x, y = item.org
+            boxes.append((x - pad, y - th - pad, x + tw + pad, y + baseline + pad))
+        x0 = max(0, min(b[0] for b in boxes))
+        y0 = max(0, min(b[1] for b in boxes))
+        x1 = min(w, max(b[2] for b in boxes))
+        y1 = min(h, max(b[3] for b in boxes))
+        self.box = (x0, y0, max(x0, x1), max(y0, y1))
+
+        size = (self.box[3] - y0, self.box[2] - x0)
+        self.colors = np.zeros((*size, 3), dtype=np.uint8)  # Premultiplied by coverage
+        coverage = np.zeros(size, dtype=np.uint8)
+        for item in items:
+            org = (item.org[0] - x0, item.org[1] - y0)
+            cv.putText(self.colors, item.text, org, cv.FONT_HERSHEY_SIMPLEX, item.scale, item.color, item.thickness)
+            cv.putText(coverage, item.text, org, cv.FONT_HERSHEY_SIMPLEX, item.scale, 255, item.thickness)
+
+        self.opaque = not np.any((coverage > 0) & (coverage < 255))
+        if self.opaque:
+            self.mask = coverage.astype(bool)[..., None]
+        else:
+            self.background_weight = cv.cvtColor(255 - coverage, cv.COLOR_GRAY2BGR)
+
+    def apply(self, frame: np.ndarray) -> None:
+        """Put the text onto the frame, in place."""
+        x0, y0, x1, y1 = self.box
+        roi = frame[y0:y1, x0:x1]
+        if self.opaque:
+            np.copyto(roi, self.colors, where=self.mask)
+        else:
+            cv.multiply(roi, self.background_weight, dst=roi, scale=1.0 / 255)
+            cv.add(roi, self.colors, dst=roi)
+
+
+class InfoPanelCompositor:
+    """
+    Draws the info panel (title, FPS, mood, emotion, gesture, reaction
+    message) and the controls hint, blending and redrawing as little as
+    possible per frame.
+    """
+
+    def __init__(self):
+        self._panel_key: Optional[tuple] = None
+        self._panel_layer: Optional[TextLayer] = None
+        self._hint_key: Optional[tuple] = None
+        self._hint_layer: Optional[TextLayer] = None
+        self.panel_renders = 0  # Text layer rebuilds, for tests and benchmarks
+
+    @staticmethod
+    def panel_items(
+        fps: float,
+        mood: str,
+        emotion: Optional[str],
+        gesture: Optional[str],
+        message: Optional[str]
+    ) -> List[TextItem]:
+        """The panel's text, in frame coordinates."""
+        x, y = PANEL_ORIGIN
+        items = [
+            TextItem("EMPATHIC-01", (x + 10, y + 25), 0.7, TITLE_COLOR, 2),
+            TextItem(f"FPS: {fps:.1f}", (x + 10, y + 55), 0.5, TEXT_COLOR),
+            TextItem(f"Mood: {mood}", (x + 10, y + 80), 0.5, TEXT_COLOR),
+            TextItem(f"Emotion: {emotion or '--'}", (x + 10, y + 105), 0.5, TEXT_COLOR),
+            TextItem(f"Gesture: {gesture or '--'}", (x + 10, y + 130), 0.5, TEXT_COLOR),
+        ]
+        if message:
+            items.append(TextItem(message[:30], (x + 10, y + 160), 0.4, MESSAGE_COLOR))
+        return items
+
+    @staticmethod
+    def darken_panel(frame: np.ndarray) -> None:
+        """Blend the black panel background into its region of the frame, in place."""
+        x, y = PANEL_ORIGIN
+        pw, ph = PANEL_SIZE
+        roi = frame[y:y + ph + 1, x:x + pw + 1]  # cv.rectangle includes its far corner
+        # Same rounding as cv.addWeighted(black, alpha, roi, 1 - alpha, 0)
+        cv.addWeighted(roi, 1.0 - PANEL_ALPHA, roi, 0.0, 0.0, dst=roi)
+
+    def draw(
+        self,
+        frame: np.ndarray,
+        fps: float,
+        mood: str,
+        emotion: Optional[str] = None,
+        gesture: Optional[str] = None,
+        message: Optional[str] = None
+    ) -> None:
+        """
+        Draw the panel and controls hint onto the frame, in place.
+
+        Args:
+            frame: BGR display frame
+            fps: Frames per second to show
+            mood: Current mood value
+            emotion: Current emotion value, or None
+            gesture: Current gesture value, or None
+            message: Reaction message, or None
+        """
+        h, w = frame.shape[:2]
+        self.darken_panel(frame)
+
+        # Rebuild the text layer only when a displayed string changes
+        key = (f"{fps:.1f}", mood, emotion, gesture, message[:30] if message else None, w, h)
+        if key != self._panel_key:
+            self._panel_layer = TextLayer(self.panel_items(fps, mood, emotion, gesture, message), (w, h))
+            self._panel_key = key
+            self.panel_renders += 1
+        self._panel_layer.apply(frame)
+
+        if self._hint_key != (w, h):
+            self._hint_layer = TextLayer([TextItem(CONTROLS_HINT, (10, h - 10), 0.4, HINT_COLOR)], (w, h))
+            self._hint_key = (w, h)
+        self._hint_layer.apply(frame)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Empathic-01 Result Publisher
+
+Publishes per-frame results of a headless EmpathicSystem as compact JSON
+datagrams over UDP, one message per processed frame. Sends never block:
+if nobody listens, or the socket buffer is full, the message is dropped
+and counted.
+
+Listen with e.g.:
+    python -c "import socket; s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM); \
+s.bind(('127.0.0.1', 5005)); [print(s.recv(65535).decode()) for _ in iter(int, 1)]"
+"""
+
+import json
+import socket
+from typing import Any, Dict, Optional, Tuple
+
+
+def parse_address(address: str, default_host: str = "127.0.0.1") -> Tuple[str, int]:
+    """Parse "host:port" or "port" into a socket address."""
+    host, _, port = address.rpartition(":")
+    return host or default_host, int(port)
+
+
+def frame_data_to_dict(frame_data: Any, mood: Optional[str] = None) -> Dict[str, Any]:
+    """
+    JSON-ready summary of one FrameData (no pixels).
+
+    Args:
+        frame_data: FrameData from EmpathicSystem
+        mood: Current mood value, if the caller tracks it
+
+    Returns:
+        Dict of plain Python types
+    """
+    emotion = frame_data.emotion_result
+    reaction = frame_data.reaction
+    timings = frame_data.timings
+    return {
+        "timestamp": frame_data.timestamp,
+        "fps": round(frame_data.fps, 2),
+        "mood": mood,
+        "emotion": None if emotion is None else {
+            "label": emotion.emotion.value,
+            "confidence": round(emotion.confidence, 4),
+            "box": list(emotion.face_box),
+        },
+        "hands": [
+            {
+                "gesture": result.gesture.value,
+                "confidence": round(result.confidence, 4),
+                "handedness": result.handedness,
+                "box": list(result.bounding_box),
+                "motion": result.motion_gesture.value,
+            }
+            for result in frame_data.gesture_results
+        ],
+        "reaction": None if reaction is None else {
+            "mood": reaction.mood.value,
+            "message": reaction.message,
+            "sfx": reaction.sfx_to_play,
+        },
+        "timings_ms": {
+            "face": round(timings.face_ms, 2),
+            "hands": round(timings.hands_ms, 2),
+            "detect": round(timings.detect_ms, 2),
+            "state": round(timings.state_ms, 2),
+        },
+        "reused": list(timings.reused),
+    }
+
+
+class UdpResultPublisher:
+    """Non-blocking UDP/JSON publisher for frame results."""
+
+    def __init__(self, address: str):
+        """
+        Args:
+            address: Destination "host:port" (host defaults to 127.0.0.1)
+        """
+        self.address = parse_address(address)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self.sent = 0
+        self.dropped = 0
+
+    def publish(self, message: Dict[str, Any]) -> bool:
+        """Send one message; returns False if it was dropped."""
+        payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        try:
+            self._socket.sendto(payload, self.address)
+        except OSError:  # Full socket buffer, no listener (ICMP refused), ...
+            self.dropped += 1
+            return False
+        self.sent += 1
+        return True
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._socket.close()
@@ -3,12 +3,44 @@ Senses Module - Vision and Audio Processing
 
 This module contains the sensory input/output systems:
 - vision_face: Face emotion detection
+- face_detectors: Pluggable face detector backends
 - vision_hands: Hand gesture detection
+- gesture_classifiers: Learned (TFLite) hand gesture classifiers
+- frame_sources: Camera, video file, image directory and synthetic inputs
+- frame_capture: Threaded camera capture
+- frame_pool: Reused full-size frame buffers
+- shared_frame_ring: Shared-memory frame ring for multi-process pipelines
 - audio_output: Mood-based audio playback
 """
 
-from .vision_face import FaceEmotionDetector, EmotionResult, detect_emotion
-from .vision_hands import HandGestureDetector, HandGestureResult, detect_gesture
+from .vision_face import (
+    FaceEmotionDetector,
+    EmotionResult,
+    detect_emotion,
+    get_shared_face_detector,
+    release_shared_face_detector,
+)
+from .face_detectors import FaceDetectorBackend, FaceDetectionResult, create_face_detector
+from .vision_hands import (
+    HandGestureDetector,
+    HandGestureResult,
+    detect_gesture,
+    draw_hand_results,
+    get_shared_hand_detector,
+    release_shared_hand_detector,
+)
+from .gesture_classifiers import KeypointClassifier, PointHistoryClassifier
+from .frame_sources import (
+    FrameSource,
+    CameraSource,
+    VideoFileSource,
+    ImageDirectorySource,
+    SyntheticSource,
+    create_frame_source,
+)
+from .frame_capture import ThreadedCapture, CapturedFrame
+from .frame_pool import FrameBufferPool
+from .shared_frame_ring import SharedFrameRing, FrameRef
 from .audio_output import MoodAudioEngine, MockAudioEngine, create_audio_engine
 
 __all__ = [
@@ -16,10 +48,33 @@ __all__ = [
     "FaceEmotionDetector",
     "EmotionResult",
     "detect_emotion",
+    "get_shared_face_detector",
+    "release_shared_face_detector",
+    # Face detector backends
+    "FaceDetectorBackend",
+    "FaceDetectionResult",
+    "create_face_detector",
     # Hand gesture
     "HandGestureDetector",
     "HandGestureResult",
     "detect_gesture",
+    "draw_hand_results",
+    "get_shared_hand_detector",
+    "release_shared_hand_detector",
+    "KeypointClassifier",
+    "PointHistoryClassifier",
+    # Capture
+    "FrameSource",
+    "CameraSource",
+    "VideoFileSource",
+    "ImageDirectorySource",
+    "SyntheticSource",
+    "create_frame_source",
+    "ThreadedCapture",
+    "CapturedFrame",
+    "FrameBufferPool",
+    "SharedFrameRing",
+    "FrameRef",
     # Audio
     "MoodAudioEngine",
     "MockAudioEngine",
@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Face Detector Backends for Empathic-01 System
+
+Pluggable CPU-only face detectors used by FaceEmotionDetector:
+- haar: OpenCV Haar cascade (bundled with OpenCV)
+- dnn_ssd: OpenCV DNN ResNet-10 SSD (Caffe model)
+- yunet: OpenCV FaceDetectorYN (YuNet ONNX model)
+
+DNN SSD and YuNet load their model files from assets/models.
+Every backend times its own detect() calls.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Type
+from pathlib import Path
+import time
+
+import numpy as np
+import cv2 as cv
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import VisionConfig, DEFAULT_CONFIG, get_asset_path
+
+
+@dataclass
+class FaceDetectionResult:
+    """Result of face detection."""
+    bounding_box: Tuple[int, int, int, int]  # x, y, w, h
+    confidence: float
+
+
+def box_iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    """Intersection over union of two (x, y, w, h) boxes."""
+    ix = max(0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    intersection = ix * iy
+    union = a[2] * a[3] + b[2] * b[3] - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+class FaceDetectorBackend:
+    """
+    Base class for face detector backends.
+
+    Subclasses implement _detect(); detect() adds timing.
+    """
+
+    name = "base"
+
+    def __init__(self, config: Optional[VisionConfig] = None):
+        self.config = config or DEFAULT_CONFIG.vision
+        self.last_inference_ms = 0.0
+        self.total_inference_ms = 0.0
+        self.calls = 0
+
+    def _detect(self, image: np.ndarray, gray: np.ndarray) -> List[FaceDetectionResult]:
+        raise NotImplementedError
+
+    def detect(self, image: np.ndarray, gray: Optional[np.ndarray] = None) -> List[FaceDetectionResult]:
+        """
+        Detect all faces in a frame.
+
+        Args:
+            image: BGR image
+            gray: Grayscale version of image, if the caller already has one
+
+        Returns:
+            List of detected faces (may be empty)
+        """
+        if gray is None:
+            gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY)
+
+        start = time.perf_counter()
+        faces = self._detect(image, gray)
+        self.last_inference_ms = (time.perf_counter() - start) * 1000
+        self.total_inference_ms += self.last_inference_ms
+        self.calls += 1
+        return faces
+
+    @property
+    def mean_inference_ms(self) -> float:
+        """Mean detect() time over all calls."""
+        return self.total_inference_ms / self.calls if self.calls else 0.0
+
+    def reset_timing(self) -> None:
+        """Reset timing counters."""
+        self.last_inference_ms = 0.0
+        self.total_inference_ms = 0.0
+        self.calls = 0
+
+
+def _require_model_file(path: Path) -> str:
+    """Return path as str, raising a helpful error if the model file is missing."""
+    if not path.is_file():
+        raise FileNotFoundError(
+            f"Face detector model not found: {path} (see assets/models/README.md)"
+        )
+    return str(path)
+
+
+class HaarFaceDetector(FaceDetectorBackend):
+    """OpenCV Haar cascade detector (fastest, least accurate)."""
+
+    name = "haar"
+
+    def __init__(self, config: Optional[VisionConfig] = None, cascade_path: Optional[str] = None):
+        super().__init__(config)
+        cascade_path = cascade_path or cv.data.haarcascades + 'haarcascade_frontalface_default.xml'
+        self.face_cascade = cv.CascadeClassifier(cascade_path)
+        if self.face_cascade.empty():
+            raise FileNotFoundError(f"Haar cascade not found: {cascade_path}")
+
+    def _detect(self, image: np.ndarray, gray: np.ndarray) -> List[FaceDetectionResult]:
+        faces = self.face_cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(60, 60)
+        )
+        return [
+            FaceDetectionResult(bounding_box=(int(x), int(y), int(w), int(h)), confidence=0.8)
+            for x, y, w, h in faces
+        ]
+
+
+class DnnSsdFaceDetector(FaceDetectorBackend):
+    """OpenCV DNN ResNet-10 SSD detector (300x300 input)."""
+
+    name = "dnn_ssd"
+
+    PROTOTXT = "deploy.prototxt"
+    WEIGHTS = "res10_300x300_ssd_iter_140000.caffemodel"
+    INPUT_SIZE = (300, 300)
+    MEAN = (104.0, 177.0, 123.0)
+
+    def __init__(
+        self,
+        config: Optional[VisionConfig] = None,
+        prototxt_path: Optional[Path] = None,
+        weights_path: Optional[Path] = None,
+    ):
+        super().__init__(config)
+        prototxt = _require_model_file(prototxt_path or get_asset_path(self.PROTOTXT, "models"))
+        weights = _require_model_file(weights_path or get_asset_path(self.WEIGHTS, "models"))
+        self.net = cv.dnn.readNetFromCaffe(prototxt, weights)
+        self.net.setPreferableBackend(cv.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv.dnn.DNN_TARGET_CPU)
+
+    def _detect(self, image: np.ndarray, gray: np.ndarray) -> List[FaceDetectionResult]:
+        h, w = image.shape[:2]
+        blob = cv.dnn.blobFromImage(image, 1.0, self.INPUT_SIZE, self.MEAN)
+        self.net.setInput(blob)
+        detections = self.net.forward()[0, 0]  # (N, 7): _, _, conf, x1, y1, x2, y2
+
+        detections = detections[detections[:, 2] >= self.config.face_detection_confidence]
+        results = []
+        for confidence, x1, y1, x2, y2 in detections[:, 2:7]:
+            x1, x2 = int(max(0.0, x1) * w), int(min(1.0, x2) * w)
+            y1, y2 = int(max(0.0, y1) * h), int(min(1.0, y2) * h)
+            if x2 > x1 and y2 > y1:
+                results.append(FaceDetectionResult(
+                    bounding_box=(x1, y1, x2 - x1, y2 - y1),
+                    confidence=float(confidence),
+                ))
+        return results
+
+
+class YuNetFaceDetector(FaceDetectorBackend):
+    """OpenCV FaceDetectorYN (YuNet) detector."""
+
+    name = "yunet"
+
+    MODEL = "face_detection_yunet_2023mar.onnx"
+
+    def __init__(self, config: Optional[VisionConfig] = None, model_path: Optional[Path] = None):
+        super().__init__(config)
+        model = _require_model_file(model_path or get_asset_path(self.MODEL, "models"))
+        self._input_size = (self.config.frame_width, self.config.frame_height)
+        self.detector = cv.FaceDetectorYN.create(
+            model,
+            "",
+            self._input_size,
+            score_threshold=self.config.face_detection_confidence,
+            nms_threshold=0.3,
+            top_k=50,
+            backend_id=cv.dnn.DNN_BACKEND_OPENCV,
+            target_id=cv.dnn.DNN_TARGET_CPU,
+        )
+
+    def _detect(self, image: np.ndarray, gray: np.ndarray) -> List[FaceDetectionResult]:
+        h, w = image.shape[:2]
+        if self._input_size != (w, h):
+            self._input_size = (w, h)
+            self.detector.setInputSize(self._input_size)
+
+        _, faces = self.detector.detect(image)
+        if faces is None:
+            return []
+
+        # Rows: x, y, w, h, 5 landmark points (10 values), score.
+        # Boxes can extend past the frame edges; clip them to it.
+        results = []
+        for face in faces:
+            x, y, bw, bh = (int(v) for v in face[:4])
+            x1, y1 = max(0, x), max(0, y)
+            x2, y2 = min(w, x + bw), min(h, y + bh)
+            if x2 > x1 and y2 > y1:
+                results.append(FaceDetectionResult(
+                    bounding_box=(x1, y1, x2 - x1, y2 - y1),
+                    confidence=float(face[-1]),
+                ))
+        return results
+
+
+FACE_DETECTOR_BACKENDS: Dict[str, Type[FaceDetectorBackend]] = {
+    HaarFaceDetector.name: HaarFaceDetector,
+    DnnSsdFaceDetector.name: DnnSsdFaceDetector,
+    YuNetFaceDetector.name: YuNetFaceDetector,
+}
+
+
+def create_face_detector(
+    backend: str = "haar",
+    config: Optional[VisionConfig] = None
+) -> FaceDetectorBackend:
+    """
+    Factory function to create a face detector backend.
+
+    Raises:
+        ValueError: Unknown backend name
+        FileNotFoundError: Backend model file missing
+    """
+    try:
+        backend_cls = FACE_DETECTOR_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown face detector backend '{backend}' "
+            f"(choose from {', '.join(FACE_DETECTOR_BACKENDS)})"
+        ) from None
+    return backend_cls(config)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Threaded Frame Capture for Empathic-01 System
+
+Reads the camera (or any FrameSource) on a background thread so capture
+latency does not add to processing latency. Frames are decoded into a
+small preallocated ring and only the newest one is handed out; frames the
+consumer was too slow to pick up are counted as dropped instead of
+queueing in the driver.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+import threading
+import time
+
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import VisionConfig, DEFAULT_CONFIG
+from .frame_sources import FrameSource, create_frame_source
+
+
+@dataclass
+class CapturedFrame:
+    """Newest frame from the capture thread."""
+    frame: np.ndarray  # Ring slot; valid until the next read()/latest() call
+    timestamp: float  # time.time() when the frame was read
+    index: int  # Sequence number of the frame since open()
+
+
+class ThreadedCapture:
+    """
+    FrameSource reader with a capture thread and a latest-frame ring.
+
+    The ring holds `ring_size` (>= 3) frames: one being written, the newest
+    complete one, and the one the consumer currently holds, so the capture
+    thread never overwrites a frame that is still in use. read() mirrors
+    cv.VideoCapture.read() and blocks until a frame newer than the last
+    one returned is available.
+    """
+
+    def __init__(
+        self,
+        config: Optional[VisionConfig] = None,
+        source: Union[int, str, FrameSource, None] = None,
+        ring_size: int = 3
+    ):
+        """
+        Args:
+            config: Vision configuration (camera settings)
+            source: FrameSource, or a create_frame_source() spec
+                (default: config.camera_device)
+            ring_size: Preallocated frames in the ring (min 3)
+        """
+        self.config = config or DEFAULT_CONFIG.vision
+        if not isinstance(source, FrameSource):
+            source = create_frame_source(source, self.config)
+        self.source = source
+        self.ring_size = max(3, ring_size)
+
+        self._opened = False
+        self._ring: list = []
+        self._timestamps = [0.0] * self.ring_size
+        self._indices = [-1] * self.ring_size
+
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._latest = -1  # Slot of the newest complete frame
+        self._in_use = -1  # Slot last handed to the consumer
+        self._consumed_index = -1  # Sequence number last handed to the consumer
+        self._frames_read = 0
+        self._finished = False  # Source ended or failed
+
+        self.dropped_frames = 0
+        self.failed_reads = 0
+
+    def open(self) -> bool:
+        """
+        Open the source, read the first frame and start the capture thread.
+
+        Returns:
+            True if the source delivered a frame
+        """
+        if self._thread is not None:
+            # Previous capture thread (possibly still in a slow read) releases
+            # the source when it exits; let it finish before reopening
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if not self.source.open():
+            return False
+
+        # Size the ring from the first frame actually delivered
+        ret, first = self.source.read()
+        if not ret:
+            self.source.release()
+            return False
+        self._opened = True
+        self._ring = [first] + [np.empty_like(first) for _ in range(self.ring_size - 1)]
+        self._publish(0, time.time())
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ThreadedCapture", daemon=True)
+        self._thread.start()
+        return True
+
+    def isOpened(self) -> bool:
+        """True while the capture thread is delivering frames (cv.VideoCapture API)."""
+        return self._opened and not self._finished
+
+    def _publish(self, slot: int, timestamp: float) -> None:
+        """Make a freshly written slot the newest frame."""
+        with self._cond:
+            if self._latest >= 0 and self._indices[self._latest] > self._consumed_index:
+                self.dropped_frames += 1  # Newest frame replaced before anyone read it
+            self._timestamps[slot] = timestamp
+            self._indices[slot] = self._frames_read
+            self._frames_read += 1
+            self._latest = slot
+            self._cond.notify_all()
+
+    def _next_slot(self) -> int:
+        """A slot that is neither the newest frame nor held by the consumer."""
+        with self._cond:
+            busy = (self._latest, self._in_use)
+        for slot in range(self.ring_size):
+            if slot not in busy:
+                return slot
+        raise RuntimeError("capture ring too small")  # Unreachable with ring_size >= 3
+
+    def _run(self) -> None:
+        """
+        Capture thread: read into free ring slots until stopped.
+
+        The thread owns the source while it runs and releases it on exit,
+        so the source is never released in the middle of a read.
+        """
+        try:
+            while not self._stop.is_set():
+                slot = self._next_slot()
+                ret, frame = self.source.read(self._ring[slot])
+                if not ret:
+                    self.failed_reads += 1
+                    if not self.source.isOpened():
+                        break  # End of a recording
+                    time.sleep(0.005)
+                    continue
+                if frame is not self._ring[slot]:
+                    self._ring[slot] = frame  # Resolution changed; the source allocated a new buffer
+                self._publish(slot, time.time())
+        finally:
+            self.source.release()
+            with self._cond:
+                self._finished = True
+                self._cond.notify_all()
+
+    def latest(self, timeout: float = 1.0) -> Optional[CapturedFrame]:
+        """
+        Wait for a frame newer than the last one returned.
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            CapturedFrame, or None on timeout or when the source has ended
+        """
+        with self._cond:
+            ready = self._cond.wait_for(
+                lambda: self._finished or (
+                    self._latest >= 0 and self._indices[self._latest] > self._consumed_index
+                ),
+                timeout,
+            )
+            if not ready or self._indices[self._latest] <= self._consumed_index:
+                return None
+            slot = self._latest
+            self._in_use = slot
+            self._consumed_index = self._indices[slot]
+            return CapturedFrame(self._ring[slot], self._timestamps[slot], self._indices[slot])
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Newest frame, like cv.VideoCapture.read().
+
+        The returned array is a ring slot that stays untouched until the
+        next read(); copy it to keep it longer.
+        """
+        captured = self.latest()
+        if captured is None:
+            return False, None
+        return True, captured.frame
+
+    @property
+    def frames_read(self) -> int:
+        """Frames read from the source since open()."""
+        return self._frames_read
+
+    def release(self, timeout: float = 1.0) -> None:
+        """
+        Stop the capture thread, which releases the source.
+
+        A thread blocked in a slow source read is not waited on past
+        timeout; it releases the source as soon as that read returns.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                print("[ThreadedCapture] Capture thread still reading; "
+                      "the source is released when the read returns")
+            else:
+                self._thread = None
+        self._opened = False
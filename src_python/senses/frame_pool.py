@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Frame Buffer Pool for Empathic-01 System
+
+Preallocated full-size frame buffers for the per-frame path (mirrored
+frames, display frames), so the main loop does not allocate a new
+~1.5 MB array per stage per frame. Buffers are acquired for a frame and
+released when the frame is done; a pool that runs dry allocates and keeps
+the extra buffer, so it grows to what the pipeline actually holds in flight.
+"""
+
+from typing import List, Optional, Tuple
+import threading
+
+import numpy as np
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import VisionConfig, DEFAULT_CONFIG
+
+
+class FrameBufferPool:
+    """Thread-safe free list of equally shaped uint8 frame buffers."""
+
+    def __init__(self, shape: Tuple[int, ...], size: int = 4):
+        """
+        Args:
+            shape: Buffer shape, e.g. (height, width, 3)
+            size: Buffers to preallocate
+        """
+        self.shape = tuple(shape)
+        self._lock = threading.Lock()
+        self._free: List[np.ndarray] = [np.empty(self.shape, dtype=np.uint8) for _ in range(size)]
+        self.allocations = size  # Buffers allocated since creation (or the last reshape)
+
+    @classmethod
+    def from_config(cls, config: Optional[VisionConfig] = None, size: int = 4) -> "FrameBufferPool":
+        """Pool of color frames at the configured camera resolution."""
+        config = config or DEFAULT_CONFIG.vision
+        return cls((config.frame_height, config.frame_width, 3), size)
+
+    def acquire(self, shape: Optional[Tuple[int, ...]] = None) -> np.ndarray:
+        """
+        Take a buffer; its contents are undefined.
+
+        Args:
+            shape: Required shape (default: the pool's). Asking for another
+                shape (input resolution differs from the config) switches the
+                pool to it; buffers of the old shape are dropped on release.
+        """
+        with self._lock:
+            if shape is not None and tuple(shape) != self.shape:
+                self.shape = tuple(shape)
+                self._free.clear()
+                self.allocations = 0
+            if self._free:
+                return self._free.pop()
+            self.allocations += 1
+            shape = self.shape
+        return np.empty(shape, dtype=np.uint8)
+
+    def release(self, buffer: Optional[np.ndarray]) -> None:
+        """Return a buffer from acquire() for reuse; views and other shapes are ignored."""
+        if buffer is None or buffer.shape != self.shape or buffer.base is not None:
+            return
+        with self._lock:
+            if not any(free is buffer for free in self._free):
+                self._free.append(buffer)
+
+    @property
+    def free(self) -> int:
+        """Buffers currently available without allocating."""
+        return len(self._free)
@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Frame Sources for Empathic-01 System
+
+Pluggable inputs for the vision pipeline, all with the
+cv.VideoCapture open()/read()/isOpened()/release() API:
+- camera: live camera device
+- video: video file (or stream URL)
+- images: directory of still images, in name order
+- synthetic: generated frames, deterministic for a given seed
+
+Recorded and synthetic sources replay either in real time (paced to
+their frame rate, like a camera) or as fast as the consumer reads, so
+the whole pipeline can be benchmarked without a webcam.
+"""
+
+from typing import List, Optional, Tuple, Union
+from pathlib import Path
+import time
+
+import numpy as np
+import cv2 as cv
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import VisionConfig, DEFAULT_CONFIG
+
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class FrameSource:
+    """
+    Base class for frame sources.
+
+    Subclasses implement _open(), _read() and _release(); read() adds
+    real-time pacing and end-of-source handling.
+    """
+
+    name = "base"
+    live = False  # Live sources deliver frames in real time; read failures are transient
+
+    def __init__(self, fps: float = 30.0, realtime: bool = True):
+        """
+        Args:
+            fps: Nominal frame rate, used for pacing
+            realtime: Pace reads to fps (ignored for live sources)
+        """
+        self.fps = fps
+        self.realtime = realtime and not self.live
+        self.frames_read = 0
+        self._opened = False
+        self._ended = False
+        self._next_frame = 0.0
+
+    def _open(self) -> bool:
+        raise NotImplementedError
+
+    def _read(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        raise NotImplementedError
+
+    def _release(self) -> None:
+        pass
+
+    @property
+    def frame_count(self) -> int:
+        """Frames in the source, or 0 if unknown or endless."""
+        return 0
+
+    def open(self) -> bool:
+        """
+        Open the source.
+
+        Returns:
+            True if frames can be read
+        """
+        self._ended = False
+        self._opened = self._open()
+        self._next_frame = time.perf_counter()
+        return self._opened
+
+    def isOpened(self) -> bool:
+        """True until the source is released or, for recordings, runs out (cv.VideoCapture API)."""
+        return self._opened and not self._ended
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Next frame, like cv.VideoCapture.read().
+
+        Args:
+            image: Buffer to decode into if the frame size matches (no allocation)
+
+        Returns:
+            (success, BGR frame); (False, None) at the end of a recording
+        """
+        if not self.isOpened():
+            return False, None
+
+        if self.realtime:
+            now = time.perf_counter()
+            if self._next_frame > now:
+                time.sleep(self._next_frame - now)
+            # Don't burst to catch up after a slow consumer; a camera wouldn't either
+            self._next_frame = max(self._next_frame, now) + 1.0 / self.fps
+
+        frame = self._read(image)
+        if frame is None:
+            if not self.live:
+                self._ended = True
+            return False, None
+        self.frames_read += 1
+        return True, frame
+
+    def release(self) -> None:
+        """Close the source."""
+        if self._opened:
+            self._release()
+        self._opened = False
+
+
+class CameraSource(FrameSource):
+    """Live camera through cv.VideoCapture."""
+
+    name = "camera"
+    live = True
+
+    def __init__(self, device: int = 0, config: Optional[VisionConfig] = None):
+        self.config = config or DEFAULT_CONFIG.vision
+        super().__init__(fps=self.config.frame_rate)
+        self.device = device
+        self.capture: Optional[cv.VideoCapture] = None
+
+    def __str__(self) -> str:
+        return f"camera {self.device}"
+
+    def _open(self) -> bool:
+        self.capture = cv.VideoCapture(self.device)
+        if not self.capture.isOpened():
+            return False
+        self.capture.set(cv.CAP_PROP_FRAME_WIDTH, self.config.frame_width)
+        self.capture.set(cv.CAP_PROP_FRAME_HEIGHT, self.config.frame_height)
+        self.capture.set(cv.CAP_PROP_FPS, self.config.frame_rate)
+        # Keep at most one frame queued in the driver; ignored by backends without it
+        self.capture.set(cv.CAP_PROP_BUFFERSIZE, 1)
+        return True
+
+    def _read(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        ret, frame = self.capture.read(image) if image is not None else self.capture.read()
+        return frame if ret else None
+
+    def _release(self) -> None:
+        self.capture.release()
+        self.capture = None
+
+
+class VideoFileSource(FrameSource):
+    """Video file (or stream URL) through cv.VideoCapture."""
+
+    name = "video"
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False):
+        """
+        Args:
+            path: Video file or URL
+            realtime: Pace reads to the file's frame rate
+            loop: Start over at the end instead of ending
+        """
+        super().__init__(realtime=realtime)
+        self.path = str(path)
+        self.loop = loop
+        self.capture: Optional[cv.VideoCapture] = None
+
+    def __str__(self) -> str:
+        return f"video {self.path}"
+
+    @property
+    def frame_count(self) -> int:
+        if self.capture is None or self.loop:
+            return 0
+        return max(0, int(self.capture.get(cv.CAP_PROP_FRAME_COUNT)))
+
+    def _open(self) -> bool:
+        self.capture = cv.VideoCapture(self.path)
+        if not self.capture.isOpened():
+            return False
+        self.fps = self.capture.get(cv.CAP_PROP_FPS) or self.fps
+        return True
+
+    def _read(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        ret, frame = self.capture.read(image) if image is not None else self.capture.read()
+        if not ret and self.loop and self.frames_read > 0:
+            self.capture.set(cv.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.capture.read(image) if image is not None else self.capture.read()
+        return frame if ret else None
+
+    def _release(self) -> None:
+        self.capture.release()
+        self.capture = None
+
+
+class ImageDirectorySource(FrameSource):
+    """Still images from a directory, in file name order; unreadable files are skipped."""
+
+    name = "images"
+
+    def __init__(self, path: str, fps: float = 30.0, realtime: bool = True, loop: bool = False):
+        """
+        Args:
+            path: Directory with .jpg/.jpeg/.png/.bmp images
+            fps: Frame rate to replay at when realtime
+            realtime: Pace reads to fps
+            loop: Start over after the last image instead of ending
+        """
+        super().__init__(fps=fps, realtime=realtime)
+        self.path = Path(path)
+        self.loop = loop
+        self._paths: List[Path] = []
+        self._position = 0
+
+    def __str__(self) -> str:
+        return f"images {self.path} ({len(self._paths)})"
+
+    @property
+    def frame_count(self) -> int:
+        return 0 if self.loop else len(self._paths)
+
+    def _open(self) -> bool:
+        if not self.path.is_dir():
+            return False
+        self._paths = sorted(p for p in self.path.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+        self._position = 0
+        return bool(self._paths)
+
+    def _read(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        skipped = 0
+        while skipped < len(self._paths):
+            if self._position >= len(self._paths):
+                if not self.loop:
+                    return None
+                self._position = 0
+            frame = cv.imread(str(self._paths[self._position]))
+            self._position += 1
+            if frame is None:
+                skipped += 1
+                continue
+            if image is not None and image.shape == frame.shape:
+                np.copyto(image, frame)
+                return image
+            return frame
+        return None
+
+
+class SyntheticSource(FrameSource):
+    """
+    Generated frames: a fixed noisy gradient with a disc and a box moving
+    across it. The same seed always gives the same frames.
+    """
+
+    name = "synthetic"
+
+    def __init__(
+        self,
+        width: int = 960,
+        height: int = 540,
+        frames: int = 300,
+        fps: float = 30.0,
+        realtime: bool = True,
+        loop: bool = False,
+        seed: int = 0
+    ):
+        """
+        Args:
+            width, height: Frame size
+            frames: Frames per pass (0 = endless)
+            fps: Frame rate to replay at when realtime
+            realtime: Pace reads to fps
+            loop: Start over after `frames` frames instead of ending
+            seed: Background noise seed
+        """
+        super().__init__(fps=fps, realtime=realtime)
+        self.width = width
+        self.height = height
+        self.frames = frames
+        self.loop = loop
+        self.seed = seed
+        self._background: Optional[np.ndarray] = None
+        self._position = 0
+
+    def __str__(self) -> str:
+        return f"synthetic {self.width}x{self.height}"
+
+    @property
+    def frame_count(self) -> int:
+        return 0 if self.loop else self.frames
+
+    def _open(self) -> bool:
+        rng = np.random.default_rng(self.seed)
+        gradient = np.linspace(40, 200, self.width, dtype=np.float32)
+        background = np.empty((self.height, self.width, 3), dtype=np.float32)
+        background[:] = gradient[None, :, None]
+        background += rng.normal(0.0, 8.0, background.shape).astype(np.float32)
+        self._background = np.clip(background, 0, 255).astype(np.uint8)
+        self._position = 0
+        return True
+
+    def _read(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if self.frames and self._position >= self.frames:
+            if not self.loop:
+                return None
+            self._position = 0
+
+        if image is None or image.shape != self._background.shape:
+            image = np.empty_like(self._background)
+        np.copyto(image, self._background)
+
+        t = self._position / self.fps
+        w, h = self.width, self.height
+        center = (int(w * (0.5 + 0.35 * np.cos(t))), int(h * (0.5 + 0.3 * np.sin(2 * t))))
+        cv.circle(image, center, h // 8, (60, 120, 220), -1, cv.LINE_AA)
+        x = int((self._position * 4) % w)
+        cv.rectangle(image, (x, h // 6), (x + w // 10, h // 6 + h // 8), (230, 230, 230), -1)
+        self._position += 1
+        return image
+
+    def _release(self) -> None:
+        self._background = None
+
+
+def create_frame_source(
+    source: Union[int, str, None] = None,
+    config: Optional[VisionConfig] = None,
+    realtime: bool = True,
+    loop: bool = False
+) -> FrameSource:
+    """
+    Factory function to create a frame source from a CLI-style spec.
+
+    Args:
+        source: Camera index ("0" also works), video file or URL, image
+            directory, or "synthetic" / "synthetic:FRAMES" (0 = endless).
+            None uses config.camera_device.
+        config: Vision configuration (camera settings, synthetic frame size)
+        realtime: Pace recorded and synthetic input to its frame rate
+        loop: Restart recorded and synthetic input at the end
+
+    Raises:
+        ValueError: Malformed synthetic spec
+    """
+    config = config or DEFAULT_CONFIG.vision
+    if source is None:
+        source = config.camera_device
+    if isinstance(source, int) or str(source).isdigit():
+        return CameraSource(int(source), config)
+
+    spec = str(source)
+    if spec == "synthetic" or spec.startswith("synthetic:"):
+        _, _, frames = spec.partition(":")
+        return SyntheticSource(
+            config.frame_width, config.frame_height,
+            frames=int(frames) if frames else 300,
+            fps=config.frame_rate, realtime=realtime, loop=loop,
+        )
+    if Path(spec).is_dir():
+        return ImageDirectorySource(spec, fps=config.frame_rate, realtime=realtime, loop=loop)
+    return VideoFileSource(spec, realtime=realtime, loop=loop)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Learned Gesture Classifiers for Empathic-01 System
+
+TFLite models shipped with the web frontend (public/models/hand_gesture),
+run on CPU from Python:
+- KeypointClassifier: static hand pose from the 21 landmarks
+- PointHistoryClassifier: motion gesture from the index finger tip trail
+
+The TFLite interpreter comes from ai-edge-litert, tflite-runtime or
+TensorFlow, whichever is installed.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import time
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import GestureLabel, MotionGestureLabel
+
+
+HAND_GESTURE_MODEL_DIR = Path(__file__).parent.parent.parent / "public" / "models" / "hand_gesture"
+
+# keypoint_classifier_label.csv rows -> GestureLabel
+KEYPOINT_LABEL_MAP: Dict[str, GestureLabel] = {
+    "Open": GestureLabel.OPEN_PALM,
+    "Close": GestureLabel.CLOSED_FIST,
+    "Pointer": GestureLabel.INDEX_POINTING,
+    "OK": GestureLabel.OK_SIGN,
+}
+
+# point_history_classifier_label.csv rows -> MotionGestureLabel
+POINT_HISTORY_LABEL_MAP: Dict[str, MotionGestureLabel] = {
+    "Stop": MotionGestureLabel.STOP,
+    "Clockwise": MotionGestureLabel.CLOCKWISE,
+    "Counter Clockwise": MotionGestureLabel.COUNTER_CLOCKWISE,
+    "Move": MotionGestureLabel.MOVE,
+}
+
+
+def load_tflite_interpreter(model_path: Path, num_threads: int = 1):
+    """
+    Create a TFLite interpreter from whichever runtime is installed.
+
+    Raises:
+        ImportError: No TFLite runtime available
+        FileNotFoundError: Model file missing
+    """
+    if not Path(model_path).is_file():
+        raise FileNotFoundError(f"TFLite model not found: {model_path}")
+
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            try:
+                from tensorflow.lite import Interpreter
+            except ImportError:
+                raise ImportError(
+                    "No TFLite runtime found (install ai-edge-litert, tflite-runtime or tensorflow)"
+                ) from None
+
+    interpreter = Interpreter(model_path=str(model_path), num_threads=num_threads)
+    interpreter.allocate_tensors()
+    return interpreter
+
+
+def read_labels(label_path: Path) -> List[str]:
+    """Read a one-label-per-line CSV as shipped next to the models."""
+    with open(label_path, encoding="utf-8-sig") as f:
+        return [line.strip().split(",")[0] for line in f if line.strip()]
+
+
+class KeypointClassifier:
+    """
+    Static hand gesture classifier over MediaPipe hand landmarks.
+
+    Landmarks are converted to pixel offsets from the wrist, flattened to
+    42 values and scaled by their max absolute value, matching how the
+    bundled model was trained. All hands in a frame run in one invoke().
+    """
+
+    MODEL = "keypoint_classifier.tflite"
+    LABELS = "keypoint_classifier_label.csv"
+
+    def __init__(
+        self,
+        model_path: Optional[Path] = None,
+        label_path: Optional[Path] = None,
+        num_threads: int = 1
+    ):
+        self.interpreter = load_tflite_interpreter(
+            model_path or HAND_GESTURE_MODEL_DIR / self.MODEL, num_threads
+        )
+        self._input_index = self.interpreter.get_input_details()[0]["index"]
+        self._output_index = self.interpreter.get_output_details()[0]["index"]
+        self._batch_size = int(self.interpreter.get_input_details()[0]["shape"][0])
+
+        labels = read_labels(label_path or HAND_GESTURE_MODEL_DIR / self.LABELS)
+        self.labels = [KEYPOINT_LABEL_MAP.get(label, GestureLabel.NONE) for label in labels]
+
+        self.last_inference_ms = 0.0
+
+    @staticmethod
+    def preprocess(landmarks: np.ndarray, image_size: Tuple[int, int]) -> np.ndarray:
+        """
+        Build the model input for a stack of hands.
+
+        Args:
+            landmarks: (n, 21, 3) normalized landmarks
+            image_size: (width, height) of the frame the landmarks came from
+
+        Returns:
+            (n, 42) float32 input rows
+        """
+        w, h = image_size
+        points = landmarks[:, :, :2] * np.array((w, h), dtype=np.float32)
+        points -= points[:, :1]  # Relative to the wrist
+        flat = points.reshape(len(points), 42)
+
+        scale = np.abs(flat).max(axis=1, keepdims=True)
+        np.divide(flat, scale, out=flat, where=scale > 0)
+        return flat
+
+    def _resize_batch(self, n: int) -> None:
+        """Resize the input tensor only when the number of hands changes."""
+        if n != self._batch_size:
+            self.interpreter.resize_tensor_input(self._input_index, [n, 42])
+            self.interpreter.allocate_tensors()
+            self._batch_size = n
+
+    def classify(
+        self,
+        landmarks: np.ndarray,
+        image_size: Tuple[int, int]
+    ) -> List[Tuple[GestureLabel, float]]:
+        """
+        Classify every hand in one model call.
+
+        Args:
+            landmarks: (n, 21, 3) normalized landmarks
+            image_size: (width, height) of the frame
+
+        Returns:
+            (gesture label, confidence) per hand
+        """
+        if len(landmarks) == 0:
+            return []
+
+        start = time.perf_counter()
+        self._resize_batch(len(landmarks))
+        self.interpreter.set_tensor(self._input_index, self.preprocess(landmarks, image_size))
+        self.interpreter.invoke()
+        scores = self.interpreter.get_tensor(self._output_index)
+        self.last_inference_ms = (time.perf_counter() - start) * 1000
+
+        best = scores.argmax(axis=1)
+        return [
+            (self.labels[i], float(scores[row, i]))
+            for row, i in enumerate(best.tolist())
+        ]
+
+
+class PointHistoryClassifier:
+    """
+    Motion gesture classifier over the last 16 index finger tip positions.
+
+    Points are taken relative to the oldest one and divided by the frame
+    size, giving the model's 32-value input. The input buffer is reused
+    across calls.
+    """
+
+    MODEL = "point_history_classifier.tflite"
+    LABELS = "point_history_classifier_label.csv"
+    HISTORY_LENGTH = 16
+
+    def __init__(
+        self,
+        model_path: Optional[Path] = None,
+        label_path: Optional[Path] = None,
+        num_threads: int = 1,
+        score_threshold: float = 0.5
+    ):
+        self.interpreter = load_tflite_interpreter(
+            model_path or HAND_GESTURE_MODEL_DIR / self.MODEL, num_threads
+        )
+        self._input_index = self.interpreter.get_input_details()[0]["index"]
+        self._output_index = self.interpreter.get_output_details()[0]["index"]
+        self._input = np.zeros((1, self.HISTORY_LENGTH * 2), dtype=np.float32)
+
+        labels = read_labels(label_path or HAND_GESTURE_MODEL_DIR / self.LABELS)
+        self.labels = [POINT_HISTORY_LABEL_MAP.get(label, MotionGestureLabel.NONE) for label in labels]
+        self.score_threshold = score_threshold
+
+        self.last_inference_ms = 0.0
+
+    def classify(
+        self,
+        points: np.ndarray,
+        image_size: Tuple[int, int]
+    ) -> Tuple[MotionGestureLabel, float]:
+        """
+        Classify a full point history.
+
+        Args:
+            points: (16, 2) pixel positions, oldest first
+            image_size: (width, height) of the frame
+
+        Returns:
+            (motion label, confidence); NONE below the score threshold
+        """
+        start = time.perf_counter()
+        offsets = self._input.reshape(self.HISTORY_LENGTH, 2)
+        np.subtract(points, points[0], out=offsets, casting="unsafe")
+        offsets /= image_size
+
+        self.interpreter.set_tensor(self._input_index, self._input)
+        self.interpreter.invoke()
+        scores = self.interpreter.get_tensor(self._output_index)[0]
+        self.last_inference_ms = (time.perf_counter() - start) * 1000
+
+        best = int(scores.argmax())
+        confidence = float(scores[best])
+        if confidence < self.score_threshold:
+            return MotionGestureLabel.NONE, confidence
+        return self.labels[best], confidence
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Shared-Memory Frame Ring for Empathic-01 System
+
+A fixed number of fixed-size frame slots in one
+multiprocessing.shared_memory block, so pipeline processes exchange
+frames without pickling them. Only FrameRef (slot, sequence, timestamp)
+values travel between processes.
+
+Each slot has a sequence number in the block header. The writer sets it
+to WRITING before filling the slot and to the new frame's sequence
+afterwards. A reader checks the number again when done with a slot and
+knows whether the frame changed under it.
+"""
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+WRITING = -1  # Slot sequence while the writer is filling it
+
+
+@dataclass(frozen=True)
+class FrameRef:
+    """Reference to a frame in the ring, small enough to send through a queue."""
+    slot: int
+    sequence: int
+    timestamp: float
+
+
+class SharedFrameRing:
+    """
+    Ring of uint8 frames in shared memory.
+
+    Layout: [latest sequence, latest slot, slot sequences...] as int64 and
+    slot timestamps as float64, padded to 64 bytes, followed by the frame
+    slots. The main process creates the block (create=True); pipeline
+    processes attach by name (create=False), one of them as the writer.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, int, int],
+        slots: int = 6,
+        name: Optional[str] = None,
+        create: bool = True
+    ):
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.frame_bytes = int(np.prod(self.shape))
+        header_bytes = -(-(2 + 2 * slots) * 8 // 64) * 64
+        size = header_bytes + slots * self.frame_bytes
+
+        self._shm = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+        self._owner = create
+
+        self._header = np.ndarray((2 + slots,), dtype=np.int64, buffer=self._shm.buf)
+        self._timestamps = np.ndarray(
+            (slots,), dtype=np.float64, buffer=self._shm.buf, offset=(2 + slots) * 8
+        )
+        self._frames = np.ndarray(
+            (slots, *self.shape), dtype=np.uint8, buffer=self._shm.buf, offset=header_bytes
+        )
+        if create:
+            self._header[:] = WRITING
+            self._timestamps[:] = 0.0
+
+        # A (re)started writer continues after the newest published frame
+        latest_sequence, latest_slot = int(self._header[0]), int(self._header[1])
+        self._next_sequence = latest_sequence + 1 if latest_sequence >= 0 else 0
+        self._next_slot = (latest_slot + 1) % slots if latest_slot >= 0 else 0
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name, for attaching from other processes."""
+        return self._shm.name
+
+    def begin_write(self) -> Tuple[int, np.ndarray]:
+        """
+        Claim the next slot for writing.
+
+        Returns:
+            (slot, writable frame view); fill it, then call end_write()
+        """
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.slots
+        self._header[2 + slot] = WRITING
+        return slot, self._frames[slot]
+
+    def end_write(self, slot: int, timestamp: float) -> FrameRef:
+        """Publish a slot filled after begin_write()."""
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self._timestamps[slot] = timestamp
+        self._header[2 + slot] = sequence
+        self._header[1] = slot
+        self._header[0] = sequence
+        return FrameRef(slot, sequence, timestamp)
+
+    def write(self, frame: np.ndarray, timestamp: float) -> FrameRef:
+        """Copy a frame into the next slot and publish it."""
+        slot, view = self.begin_write()
+        np.copyto(view, frame)
+        return self.end_write(slot, timestamp)
+
+    def latest(self) -> Optional[FrameRef]:
+        """The newest published frame, or None before the first one."""
+        sequence, slot = int(self._header[0]), int(self._header[1])
+        if sequence < 0:
+            return None
+        return FrameRef(slot, sequence, float(self._timestamps[slot]))
+
+    def view(self, ref: FrameRef) -> np.ndarray:
+        """Read-only view of a frame (no copy); check is_current() when done with it."""
+        frame = self._frames[ref.slot]
+        frame.flags.writeable = False
+        return frame
+
+    def is_current(self, ref: FrameRef) -> bool:
+        """Whether the frame's slot has not been overwritten since it was published."""
+        return int(self._header[2 + ref.slot]) == ref.sequence
+
+    def copy(self, ref: FrameRef, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Copy a frame out of the ring.
+
+        Returns:
+            The copy, or None if the slot was overwritten before or during the copy
+        """
+        if not self.is_current(ref):
+            return None
+        if out is None:
+            out = np.empty(self.shape, dtype=np.uint8)
+        np.copyto(out, self._frames[ref.slot])
+        return out if self.is_current(ref) else None
+
+    def close(self) -> None:
+        """Detach from the block; the creating process also unlinks it."""
+        # Drop numpy views first, or SharedMemory.close() fails on exported buffers
+        self._header = None
+        self._timestamps = None
+        self._frames = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
@@ -12,6 +12,7 @@ from typing import Optional, List, Tuple, Dict, Any
 import numpy as np
 import cv2 as cv
 from collections import deque
+import threading
 import time
 
 import sys
@@ -19,13 +20,235 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.config import EmotionLabel, VisionConfig, DEFAULT_CONFIG
+from .face_detectors import (
+    FaceDetectionResult,
+    FaceDetectorBackend,
+    HaarFaceDetector,
+    box_iou,
+    create_face_detector,
+)
+from .gesture_classifiers import load_tflite_interpreter
+
+
+# Fixed score vector layout: index i holds the score for EMOTION_LABELS[i]
+EMOTION_LABELS: Tuple[EmotionLabel, ...] = tuple(EmotionLabel)
+EMOTION_INDEX: Dict[str, int] = {label.value: i for i, label in enumerate(EMOTION_LABELS)}
+NUM_EMOTIONS = len(EMOTION_LABELS)
+_EMOTION_VALUES: Tuple[str, ...] = tuple(label.value for label in EMOTION_LABELS)
+
+# DeepFace emotion model input size and output order
+EMOTION_INPUT_SIZE = (48, 48)
+DEEPFACE_EMOTION_ORDER = ("angry", "disgust", "fear", "happy", "sad", "surprise", "neutral")
+
+# Face thumbnail size for the temporal change gate
+CHANGE_THUMBNAIL_SIZE = (16, 16)
+
+# Bundled mini-Xception FER2013 model (cheap cascade tier); same label order as DeepFace
+CHEAP_EMOTION_MODEL_PATH = (
+    Path(__file__).parent.parent / "assets" / "models" / "emotion_mini_xception.tflite"
+)
+CHEAP_EMOTION_ORDER = DEEPFACE_EMOTION_ORDER
+
+_INV_255 = np.float32(1.0 / 255.0)
+_INV_127_5 = np.float32(2.0 / 255.0)
+
+
+def scores_to_vector(scores: Dict[str, float], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Pack a name -> score dict into a float32 score vector (unknown names ignored)."""
+    if out is None:
+        out = np.zeros(NUM_EMOTIONS, dtype=np.float32)
+    else:
+        out.fill(0.0)
+    for name, score in scores.items():
+        index = EMOTION_INDEX.get(name.lower())
+        if index is not None:
+            out[index] = score
+    return out
+
+
+def scores_to_dict(scores: np.ndarray) -> Dict[str, float]:
+    """Dict view of a score vector, used only for output."""
+    # tolist() converts to Python floats in one C call instead of per element
+    return dict(zip(_EMOTION_VALUES, scores.tolist()))
+
+
+def _bar_polygons(left: int, tops: np.ndarray, rights: np.ndarray, height: int) -> np.ndarray:
+    """(n, 4, 2) int32 corners of horizontal bars, for a single cv.fillPoly() call."""
+    bottoms = tops + height
+    return np.stack([
+        np.stack([np.full_like(tops, left), tops], axis=1),
+        np.stack([rights, tops], axis=1),
+        np.stack([rights, bottoms], axis=1),
+        np.stack([np.full_like(tops, left), bottoms], axis=1),
+    ], axis=1).astype(np.int32)
+
+
+class FacePreprocessor:
+    """
+    Per-frame face preprocessing into preallocated buffers.
 
+    The grayscale frame buffer is sized from the configured frame dimensions,
+    and each emotion model input batch from the configured batch size (one
+    batch buffer per model input size). All are reallocated only if a larger
+    input arrives, so steady-state frames do no array allocation. Face crops
+    are views into the frame.
+    """
+
+    def __init__(self, frame_width: int, frame_height: int, max_faces: int = 1):
+        self.gray = np.empty((frame_height, frame_width), dtype=np.uint8)
+        self._max_faces = max(1, max_faces)
+        self._resized: Dict[Tuple[int, int], np.ndarray] = {}
+        self._batches: Dict[Tuple[int, int], np.ndarray] = {}
+        self._allocate(EMOTION_INPUT_SIZE)
+
+    def _allocate(self, input_size: Tuple[int, int]) -> None:
+        """Create the resize and batch buffers for one model input size."""
+        self._resized[input_size] = np.empty(input_size[::-1], dtype=np.uint8)
+        self._batches[input_size] = np.empty(
+            (self._max_faces, *input_size[::-1], 1), dtype=np.float32
+        )
+
+    def to_gray(self, image: np.ndarray) -> np.ndarray:
+        """Convert a BGR frame to grayscale into the reused gray buffer."""
+        if self.gray.shape != image.shape[:2]:
+            self.gray = np.empty(image.shape[:2], dtype=np.uint8)
+        cv.cvtColor(image, cv.COLOR_BGR2GRAY, dst=self.gray)
+        return self.gray
+
+    @staticmethod
+    def padded_box(
+        face_box: Tuple[int, int, int, int],
+        image_shape: Tuple[int, ...]
+    ) -> Tuple[int, int, int, int]:
+        """Get face crop corners (x1, y1, x2, y2) with 20% padding, clipped to the image."""
+        x, y, w, h = face_box
+        pad = int(max(w, h) * 0.2)
+        x1 = max(0, x - pad)
+        y1 = max(0, y - pad)
+        x2 = min(image_shape[1], x + w + pad)
+        y2 = min(image_shape[0], y + h + pad)
+        return x1, y1, x2, y2
+
+    def crop(self, image: np.ndarray, face_box: Tuple[int, int, int, int]) -> np.ndarray:
+        """Padded face crop as a view into image (no copy)."""
+        x1, y1, x2, y2 = self.padded_box(face_box, image.shape)
+        return image[y1:y2, x1:x2]
+
+    def emotion_batch(
+        self,
+        gray: np.ndarray,
+        face_boxes: List[Tuple[int, int, int, int]],
+        input_size: Tuple[int, int] = EMOTION_INPUT_SIZE,
+        centered: bool = False
+    ) -> np.ndarray:
+        """
+        Build the emotion model input for all faces.
+
+        Each padded crop is resized to input_size into a reused buffer and
+        scaled directly into its batch slot.
+
+        Args:
+            gray: Grayscale frame
+            face_boxes: Face boxes (x, y, w, h) in frame coordinates
+            input_size: Model input (width, height); DeepFace uses 48x48
+            centered: Scale to [-1, 1] instead of [0, 1]
+
+        Returns:
+            (num_faces, height, width, 1) float32 view into a reused batch buffer
+        """
+        input_size = tuple(input_size)
+        if input_size not in self._batches:
+            self._allocate(input_size)
+        batch = self._batches[input_size]
+        resized = self._resized[input_size]
+
+        count = len(face_boxes)
+        if count > len(batch):
+            batch = self._batches[input_size] = np.empty((count, *batch.shape[1:]), dtype=np.float32)
+
+        for slot, face_box in enumerate(face_boxes):
+            cv.resize(self.crop(gray, face_box), input_size, dst=resized,
+                      interpolation=cv.INTER_AREA)
+            # Cast then scale in place (a mixed-type multiply would allocate a cast buffer)
+            face = batch[slot, :, :, 0]
+            np.copyto(face, resized)
+            if centered:
+                face *= _INV_127_5
+                face -= 1.0
+            else:
+                face *= _INV_255
+        return batch[:count]
+
+    def thumbnail(
+        self,
+        gray: np.ndarray,
+        face_box: Tuple[int, int, int, int],
+        out: np.ndarray
+    ) -> np.ndarray:
+        """Downscale the padded face crop into out (CHANGE_THUMBNAIL_SIZE, uint8)."""
+        cv.resize(self.crop(gray, face_box), CHANGE_THUMBNAIL_SIZE, dst=out,
+                  interpolation=cv.INTER_AREA)
+        return out
 
-@dataclass
-class FaceDetectionResult:
-    """Result of face detection."""
-    bounding_box: Tuple[int, int, int, int]  # x, y, w, h
-    confidence: float
+
+class TFLiteEmotionModel:
+    """
+    Grayscale emotion CNN run through the TFLite interpreter.
+
+    Used as the cascade's cheap tier. Exposes predict_on_batch like a Keras
+    model; all faces in a frame run in one invoke(), and the input tensor is
+    resized only when the number of faces changes.
+    """
+
+    def __init__(
+        self,
+        model_path: Path = CHEAP_EMOTION_MODEL_PATH,
+        labels: Tuple[str, ...] = CHEAP_EMOTION_ORDER,
+        centered: bool = True,
+        num_threads: int = 1
+    ):
+        """
+        Args:
+            model_path: TFLite model with a (1, h, w, 1) float32 input
+            labels: Emotion name for each model output, in output order
+            centered: Model expects inputs in [-1, 1] instead of [0, 1]
+            num_threads: Interpreter threads
+
+        Raises:
+            ImportError: No TFLite runtime available
+            FileNotFoundError: Model file missing
+            ValueError: Output size does not match labels
+        """
+        self.interpreter = load_tflite_interpreter(model_path, num_threads)
+        input_details = self.interpreter.get_input_details()[0]
+        output_details = self.interpreter.get_output_details()[0]
+        self._input_index = input_details["index"]
+        self._output_index = output_details["index"]
+        self._batch_size = int(input_details["shape"][0])
+
+        _, height, width, _ = (int(d) for d in input_details["shape"])
+        self.input_size = (width, height)
+        self.centered = centered
+        self.labels = tuple(labels)
+        if int(output_details["shape"][-1]) != len(self.labels):
+            raise ValueError(
+                f"{Path(model_path).name} has {output_details['shape'][-1]} outputs, "
+                f"expected {len(self.labels)} ({', '.join(self.labels)})"
+            )
+
+    def _resize_batch(self, n: int) -> None:
+        """Resize the input tensor only when the number of faces changes."""
+        if n != self._batch_size:
+            self.interpreter.resize_tensor_input(self._input_index, [n, *self.input_size[::-1], 1])
+            self.interpreter.allocate_tensors()
+            self._batch_size = n
+
+    def predict_on_batch(self, batch: np.ndarray) -> np.ndarray:
+        """(num_faces, h, w, 1) input batch -> (num_faces, len(labels)) scores."""
+        self._resize_batch(len(batch))
+        self.interpreter.set_tensor(self._input_index, batch)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output_index)
 
 
 @dataclass
@@ -37,13 +260,193 @@ class EmotionResult:
     face_box: Tuple[int, int, int, int]
     timestamp: float
     inference_time_ms: float
+    scores_reused: bool = False  # Face unchanged, previous model scores reused
+    track_id: int = 0  # Stable per-face ID across frames
+
+
+class FaceTrack:
+    """
+    Tracking, smoothing and stability state for one face.
+
+    Kept compact (a few small preallocated arrays) so many faces can be
+    tracked at once.
+    """
+
+    BOX_SMOOTHING_ALPHA = 0.3
+    SCORE_SMOOTHING_ALPHA = 0.3
+
+    def __init__(self, track_id: int, box: Tuple[int, int, int, int]):
+        self.track_id = track_id
+        self.box = box
+        self.missed_frames = 0
+
+        # Score smoothing and stability
+        self.smoothed_scores = np.zeros(NUM_EMOTIONS, dtype=np.float32)
+        self._scores_initialized = False
+        self._score_delta = np.zeros(NUM_EMOTIONS, dtype=np.float32)
+        self._history: deque = deque(maxlen=5)  # Label indices
+        self._counts = np.zeros(NUM_EMOTIONS, dtype=np.int32)  # Mode counter over history
+        self.stable_emotion: EmotionLabel = EmotionLabel.NEUTRAL
+
+        # Temporal change gate: thumbnail and scores of the last classified crop
+        self.gate_thumbnail = np.zeros(CHANGE_THUMBNAIL_SIZE[::-1], dtype=np.uint8)
+        self.gate_candidate = np.zeros(CHANGE_THUMBNAIL_SIZE[::-1], dtype=np.uint8)
+        self.gate_scores = np.zeros(NUM_EMOTIONS, dtype=np.float32)
+        self.gate_valid = False
+        self.gate_age = 0
+
+        # Cascade: DeepFace classifications of this face so far
+        self.expensive_runs = 0
+
+    def update_box(self, new_box: Tuple[int, int, int, int]) -> None:
+        """Apply smoothing to the face bounding box."""
+        alpha = self.BOX_SMOOTHING_ALPHA
+        self.box = tuple(
+            int(alpha * new + (1 - alpha) * old)
+            for new, old in zip(new_box, self.box)
+        )
+        self.missed_frames = 0
+
+    def _smooth_scores(self, scores: np.ndarray) -> np.ndarray:
+        """Apply exponential moving average to the score vector in place."""
+        smoothed = self.smoothed_scores
+        if not self._scores_initialized:
+            np.copyto(smoothed, scores)
+            self._scores_initialized = True
+            return smoothed
+
+        # smoothed += alpha * (scores - smoothed)
+        np.subtract(scores, smoothed, out=self._score_delta)
+        self._score_delta *= self.SCORE_SMOOTHING_ALPHA
+        smoothed += self._score_delta
+        return smoothed
+
+    def _stabilize(self, index: int) -> EmotionLabel:
+        """Apply stability filtering to prevent rapid emotion changes."""
+        history = self._history
+        if len(history) == history.maxlen:
+            self._counts[history[0]] -= 1
+        history.append(index)
+        self._counts[index] += 1
+
+        if len(history) < 3:
+            return EMOTION_LABELS[index]
+
+        mode = int(self._counts.argmax())
+        if self._counts[mode] >= 3:
+            self.stable_emotion = EMOTION_LABELS[mode]
+
+        return self.stable_emotion
+
+    def postprocess(self, scores: np.ndarray) -> Tuple[EmotionLabel, float, np.ndarray]:
+        """
+        Smooth raw scores and pick the stable emotion.
+
+        Returns:
+            Tuple of (stable emotion, confidence, smoothed score vector)
+        """
+        smoothed = self._smooth_scores(scores)
+        dominant = int(smoothed.argmax())
+        return self._stabilize(dominant), float(smoothed[dominant]), smoothed
+
+    def remember_classification(self, scores: np.ndarray) -> None:
+        """Store freshly classified scores and their thumbnail for the change gate."""
+        np.copyto(self.gate_scores, scores)
+        self.gate_thumbnail, self.gate_candidate = self.gate_candidate, self.gate_thumbnail
+        self.gate_valid = True
+        self.gate_age = 0
+
+
+class FaceTracker:
+    """
+    Assigns stable IDs to faces across frames.
+
+    Detections are matched to existing tracks greedily by IoU, then by
+    centroid distance for fast motion. Tracks that go unmatched for more
+    than max_missed_frames frames are evicted.
+    """
+
+    def __init__(
+        self,
+        max_missed_frames: int = 5,
+        iou_threshold: float = 0.3,
+        max_center_distance: float = 0.5,
+    ):
+        self.max_missed_frames = max_missed_frames
+        self.iou_threshold = iou_threshold
+        self.max_center_distance = max_center_distance  # Fraction of the track's box size
+        self.tracks: List[FaceTrack] = []
+        self._next_id = 1
+
+    def _center_distance(self, track: FaceTrack, box: Tuple[int, int, int, int]) -> float:
+        """Centroid distance normalized by the track's box size."""
+        tx, ty, tw, th = track.box
+        x, y, w, h = box
+        dx = (x + w / 2) - (tx + tw / 2)
+        dy = (y + h / 2) - (ty + th / 2)
+        return (dx * dx + dy * dy) ** 0.5 / max(tw, th, 1)
+
+    def update(self, boxes: List[Tuple[int, int, int, int]]) -> List[FaceTrack]:
+        """
+        Match this frame's detections to tracks.
+
+        Returns:
+            The track for each box, in the same order as boxes
+        """
+        assigned: List[Optional[FaceTrack]] = [None] * len(boxes)
+        unmatched_tracks = set(range(len(self.tracks)))
+
+        # Greedy IoU matching, best pairs first
+        pairs = sorted(
+            (
+                (box_iou(track.box, box), t, b)
+                for t, track in enumerate(self.tracks)
+                for b, box in enumerate(boxes)
+            ),
+            reverse=True,
+        )
+        for iou, t, b in pairs:
+            if iou < self.iou_threshold:
+                break
+            if t in unmatched_tracks and assigned[b] is None:
+                assigned[b] = self.tracks[t]
+                unmatched_tracks.discard(t)
+
+        # Centroid fallback for remaining detections
+        for b, box in enumerate(boxes):
+            if assigned[b] is not None or not unmatched_tracks:
+                continue
+            distance, t = min((self._center_distance(self.tracks[t], box), t) for t in unmatched_tracks)
+            if distance <= self.max_center_distance:
+                assigned[b] = self.tracks[t]
+                unmatched_tracks.discard(t)
+
+        for b, box in enumerate(boxes):
+            if assigned[b] is None:
+                track = FaceTrack(self._next_id, box)
+                self._next_id += 1
+                self.tracks.append(track)
+                assigned[b] = track
+            else:
+                assigned[b].update_box(box)
+
+        # Age out tracks that were not seen this frame
+        for t in unmatched_tracks:
+            self.tracks[t].missed_frames += 1
+        self.tracks = [t for t in self.tracks if t.missed_frames <= self.max_missed_frames]
+
+        return assigned
+
+    def reset(self) -> None:
+        """Drop all tracks."""
+        self.tracks.clear()
 
 
 class FaceEmotionDetector:
     """
     Real-time face emotion detector.
 
-    Uses OpenCV's DNN module with a pre-trained model for face detection,
+    Uses a pluggable OpenCV face detector backend (Haar, DNN SSD or YuNet)
     and can integrate with DeepFace for emotion classification.
 
     Detects emotions:
@@ -78,9 +481,14 @@ class FaceEmotionDetector:
         self.use_deepface = use_deepface
         self._deepface_available = False
 
-        # Initialize face detector (Haar Cascade as fallback)
-        cascade_path = cv.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        self.face_cascade = cv.CascadeClassifier(cascade_path)
+        # Initialize face detector backend (Haar Cascade as fallback)
+        try:
+            self.face_detector: FaceDetectorBackend = create_face_detector(
+                self.config.face_detector_backend, self.config
+            )
+        except (ValueError, FileNotFoundError) as e:
+            print(f"[FaceEmotionDetector] {e}; falling back to Haar cascade")
+            self.face_detector = HaarFaceDetector(self.config)
 
         # Try to load DeepFace
         if use_deepface:
@@ -93,100 +501,142 @@ class FaceEmotionDetector:
                 print("[FaceEmotionDetector] DeepFace not available, using simplified detection")
                 self._deepface_available = False
 
-        # Smoothing and stability
-        self._last_face_box: Optional[Tuple[int, int, int, int]] = None
-        self._emotion_history: deque = deque(maxlen=5)
-        self._last_stable_emotion: EmotionLabel = EmotionLabel.NEUTRAL
-        self._smoothed_scores: Optional[Dict[str, float]] = None
-        self._smoothing_alpha = 0.3
+        # Direct emotion model (bypasses DeepFace.analyze per-call overhead)
+        self._emotion_model: Optional[Any] = None
+        if self._deepface_available and self.config.emotion_inference_mode == "direct":
+            self._emotion_model = self._load_emotion_model()
 
-        # Timing
-        self._last_inference_time = 0.0
-        self._no_face_count = 0
-        self._no_face_threshold = 5
-
-    def _detect_face_haar(self, gray: np.ndarray) -> Optional[FaceDetectionResult]:
-        """Detect face using Haar Cascade."""
-        faces = self.face_cascade.detectMultiScale(
-            gray,
-            scaleFactor=1.1,
-            minNeighbors=5,
-            minSize=(60, 60)
+        # Reusable preprocessing and model output buffers
+        batch_size = max(1, self.config.emotion_max_batch_size)
+        self._preprocessor = FacePreprocessor(
+            self.config.frame_width, self.config.frame_height, batch_size
+        )
+        self._emotion_batch_scores = np.empty((batch_size, NUM_EMOTIONS), dtype=np.float32)
+        self._deepface_to_index = np.array(
+            [EMOTION_INDEX[name] for name in DEEPFACE_EMOTION_ORDER], dtype=np.intp
         )
 
-        if len(faces) == 0:
-            return None
-
-        # Get largest face
-        x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
-        return FaceDetectionResult(
-            bounding_box=(x, y, w, h),
-            confidence=0.8
+        # Cheap cascade tier (only useful in front of DeepFace)
+        self._cheap_model: Optional[TFLiteEmotionModel] = None
+        self._cheap_to_index = np.empty(0, dtype=np.intp)
+        if self.config.emotion_cascade:
+            if self._deepface_available:
+                self._set_cheap_model(self._load_cheap_emotion_model())
+            else:
+                print("[FaceEmotionDetector] WARNING: emotion_cascade needs DeepFace, cascade disabled")
+
+        # Per-face tracking, smoothing and stability
+        self.tracker = FaceTracker(
+            max_missed_frames=self.config.face_track_max_missed_frames,
+            iou_threshold=self.config.face_track_iou_threshold,
         )
+        self._face_scores = np.empty((batch_size, NUM_EMOTIONS), dtype=np.float32)
 
-    def _smooth_face_box(
-        self,
-        new_box: Tuple[int, int, int, int]
-    ) -> Tuple[int, int, int, int]:
-        """Apply smoothing to face bounding box."""
-        if self._last_face_box is None:
-            self._last_face_box = new_box
-            return new_box
+        # Fallback scores when no model output is available
+        self._neutral_scores = scores_to_vector({"neutral": 0.5})
+        self._placeholder_scores = scores_to_vector({
+            "happy": 0.1,
+            "sad": 0.1,
+            "surprise": 0.1,
+            "neutral": 0.6,
+            "angry": 0.05,
+            "fear": 0.025,
+            "disgust": 0.025,
+        })
 
-        alpha = 0.3
-        smoothed = tuple(
-            int(alpha * new + (1 - alpha) * old)
-            for new, old in zip(new_box, self._last_face_box)
-        )
-        self._last_face_box = smoothed
-        return smoothed
+        # Stats
+        self._faces_processed = 0
+        self._model_runs = 0
+        self._cheap_runs = 0
+        self._cheap_accepted = 0
+        self._cheap_ms = 0.0
+        self._expensive_runs = 0
+        self._expensive_ms = 0.0
 
-    def _smooth_emotion_scores(self, scores: Dict[str, float]) -> Dict[str, float]:
-        """Apply exponential moving average to emotion scores."""
-        if self._smoothed_scores is None:
-            self._smoothed_scores = scores
-            return scores
+        # Timing
+        self._last_inference_time = 0.0
 
-        alpha = self._smoothing_alpha
-        smoothed = {}
-        for emotion, score in scores.items():
-            prev_score = self._smoothed_scores.get(emotion, score)
-            smoothed[emotion] = alpha * score + (1 - alpha) * prev_score
+    def _detect_faces(self, image: np.ndarray, gray: np.ndarray) -> List[FaceDetectionResult]:
+        """Detect up to max_num_faces faces, largest first, using the configured backend."""
+        faces = self.face_detector.detect(image, gray)
+        faces.sort(key=lambda f: f.bounding_box[2] * f.bounding_box[3], reverse=True)
+        return faces[:self.config.max_num_faces]
 
-        self._smoothed_scores = smoothed
-        return smoothed
+    def _load_emotion_model(self) -> Optional[Any]:
+        """Build DeepFace's emotion model once for direct predict calls."""
+        try:
+            try:
+                client = self.DeepFace.build_model(model_name="Emotion", task="facial_attribute")
+            except TypeError:
+                # Older DeepFace releases take only the model name
+                client = self.DeepFace.build_model("Emotion")
+            # Newer releases wrap the Keras model in a client object
+            model = getattr(client, "model", client)
+            print("[FaceEmotionDetector] Emotion model built for direct inference")
+            return model
+        except Exception as e:
+            print(f"[FaceEmotionDetector] Direct emotion model unavailable, using DeepFace.analyze: {e}")
+            return None
 
-    def _stabilize_emotion(self, emotion: EmotionLabel) -> EmotionLabel:
-        """Apply stability filtering to prevent rapid emotion changes."""
-        self._emotion_history.append(emotion)
+    def _load_cheap_emotion_model(self) -> TFLiteEmotionModel:
+        """
+        Load the cascade's cheap tier.
+
+        Raises:
+            RuntimeError: The cascade is enabled but the model cannot be loaded
+        """
+        path = Path(self.config.emotion_cheap_model_path or CHEAP_EMOTION_MODEL_PATH)
+        try:
+            model = TFLiteEmotionModel(path)
+        except (ImportError, FileNotFoundError, ValueError) as e:
+            raise RuntimeError(f"emotion_cascade is enabled but the cheap model failed to load: {e}") from e
+        print(f"[FaceEmotionDetector] Cascade enabled with cheap model {path.name}")
+        return model
+
+    def _set_cheap_model(self, model: Any) -> None:
+        """Use model (predict_on_batch, labels, input_size, centered) as the cheap tier."""
+        self._cheap_model = model
+        self._cheap_to_index = np.array(
+            [EMOTION_INDEX[name] for name in model.labels], dtype=np.intp
+        )
 
-        if len(self._emotion_history) < 3:
-            return emotion
+    def _model_scores(self, model: Any, batch: np.ndarray, label_index: np.ndarray) -> np.ndarray:
+        """
+        Run an emotion model (Keras or TFLite) on a preprocessed batch.
 
-        from collections import Counter
-        counts = Counter(self._emotion_history)
-        most_common = counts.most_common(1)[0]
+        Args:
+            model: Model with predict_on_batch
+            batch: (num_faces, h, w, 1) input batch
+            label_index: Score vector index for each model output
 
-        if most_common[1] >= 3:
-            self._last_stable_emotion = most_common[0]
+        Returns:
+            (num_faces, NUM_EMOTIONS) score array; a view into a reused buffer
+        """
+        count = len(batch)
+        if count > len(self._emotion_batch_scores):
+            self._emotion_batch_scores = np.empty((count, NUM_EMOTIONS), dtype=np.float32)
 
-        return self._last_stable_emotion
+        scores = self._emotion_batch_scores[:count]
+        try:
+            predictions = model.predict_on_batch(batch)
+            # Reorder the model's label order into our score vector layout;
+            # labels the model does not predict stay at zero
+            scores.fill(0.0)
+            scores[:, label_index] = np.asarray(predictions)
+        except Exception as e:
+            print(f"[FaceEmotionDetector] Emotion model error: {e}")
+            scores[:] = self._neutral_scores
+        return scores
 
     def _analyze_with_deepface(
         self,
         image: np.ndarray,
         face_box: Tuple[int, int, int, int]
-    ) -> Tuple[EmotionLabel, float, Dict[str, float]]:
-        """Analyze emotion using DeepFace."""
+    ) -> np.ndarray:
+        """Analyze emotion using DeepFace. Returns a score vector."""
         try:
-            # Crop face region with padding
-            x, y, w, h = face_box
-            pad = int(max(w, h) * 0.2)
-            x1 = max(0, x - pad)
-            y1 = max(0, y - pad)
-            x2 = min(image.shape[1], x + w + pad)
-            y2 = min(image.shape[0], y + h + pad)
-            face_img = image[y1:y2, x1:x2]
+            # Crop face region with padding (a view, DeepFace copies as needed)
+            face_img = self._preprocessor.crop(image, face_box)
 
             # Analyze with DeepFace
             result = self.DeepFace.analyze(
@@ -199,101 +649,217 @@ class FaceEmotionDetector:
             if isinstance(result, list):
                 result = result[0]
 
-            emotion_scores = result.get('emotion', {})
-            dominant = result.get('dominant_emotion', 'neutral')
-
-            # Convert to our format
-            normalized_scores = {
-                k.lower(): v / 100.0 for k, v in emotion_scores.items()
-            }
-
-            emotion_label = self.EMOTION_MAP.get(dominant.lower(), EmotionLabel.NEUTRAL)
-            confidence = normalized_scores.get(dominant.lower(), 0.5)
-
-            return emotion_label, confidence, normalized_scores
+            # Convert percentages to our score vector
+            scores = scores_to_vector(result.get('emotion', {}))
+            scores *= 0.01
+            return scores
 
         except Exception as e:
             print(f"[FaceEmotionDetector] DeepFace error: {e}")
-            return EmotionLabel.NEUTRAL, 0.5, {"neutral": 0.5}
+            return self._neutral_scores
 
     def _simple_emotion_analysis(
         self,
         gray: np.ndarray,
         face_box: Tuple[int, int, int, int]
-    ) -> Tuple[EmotionLabel, float, Dict[str, float]]:
+    ) -> np.ndarray:
         """
         Simple emotion analysis when DeepFace is not available.
         Uses basic image features (placeholder - always returns neutral).
         """
         # This is a simplified placeholder
         # In production, you'd want a lightweight model here
-        return EmotionLabel.NEUTRAL, 0.6, {
-            "happy": 0.1,
-            "sad": 0.1,
-            "surprise": 0.1,
-            "neutral": 0.6,
-            "angry": 0.05,
-            "fear": 0.025,
-            "disgust": 0.025,
-        }
+        return self._placeholder_scores
 
-    def detect(self, image: np.ndarray) -> Optional[EmotionResult]:
+    def _classify_faces(
+        self,
+        image: np.ndarray,
+        gray: np.ndarray,
+        tracks: List[FaceTrack]
+    ) -> np.ndarray:
         """
-        Detect face and emotion in an image.
+        Classify all given faces, batched into as few model calls as possible.
 
-        Args:
-            image: BGR image from OpenCV (numpy array)
+        With the cascade enabled, the cheap CNN runs on the whole batch
+        first and DeepFace only on faces where it is unsure or disagrees
+        with that face's stable emotion.
 
         Returns:
-            EmotionResult if face detected, None otherwise
+            (num_faces, NUM_EMOTIONS) score array; a view into a reused buffer
         """
-        start_time = time.time()
+        count = len(tracks)
+        if count > len(self._face_scores):
+            self._face_scores = np.empty((count, NUM_EMOTIONS), dtype=np.float32)
+        out = self._face_scores[:count]
+        boxes = [track.box for track in tracks]
+
+        if self._emotion_model is None and self._cheap_model is None:
+            for i, box in enumerate(boxes):
+                if self._deepface_available:
+                    out[i] = self._analyze_with_deepface(image, box)
+                else:
+                    out[i] = self._simple_emotion_analysis(gray, box)
+            return out
+
+        if self._cheap_model is None:
+            batch = self._preprocessor.emotion_batch(gray, boxes)
+            out[:] = self._model_scores(self._emotion_model, batch, self._deepface_to_index)
+            return out
+
+        # Cheap tier on every face
+        cheap_model = self._cheap_model
+        start = time.perf_counter()
+        batch = self._preprocessor.emotion_batch(
+            gray, boxes, cheap_model.input_size, cheap_model.centered
+        )
+        cheap = self._model_scores(cheap_model, batch, self._cheap_to_index)
+        self._cheap_ms += (time.perf_counter() - start) * 1000
+        self._cheap_runs += count
+
+        predicted = self._cheap_to_index
+        escalate = []
+        for i, track in enumerate(tracks):
+            top = int(cheap[i].argmax())
+            # Every face is scored by DeepFace at least once before cheap results count
+            if (track.expensive_runs > 0 and
+                    cheap[i, top] >= self.config.emotion_cascade_threshold and
+                    EMOTION_LABELS[top] == track.stable_emotion):
+                # Labels the cheap model does not predict keep their last scores
+                out[i] = track.gate_scores
+                out[i, predicted] = cheap[i, predicted]
+                self._cheap_accepted += 1
+            else:
+                escalate.append(i)
+        if not escalate:
+            return out
+
+        # DeepFace tier on the uncertain faces only
+        start = time.perf_counter()
+        if self._emotion_model is not None:
+            batch = self._preprocessor.emotion_batch(gray, [boxes[i] for i in escalate])
+            out[escalate] = self._model_scores(self._emotion_model, batch, self._deepface_to_index)
+        else:
+            for i in escalate:
+                out[i] = self._analyze_with_deepface(image, boxes[i])
+        self._expensive_ms += (time.perf_counter() - start) * 1000
+        self._expensive_runs += len(escalate)
+        for i in escalate:
+            tracks[i].expensive_runs += 1
+        return out
+
+    def _face_unchanged(self, gray: np.ndarray, track: FaceTrack) -> bool:
+        """
+        Check whether a face can reuse its last scores.
 
-        # Convert to grayscale for face detection
-        gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY)
+        Compares a small thumbnail of the crop to the one last classified
+        (mean absolute gray-level difference). Scores are reused for at most
+        emotion_max_reuse_frames consecutive frames.
+        """
+        threshold = self.config.emotion_change_threshold
+        if threshold <= 0:
+            return False
+
+        candidate = self._preprocessor.thumbnail(gray, track.box, track.gate_candidate)
+        if track.gate_valid and track.gate_age < self.config.emotion_max_reuse_frames:
+            change = cv.norm(candidate, track.gate_thumbnail, cv.NORM_L1) / candidate.size
+            if change < threshold:
+                track.gate_age += 1
+                return True
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get emotion model usage stats."""
+        skipped = self._faces_processed - self._model_runs
+        stats = {
+            "faces_processed": self._faces_processed,
+            "model_runs": self._model_runs,
+            "model_skips": skipped,
+            "skip_ratio": skipped / self._faces_processed if self._faces_processed else 0.0,
+            "face_detector": self.face_detector.name,
+            "face_detector_ms": self.face_detector.mean_inference_ms,
+            "tracked_faces": len(self.tracker.tracks),
+        }
 
-        # Detect face
-        face_result = self._detect_face_haar(gray)
+        if self._cheap_model is not None:
+            mean_cheap_ms = self._cheap_ms / self._cheap_runs if self._cheap_runs else 0.0
+            mean_expensive_ms = self._expensive_ms / self._expensive_runs if self._expensive_runs else 0.0
+            # Each accepted cheap result saves one DeepFace call; every face pays the cheap tier
+            saved_ms = self._cheap_accepted * mean_expensive_ms - self._cheap_ms
+            stats["cascade"] = {
+                "cheap_runs": self._cheap_runs,
+                "expensive_runs": self._expensive_runs,
+                "cheap_accept_ratio": self._cheap_accepted / self._cheap_runs if self._cheap_runs else 0.0,
+                "mean_cheap_ms": mean_cheap_ms,
+                "mean_expensive_ms": mean_expensive_ms,
+                "mean_saved_ms": saved_ms / self._cheap_runs if self._cheap_runs else 0.0,
+            }
 
-        if face_result is None:
-            self._no_face_count += 1
-            if self._no_face_count >= self._no_face_threshold:
-                self._last_face_box = None
-                self._no_face_count = 0
-            return None
+        return stats
 
-        self._no_face_count = 0
+    def detect_all(self, image: np.ndarray) -> List[EmotionResult]:
+        """
+        Detect all faces (up to max_num_faces) and their emotions.
 
-        # Smooth face box
-        face_box = self._smooth_face_box(face_result.bounding_box)
+        Each face is tracked across frames with its own smoothing state, and
+        faces that need classification share one batched model call.
 
-        # Analyze emotion
-        if self._deepface_available:
-            emotion, confidence, scores = self._analyze_with_deepface(image, face_box)
-        else:
-            emotion, confidence, scores = self._simple_emotion_analysis(gray, face_box)
+        Args:
+            image: BGR image from OpenCV (numpy array)
+
+        Returns:
+            One EmotionResult per face, largest face first
+        """
+        start_time = time.time()
 
-        # Smooth scores
-        smoothed_scores = self._smooth_emotion_scores(scores)
+        # Convert to grayscale for face detection (into a reused buffer)
+        gray = self._preprocessor.to_gray(image)
 
-        # Find dominant emotion from smoothed scores
-        dominant = max(smoothed_scores, key=smoothed_scores.get)
-        emotion = self.EMOTION_MAP.get(dominant, EmotionLabel.NEUTRAL)
-        confidence = smoothed_scores[dominant]
+        # Detect and track faces
+        faces = self._detect_faces(image, gray)
+        tracks = self.tracker.update([face.bounding_box for face in faces])
+        if not tracks:
+            return []
 
-        # Stabilize
-        stable_emotion = self._stabilize_emotion(emotion)
+        # Classify only faces that changed since their last classification
+        self._faces_processed += len(tracks)
+        to_classify = [track for track in tracks if not self._face_unchanged(gray, track)]
+        if to_classify:
+            self._model_runs += len(to_classify)
+            scores = self._classify_faces(image, gray, to_classify)
+            for track, track_scores in zip(to_classify, scores):
+                track.remember_classification(track_scores)
 
         inference_time = (time.time() - start_time) * 1000
+        timestamp = time.time()
+
+        results = []
+        for track in tracks:
+            # Smooth, pick dominant emotion and stabilize
+            stable_emotion, confidence, smoothed_scores = track.postprocess(track.gate_scores)
+            results.append(EmotionResult(
+                emotion=stable_emotion,
+                confidence=confidence,
+                all_scores=scores_to_dict(smoothed_scores),
+                face_box=track.box,
+                timestamp=timestamp,
+                inference_time_ms=inference_time,
+                scores_reused=track.gate_age > 0,
+                track_id=track.track_id,
+            ))
+        return results
 
-        return EmotionResult(
-            emotion=stable_emotion,
-            confidence=confidence,
-            all_scores={k: float(v) for k, v in smoothed_scores.items()},
-            face_box=face_box,
-            timestamp=time.time(),
-            inference_time_ms=inference_time,
-        )
+    def detect(self, image: np.ndarray) -> Optional[EmotionResult]:
+        """
+        Detect face and emotion in an image.
+
+        Args:
+            image: BGR image from OpenCV (numpy array)
+
+        Returns:
+            EmotionResult for the largest face if detected, None otherwise
+        """
+        results = self.detect_all(image)
+        return results[0] if results else None
 
     def draw_result(
         self,
@@ -326,36 +892,65 @@ class FaceEmotionDetector:
         cv.putText(image, label, (x + 5, label_y), cv.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
 
         # Optionally draw all scores
-        if draw_scores:
+        if draw_scores and result.all_scores:
             bar_x = x + w + 10
-            bar_y = y
             bar_width = 100
             bar_height = 15
 
-            for emotion_name, score in result.all_scores.items():
-                # Background bar
-                cv.rectangle(image, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), (50, 50, 50), -1)
-                # Score bar
-                score_width = int(bar_width * score)
-                cv.rectangle(image, (bar_x, bar_y), (bar_x + score_width, bar_y + bar_height), (142, 85, 114), -1)
-                # Label
-                cv.putText(image, f"{emotion_name[:3]}", (bar_x + bar_width + 5, bar_y + 12),
+            # One filled-polygon call per color for all bars; labels stay per row
+            names = list(result.all_scores)
+            scores = np.fromiter(result.all_scores.values(), dtype=np.float32, count=len(names))
+            tops = y + np.arange(len(names), dtype=np.int32) * (bar_height + 5)
+            rights = bar_x + (bar_width * scores).astype(np.int32)
+            cv.fillPoly(image, _bar_polygons(bar_x, tops, np.full_like(tops, bar_x + bar_width), bar_height), (50, 50, 50))
+            cv.fillPoly(image, _bar_polygons(bar_x, tops, rights, bar_height), (142, 85, 114))
+            for emotion_name, top in zip(names, tops.tolist()):
+                cv.putText(image, f"{emotion_name[:3]}", (bar_x + bar_width + 5, top + 12),
                           cv.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
-                bar_y += bar_height + 5
 
         return image
 
     def reset(self) -> None:
         """Reset detector state."""
-        self._last_face_box = None
-        self._emotion_history.clear()
-        self._last_stable_emotion = EmotionLabel.NEUTRAL
-        self._smoothed_scores = None
-        self._no_face_count = 0
+        self.tracker.reset()
+
+
+# Shared detector behind the convenience function
+_shared_detector: Optional[FaceEmotionDetector] = None
+_shared_lock = threading.RLock()
+
+
+def get_shared_face_detector() -> FaceEmotionDetector:
+    """
+    Get the process-wide detector used by detect_emotion().
+
+    Created on first use, so the face detector model and DeepFace are loaded
+    once per process. Callers using it directly from several threads must
+    serialize access themselves; detect_emotion() already does.
+    """
+    global _shared_detector
+    with _shared_lock:
+        if _shared_detector is None:
+            _shared_detector = FaceEmotionDetector()
+        return _shared_detector
+
+
+def release_shared_face_detector() -> None:
+    """Drop the shared detector; the next detect_emotion() call creates a new one."""
+    global _shared_detector
+    with _shared_lock:
+        _shared_detector = None
 
 
 # Convenience function
 def detect_emotion(image: np.ndarray) -> Optional[EmotionResult]:
-    """Quick emotion detection without managing detector instance."""
-    detector = FaceEmotionDetector()
-    return detector.detect(image)
+    """
+    Quick emotion detection without managing detector instance.
+
+    Thread-safe. Reuses the shared detector but resets its smoothing state,
+    so every call is independent of earlier ones.
+    """
+    with _shared_lock:
+        detector = get_shared_face_detector()
+        detector.reset()
+        return detector.detect(image)
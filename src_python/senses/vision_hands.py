@@ -4,22 +4,228 @@
 Vision Hands Module for Empathic-01 System
 
 Hand gesture detection using MediaPipe Hands with custom gesture classification.
-Detects: Open Palm, Thumb Up, Heart Hand, Index Pointing, and more.
+Detects: Open Palm, Thumb Up, Heart Hand, Index Pointing, and more,
+for every tracked hand, plus two-hand gestures (Two-Hand Heart).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional, List, Tuple, Dict, Any
 import numpy as np
 import cv2 as cv
 import mediapipe as mp
-from collections import deque
+from collections import Counter, deque
+from functools import cached_property
+import atexit
 import math
+import threading
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.config import GestureLabel, VisionConfig, DEFAULT_CONFIG
+from core.config import GestureLabel, MotionGestureLabel, VisionConfig, DEFAULT_CONFIG
+from .gesture_classifiers import KeypointClassifier, PointHistoryClassifier
+
+
+# Joint angle triplets (a, b, c): angle at b, in the order returned by hand_geometry()
+# Row 0 is the thumb MCP; rows 1-8 are PIP, DIP for index, middle, ring, pinky
+ANGLE_TRIPLETS = np.array([
+    [1, 2, 3],                  # Thumb CMC-MCP-IP
+    [5, 6, 7], [6, 7, 8],       # Index PIP, DIP
+    [9, 10, 11], [10, 11, 12],  # Middle PIP, DIP
+    [13, 14, 15], [14, 15, 16], # Ring PIP, DIP
+    [17, 18, 19], [18, 19, 20], # Pinky PIP, DIP
+], dtype=np.intp)
+THUMB_MCP_ANGLE = 0
+
+# Landmark pairs whose 2D distance the gesture rules use
+DISTANCE_PAIRS = np.array([
+    [4, 5],   # Thumb tip - index MCP
+    [5, 17],  # Index MCP - pinky MCP (palm width)
+    [4, 8],   # Thumb tip - index tip
+    [0, 9],   # Wrist - middle MCP (palm size)
+], dtype=np.intp)
+THUMB_TO_INDEX_MCP, PALM_WIDTH, THUMB_TO_INDEX_TIP, PALM_SIZE = range(len(DISTANCE_PAIRS))
+
+FINGER_NAMES = ("index", "middle", "ring", "pinky")
+
+# Hand skeleton as open polylines (wrist out along each finger, then across the palm)
+HAND_SKELETON_CHAINS = np.array([
+    [0, 1, 2, 3, 4],
+    [0, 5, 6, 7, 8],
+    [0, 9, 10, 11, 12],
+    [0, 13, 14, 15, 16],
+    [0, 17, 18, 19, 20],
+], dtype=np.intp)
+PALM_CHAIN = np.array([5, 9, 13, 17], dtype=np.intp)
+FINGERTIPS = np.array([4, 8, 12, 16, 20], dtype=np.intp)
+JOINTS = np.setdiff1d(np.arange(21), FINGERTIPS)
+
+OVERLAY_COLOR = (142, 85, 114)  # Purple
+OVERLAY_HIGHLIGHT = (255, 255, 255)
+
+
+def joint_angles(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Compute every joint angle used for classification.
+
+    Args:
+        landmarks: (..., 21, 3) normalized landmark array
+
+    Returns:
+        (..., 9) angles in degrees, rows as in ANGLE_TRIPLETS
+    """
+    points = landmarks[..., ANGLE_TRIPLETS, :2]  # (..., 9, 3, 2)
+    ab = points[..., 0, :] - points[..., 1, :]
+    cb = points[..., 2, :] - points[..., 1, :]
+
+    dot = (ab * cb).sum(axis=-1)
+    cross = ab[..., 0] * cb[..., 1] - ab[..., 1] * cb[..., 0]
+    return np.degrees(np.abs(np.arctan2(cross, dot)))
+
+
+def key_distances(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Compute the 2D landmark distances used by the gesture rules.
+
+    Args:
+        landmarks: (..., 21, 3) normalized landmark array
+
+    Returns:
+        (..., 4) distances, rows as in DISTANCE_PAIRS
+    """
+    pairs = landmarks[..., DISTANCE_PAIRS, :2]  # (..., 4, 2, 2)
+    delta = pairs[..., 0, :] - pairs[..., 1, :]
+    return np.hypot(delta[..., 0], delta[..., 1])
+
+
+def finger_masks(angles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extended and curled masks for index..pinky from joint_angles() output.
+
+    A finger is extended if both joints are straight (> 150 degrees) and
+    curled if at least one joint is bent (< 130 degrees).
+    """
+    pip, dip = angles[..., 1::2], angles[..., 2::2]
+    return (pip > 150) & (dip > 150), (pip < 130) | (dip < 130)
+
+
+def hand_geometry(landmarks: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute joint angles, key distances and finger states in one vectorized pass.
+
+    Works on a single hand (21, 3) or a stack of hands (n, 21, 3).
+
+    Returns:
+        Tuple of (angles (..., 9), distances (..., 4), extended (..., 4), curled (..., 4))
+    """
+    angles = joint_angles(landmarks)
+    extended, curled = finger_masks(angles)
+    return angles, key_distances(landmarks), extended, curled
+
+
+def pixel_landmarks(landmarks: np.ndarray, image_size: Tuple[int, int]) -> np.ndarray:
+    """
+    Convert normalized landmarks to integer pixel positions.
+
+    Truncates like int(x * width), so drawing and bounding boxes land on
+    the same pixels as per-point conversion.
+
+    Args:
+        landmarks: (..., 21, 3) normalized landmarks
+        image_size: (width, height) of the frame
+
+    Returns:
+        (..., 21, 2) int32 pixel x, y
+    """
+    return (landmarks[..., :2] * np.asarray(image_size, dtype=np.float32)).astype(np.int32)
+
+
+class HandFeatures:
+    """
+    Geometry of one hand in one frame, shared by every gesture rule.
+
+    Each quantity is computed on first access and then cached, so angles,
+    distances and finger states are never computed twice per frame.
+    """
+
+    def __init__(
+        self,
+        landmarks: np.ndarray,
+        angles: Optional[np.ndarray] = None,
+        distances: Optional[np.ndarray] = None
+    ):
+        self.landmarks = landmarks  # (21, 3) normalized x, y, z
+        # Seed the caches when the caller computed them for a batch of hands
+        if angles is not None:
+            self.__dict__["angles"] = angles
+        if distances is not None:
+            self.__dict__["distances"] = distances
+
+    @classmethod
+    def batch(cls, landmarks: np.ndarray) -> List["HandFeatures"]:
+        """
+        Features for a stack of hands, with angles and distances computed in one pass.
+
+        Args:
+            landmarks: (n, 21, 3) landmark arrays
+
+        Returns:
+            One HandFeatures per hand
+        """
+        angles = joint_angles(landmarks)
+        distances = key_distances(landmarks)
+        return [cls(landmarks[i], angles[i], distances[i]) for i in range(len(landmarks))]
+
+    @cached_property
+    def angles(self) -> np.ndarray:
+        """Joint angles in degrees, rows as in ANGLE_TRIPLETS."""
+        return joint_angles(self.landmarks)
+
+    @cached_property
+    def distances(self) -> np.ndarray:
+        """Key landmark distances, rows as in DISTANCE_PAIRS."""
+        return key_distances(self.landmarks)
+
+    @cached_property
+    def _masks(self) -> Tuple[np.ndarray, np.ndarray]:
+        return finger_masks(self.angles)
+
+    @property
+    def extended(self) -> np.ndarray:
+        """Extension mask for index..pinky."""
+        return self._masks[0]
+
+    @property
+    def curled(self) -> np.ndarray:
+        """Curl mask for index..pinky."""
+        return self._masks[1]
+
+    @property
+    def palm_size(self) -> float:
+        """Wrist to middle MCP distance."""
+        return self.distances[PALM_SIZE]
+
+    @cached_property
+    def thumb_extended(self) -> bool:
+        """Thumb is straight and its tip is far from the palm."""
+        distances = self.distances
+        return bool(
+            self.angles[THUMB_MCP_ANGLE] > 120 and
+            distances[THUMB_TO_INDEX_MCP] > distances[PALM_WIDTH] * 0.6
+        )
+
+    @cached_property
+    def finger_states(self) -> Dict[str, bool]:
+        """Extension state of each finger."""
+        states = {"thumb": self.thumb_extended}
+        states.update(zip(FINGER_NAMES, self.extended.tolist()))
+        return states
+
+    @cached_property
+    def extended_count(self) -> int:
+        """Number of extended fingers, thumb included."""
+        return sum(self.finger_states.values())
 
 
 @dataclass
@@ -35,11 +241,323 @@ class HandGestureResult:
     """Result of hand gesture detection."""
     gesture: GestureLabel
     confidence: float
-    landmarks: List[HandLandmark]
+    landmarks: np.ndarray  # (21, 3) normalized x, y, z
     bounding_box: Tuple[int, int, int, int]  # x, y, w, h
     handedness: str  # "Left" or "Right"
     finger_states: Dict[str, bool]  # Which fingers are extended
     is_detected: bool = True
+    motion_gesture: MotionGestureLabel = MotionGestureLabel.NONE  # Set on the pointing hand
+    pixel_landmarks: Optional[np.ndarray] = None  # (21, 2) int32 pixel x, y in the source frame
+    frame_size: Optional[Tuple[int, int]] = None  # width, height of the source frame
+
+    @property
+    def landmark_list(self) -> List[HandLandmark]:
+        """Landmarks as HandLandmark points, the format of `landmarks` before it became an array."""
+        return [HandLandmark(x, y, z) for x, y, z in self.landmarks.tolist()]
+
+
+class HandPreprocessor:
+    """
+    Builds the MediaPipe input frame in reused buffers.
+
+    The frame (or a crop of it) is resized first and only then converted
+    to RGB, so the color conversion runs at inference resolution. Buffers
+    are reallocated only when the input size changes; ROI sizes are snapped
+    to a 32 px grid to keep that rare.
+    """
+
+    ROI_GRID = 32
+
+    def __init__(self, scale: float = 1.0, roi_padding: float = 0.5):
+        self.scale = scale
+        self.roi_padding = roi_padding
+        # OpenCV has a fast INTER_AREA path for integer downscales (1/2, 1/3, ...)
+        self._interpolation = (
+            cv.INTER_AREA if scale < 1.0 and (1.0 / scale).is_integer() else cv.INTER_LINEAR
+        )
+        self._resized: Optional[np.ndarray] = None
+        self._rgb: Optional[np.ndarray] = None
+        self.region: Tuple[int, int, int, int] = (0, 0, 0, 0)  # x, y, w, h of the last input
+
+    @staticmethod
+    def _buffer(buffer: Optional[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+        if buffer is None or buffer.shape != shape:
+            return np.empty(shape, dtype=np.uint8)
+        return buffer
+
+    def roi(
+        self,
+        boxes: List[Tuple[int, int, int, int]],
+        image_shape: Tuple[int, ...]
+    ) -> Tuple[int, int, int, int]:
+        """Padded union of hand boxes as corners (x1, y1, x2, y2), grid-aligned and clipped."""
+        x1 = min(x for x, _, _, _ in boxes)
+        y1 = min(y for _, y, _, _ in boxes)
+        x2 = max(x + w for x, _, w, _ in boxes)
+        y2 = max(y + h for _, y, _, h in boxes)
+        pad = int(max(x2 - x1, y2 - y1) * self.roi_padding)
+
+        grid = self.ROI_GRID
+        x1 = max(0, (x1 - pad) // grid * grid)
+        y1 = max(0, (y1 - pad) // grid * grid)
+        x2 = min(image_shape[1], -(-(x2 + pad) // grid) * grid)
+        y2 = min(image_shape[0], -(-(y2 + pad) // grid) * grid)
+        return x1, y1, x2, y2
+
+    def covers(
+        self,
+        roi: Tuple[int, int, int, int],
+        boxes: List[Tuple[int, int, int, int]],
+        image_shape: Tuple[int, ...]
+    ) -> bool:
+        """
+        Check that an ROI still holds every hand box with room to move.
+
+        Each box, grown by half the ROI padding, must lie inside the ROI;
+        ROI sides on the image border always count as holding.
+        """
+        x1, y1, x2, y2 = roi
+        h, w = image_shape[:2]
+        for x, y, bw, bh in boxes:
+            margin = int(max(bw, bh) * self.roi_padding / 2)
+            if ((x1 > 0 and x - margin < x1) or (y1 > 0 and y - margin < y1) or
+                    (x2 < w and x + bw + margin > x2) or (y2 < h and y + bh + margin > y2)):
+                return False
+        return True
+
+    def prepare(
+        self,
+        image: np.ndarray,
+        roi: Optional[Tuple[int, int, int, int]] = None
+    ) -> np.ndarray:
+        """
+        Crop, resize and convert a BGR frame to the RGB MediaPipe input.
+
+        Args:
+            image: BGR frame
+            roi: Optional (x1, y1, x2, y2) region to keep
+
+        Returns:
+            Read-only RGB view of the reused input buffer
+        """
+        h, w = image.shape[:2]
+        x1, y1, x2, y2 = roi or (0, 0, w, h)
+        source = image[y1:y2, x1:x2]
+        self.region = (x1, y1, x2 - x1, y2 - y1)
+
+        if self.scale != 1.0:
+            size = (max(1, round((x2 - x1) * self.scale)), max(1, round((y2 - y1) * self.scale)))
+            self._resized = self._buffer(self._resized, (size[1], size[0], 3))
+            cv.resize(source, size, dst=self._resized, interpolation=self._interpolation)
+            source = self._resized
+
+        self._rgb = self._buffer(self._rgb, source.shape)
+        self._rgb.flags.writeable = True
+        cv.cvtColor(source, cv.COLOR_BGR2RGB, dst=self._rgb)
+        # Read-only input lets MediaPipe use the buffer without copying
+        self._rgb.flags.writeable = False
+        return self._rgb
+
+    def to_frame(self, landmarks: np.ndarray, frame_size: Tuple[int, int]) -> np.ndarray:
+        """
+        Map landmarks normalized to the last input region back to the full frame.
+
+        Args:
+            landmarks: (n, 21, 3) landmarks, modified in place
+            frame_size: (width, height) of the full frame
+        """
+        x, y, rw, rh = self.region
+        w, h = frame_size
+        if (x, y, rw, rh) == (0, 0, w, h):
+            return landmarks
+        landmarks[..., 0] = (x + landmarks[..., 0] * rw) / w
+        landmarks[..., 1] = (y + landmarks[..., 1] * rh) / h
+        landmarks[..., 2] *= rw / w  # z uses the same scale as x
+        return landmarks
+
+
+class PointHistory:
+    """
+    Fixed-size ring buffer of index finger tip pixel positions.
+
+    Frames without a pointing finger are stored as (0, 0) and marked
+    invalid, as the motion classifier expects. Iteration yields points
+    oldest first, for drawing.
+    """
+
+    def __init__(self, length: int = 16):
+        self.length = length
+        self.points = np.zeros((length, 2), dtype=np.int32)
+        self.valid = np.zeros(length, dtype=bool)
+        self._head = 0  # Next slot to write, i.e. the oldest point once full
+        self._count = 0
+        self.has_new_point = False  # A valid point arrived since the last consume
+
+    def append(self, point: Optional[Tuple[int, int]]) -> None:
+        """Add the latest index tip position, or None when not pointing."""
+        if point is None:
+            self.points[self._head] = 0
+            self.valid[self._head] = False
+        else:
+            self.points[self._head] = point
+            self.valid[self._head] = True
+            self.has_new_point = True
+        self._head = (self._head + 1) % self.length
+        self._count = min(self._count + 1, self.length)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the buffer holds `length` entries."""
+        return self._count == self.length
+
+    def ordered(self, out: np.ndarray) -> np.ndarray:
+        """Copy the points into out (length, 2), oldest first."""
+        tail = self.length - self._head
+        out[:tail] = self.points[self._head:]
+        out[tail:] = self.points[:self._head]
+        return out
+
+    def clear(self) -> None:
+        """Forget all points."""
+        self.points[:] = 0
+        self.valid[:] = False
+        self._head = 0
+        self._count = 0
+        self.has_new_point = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        start = self._head if self.is_full else 0
+        for i in range(self._count):
+            x, y = self.points[(start + i) % self.length]
+            yield int(x), int(y)
+
+
+class HandTrack:
+    """
+    Smoothing and stability state for one hand.
+
+    Tracks are keyed by MediaPipe handedness, so each hand keeps its own
+    landmark EMA and gesture history across frames.
+    """
+
+    def __init__(self, key: str, smoothing_alpha: float):
+        self.key = key
+        self.smoothing_alpha = smoothing_alpha
+        self.last_landmarks: Optional[np.ndarray] = None
+        self.gesture_history: deque = deque(maxlen=5)
+        self.stable_gesture: GestureLabel = GestureLabel.NONE
+        self.missed_frames = 0
+
+    def smooth(self, current: np.ndarray) -> np.ndarray:
+        """Apply exponential moving average smoothing to landmarks."""
+        if self.last_landmarks is None or self.last_landmarks.shape != current.shape:
+            self.last_landmarks = current
+            return current
+
+        # New array each frame: results handed out earlier must not change
+        smoothed = self.last_landmarks + self.smoothing_alpha * (current - self.last_landmarks)
+        self.last_landmarks = smoothed
+        return smoothed
+
+    def stabilize(self, gesture: GestureLabel) -> GestureLabel:
+        """Apply stability filtering to gesture detection."""
+        self.gesture_history.append(gesture)
+
+        # Count occurrences of each gesture in history
+        if len(self.gesture_history) < 3:
+            return gesture
+
+        gesture_counts = Counter(self.gesture_history)
+        most_common = gesture_counts.most_common(1)[0]
+
+        # Require majority for stability
+        if most_common[1] >= len(self.gesture_history) // 2 + 1:
+            self.stable_gesture = most_common[0]
+
+        return self.stable_gesture
+
+
+def result_pixels(result: HandGestureResult, frame_size: Tuple[int, int]) -> np.ndarray:
+    """Pixel landmarks of a result, reusing the ones from detection when the size matches."""
+    if result.pixel_landmarks is not None and result.frame_size == frame_size:
+        return result.pixel_landmarks
+    return pixel_landmarks(result.landmarks, frame_size)
+
+
+def draw_skeletons(image: np.ndarray, hands: List[np.ndarray]) -> None:
+    """
+    Draw skeletons and landmark dots of several hands in a fixed number of calls.
+
+    Args:
+        image: BGR image to draw on
+        hands: (21, 2) int32 pixel landmarks per hand
+    """
+    if not hands:
+        return
+    points = np.stack(hands)
+
+    # Connections: white underlay with a purple line on top
+    skeleton = list(points[:, HAND_SKELETON_CHAINS].reshape(-1, HAND_SKELETON_CHAINS.shape[1], 2))
+    skeleton.extend(np.ascontiguousarray(points[:, PALM_CHAIN]))
+    cv.polylines(image, skeleton, False, OVERLAY_HIGHLIGHT, 2)
+    cv.polylines(image, skeleton, False, OVERLAY_COLOR, 1)
+
+    # Landmark dots (fingertips larger): single-point polylines drawn with a
+    # thick pen render as filled discs, a purple ring under a white center
+    for indices, size in ((JOINTS, 5), (FINGERTIPS, 8)):
+        dots = points[:, indices].reshape(-1, 1, 2)
+        cv.polylines(image, dots, True, OVERLAY_COLOR, 2 * size + 2)
+        cv.polylines(image, dots, True, OVERLAY_HIGHLIGHT, 2 * size - 2)
+
+
+def _draw_box_and_label(image: np.ndarray, result: HandGestureResult, draw_gesture_label: bool) -> None:
+    """Draw the bounding box and, optionally, the gesture label of one hand."""
+    x, y, bw, bh = result.bounding_box
+    cv.rectangle(image, (x, y), (x + bw, y + bh), OVERLAY_COLOR, 2)
+
+    if draw_gesture_label:
+        label = f"{result.gesture.value} ({result.confidence:.0%})"
+        label_bg_y = max(y - 30, 30)
+
+        # Background for text
+        (text_w, text_h), _ = cv.getTextSize(label, cv.FONT_HERSHEY_SIMPLEX, 0.7, 2)
+        cv.rectangle(image, (x, label_bg_y - text_h - 5), (x + text_w + 10, label_bg_y + 5), OVERLAY_COLOR, -1)
+        cv.putText(image, label, (x + 5, label_bg_y), cv.FONT_HERSHEY_SIMPLEX, 0.7, OVERLAY_HIGHLIGHT, 2)
+
+
+def draw_point_history(image: np.ndarray, history: PointHistory) -> np.ndarray:
+    """Draw an index finger tip motion trail."""
+    for i, point in enumerate(history):
+        if point[0] != 0 or point[1] != 0:
+            thickness = 1 + i // 4
+            cv.circle(image, point, thickness, (152, 251, 152), -1)
+
+    return image
+
+
+def draw_hand_results(
+    image: np.ndarray,
+    results: List[HandGestureResult],
+    point_history: Optional[PointHistory] = None,
+    draw_gesture_label: bool = True
+) -> np.ndarray:
+    """
+    Draw every hand from detect_all() (skeletons batched) and the motion trail once.
+
+    Needs no detector (no MediaPipe graph or TFLite model), so results
+    from a detector in another process can be drawn anywhere.
+    """
+    h, w = image.shape[:2]
+    detected = [result for result in results if result.is_detected]
+    draw_skeletons(image, [result_pixels(result, (w, h)) for result in detected])
+    for result in detected:
+        _draw_box_and_label(image, result, draw_gesture_label)
+    if point_history is not None:
+        draw_point_history(image, point_history)
+    return image
 
 
 class HandGestureDetector:
@@ -54,6 +572,7 @@ class HandGestureDetector:
     - CLOSED_FIST: All fingers curled (Neutral)
     - OK_SIGN: Thumb and index tips touching, others extended
     - PEACE_SIGN: Index and middle extended, others curled
+    - TWO_HAND_HEART: Both hands, index tips and thumb tips touching (Affection)
     """
 
     # MediaPipe Hand Landmark Indices
@@ -79,181 +598,102 @@ class HandGestureDetector:
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
 
-        # Smoothing for landmarks
-        self._last_landmarks: Optional[List[HandLandmark]] = None
+        # MediaPipe input: scale and ROI around the hands tracked last frame
+        self._preprocessor = HandPreprocessor(
+            self.config.hand_inference_scale, self.config.hand_roi_padding
+        )
+        self._roi_boxes: List[Tuple[int, int, int, int]] = []
+        self._roi: Optional[Tuple[int, int, int, int]] = None  # Current crop (x1, y1, x2, y2)
+        self._frames_since_full_frame = 0
+        # Region of the last MediaPipe input (None = full frame) and whether
+        # MediaPipe found hands in it, i.e. holds tracked rects relative to it
+        self._input_roi: Optional[Tuple[int, int, int, int]] = None
+        self._mediapipe_tracking = False
+        self.roi_resets = 0  # MediaPipe graph restarts after a crop change
+
+        # Per-hand smoothing and gesture stability, keyed by handedness
         self._smoothing_alpha = self.config.landmark_smoothing_alpha
+        self._tracks: Dict[str, HandTrack] = {}
 
-        # Gesture stability
-        self._gesture_history: deque = deque(maxlen=5)
-        self._last_stable_gesture: GestureLabel = GestureLabel.NONE
+        # Learned per-hand classifier; two-hand gestures always use the rules
+        self._keypoint_classifier: Optional[KeypointClassifier] = None
+        if self.config.gesture_classifier == "keypoint":
+            try:
+                self._keypoint_classifier = KeypointClassifier()
+                print("[HandGestureDetector] Using keypoint classifier model")
+            except (ImportError, FileNotFoundError) as e:
+                print(f"[HandGestureDetector] Keypoint classifier unavailable, using rules: {e}")
 
         # Point history for motion tracking
-        self._point_history: deque = deque(maxlen=16)
-
-    def _distance(self, p1: HandLandmark, p2: HandLandmark) -> float:
-        """Calculate Euclidean distance between two landmarks."""
-        return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
-
-    def _distance_3d(self, p1: HandLandmark, p2: HandLandmark) -> float:
-        """Calculate 3D Euclidean distance between two landmarks."""
-        return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2 + (p1.z - p2.z)**2)
-
-    def _angle(self, a: HandLandmark, b: HandLandmark, c: HandLandmark) -> float:
-        """Calculate angle at point b formed by points a-b-c (in degrees)."""
-        ab = np.array([a.x - b.x, a.y - b.y])
-        cb = np.array([c.x - b.x, c.y - b.y])
-
-        dot = np.dot(ab, cb)
-        cross = ab[0] * cb[1] - ab[1] * cb[0]
-
-        return abs(math.atan2(cross, dot) * (180 / math.pi))
-
-    def _is_finger_extended(
-        self,
-        landmarks: List[HandLandmark],
-        mcp: int,
-        pip: int,
-        dip: int,
-        tip: int
-    ) -> bool:
-        """
-        Check if a finger is extended using angle-based detection.
-        A finger is extended if both joints are relatively straight.
-        """
-        pip_angle = self._angle(landmarks[mcp], landmarks[pip], landmarks[dip])
-        dip_angle = self._angle(landmarks[pip], landmarks[dip], landmarks[tip])
-
-        # Extended = both joints are straight (angle > 150 degrees)
-        return pip_angle > 150 and dip_angle > 150
-
-    def _is_finger_curled(
-        self,
-        landmarks: List[HandLandmark],
-        mcp: int,
-        pip: int,
-        dip: int,
-        tip: int
-    ) -> bool:
-        """Check if a finger is curled (bent inward)."""
-        pip_angle = self._angle(landmarks[mcp], landmarks[pip], landmarks[dip])
-        dip_angle = self._angle(landmarks[pip], landmarks[dip], landmarks[tip])
-
-        # Curled = at least one joint is bent (angle < 130 degrees)
-        return pip_angle < 130 or dip_angle < 130
-
-    def _is_thumb_extended(self, landmarks: List[HandLandmark]) -> bool:
-        """Check if thumb is extended using angle and position."""
-        thumb_tip = landmarks[self.THUMB_TIP]
-        thumb_ip = landmarks[self.THUMB_IP]
-        thumb_mcp = landmarks[self.THUMB_MCP]
-        index_mcp = landmarks[self.INDEX_MCP]
-
-        # Check thumb angle
-        thumb_angle = self._angle(
-            landmarks[self.THUMB_CMC],
-            thumb_mcp,
-            thumb_ip
-        )
-
-        # Check if thumb tip is far from palm
-        thumb_to_index = self._distance(thumb_tip, index_mcp)
-        palm_width = self._distance(landmarks[self.INDEX_MCP], landmarks[self.PINKY_MCP])
-
-        return thumb_angle > 120 and thumb_to_index > palm_width * 0.6
-
-    def _is_thumb_up_gesture(self, landmarks: List[HandLandmark]) -> bool:
+        self._point_history = PointHistory(PointHistoryClassifier.HISTORY_LENGTH)
+        self._ordered_points = np.zeros((PointHistoryClassifier.HISTORY_LENGTH, 2), dtype=np.int32)
+
+        # Motion gestures from the point history (runs only on new pointing frames)
+        self._motion_history: deque = deque(maxlen=PointHistoryClassifier.HISTORY_LENGTH)
+        self._point_history_classifier: Optional[PointHistoryClassifier] = None
+        if self.config.motion_gesture_classifier:
+            try:
+                self._point_history_classifier = PointHistoryClassifier()
+            except (ImportError, FileNotFoundError) as e:
+                print(f"[HandGestureDetector] Motion gestures disabled: {e}")
+
+    def _is_thumb_up_gesture(self, features: HandFeatures) -> bool:
         """
         Detect thumb up gesture.
         Thumb extended upward, all other fingers curled.
         """
-        # Check thumb is extended and pointing up
-        thumb_tip = landmarks[self.THUMB_TIP]
-        thumb_mcp = landmarks[self.THUMB_MCP]
-        wrist = landmarks[self.WRIST]
+        landmarks = features.landmarks
 
         # Thumb should be above the MCP (pointing up)
-        thumb_pointing_up = thumb_tip.y < thumb_mcp.y - 0.05
+        thumb_pointing_up = landmarks[self.THUMB_TIP, 1] < landmarks[self.THUMB_MCP, 1] - 0.05
 
         # All other fingers should be curled
-        index_curled = self._is_finger_curled(landmarks, self.INDEX_MCP, self.INDEX_PIP, self.INDEX_DIP, self.INDEX_TIP)
-        middle_curled = self._is_finger_curled(landmarks, self.MIDDLE_MCP, self.MIDDLE_PIP, self.MIDDLE_DIP, self.MIDDLE_TIP)
-        ring_curled = self._is_finger_curled(landmarks, self.RING_MCP, self.RING_PIP, self.RING_DIP, self.RING_TIP)
-        pinky_curled = self._is_finger_curled(landmarks, self.PINKY_MCP, self.PINKY_PIP, self.PINKY_DIP, self.PINKY_TIP)
+        return bool(thumb_pointing_up and features.curled.all())
 
-        return thumb_pointing_up and index_curled and middle_curled and ring_curled and pinky_curled
-
-    def _is_heart_hand_gesture(self, landmarks: List[HandLandmark]) -> bool:
+    def _is_heart_hand_gesture(self, features: HandFeatures) -> bool:
         """
         Detect heart hand gesture.
         Thumb and index fingers form a heart shape (tips close together, curved).
         This is the single-hand heart where thumb and index curve toward each other.
         """
-        thumb_tip = landmarks[self.THUMB_TIP]
-        index_tip = landmarks[self.INDEX_TIP]
-        thumb_mcp = landmarks[self.THUMB_MCP]
-        index_mcp = landmarks[self.INDEX_MCP]
-
         # Thumb and index tips should be close
-        tip_distance = self._distance(thumb_tip, index_tip)
-        palm_size = self._distance(landmarks[self.WRIST], landmarks[self.MIDDLE_MCP])
-
-        tips_close = tip_distance < palm_size * 0.3
-
-        # Both thumb and index should be curved (not fully extended)
-        thumb_ip = landmarks[self.THUMB_IP]
-        index_pip = landmarks[self.INDEX_PIP]
-        index_dip = landmarks[self.INDEX_DIP]
+        tips_close = features.distances[THUMB_TO_INDEX_TIP] < features.palm_size * 0.3
 
-        index_angle = self._angle(index_mcp, index_pip, index_dip)
-        index_curved = 90 < index_angle < 160
+        # Index should be curved (not fully extended)
+        index_curved = 90 < features.angles[1] < 160
 
         # Other fingers should be curled or semi-curled
-        middle_not_extended = not self._is_finger_extended(landmarks, self.MIDDLE_MCP, self.MIDDLE_PIP, self.MIDDLE_DIP, self.MIDDLE_TIP)
-        ring_not_extended = not self._is_finger_extended(landmarks, self.RING_MCP, self.RING_PIP, self.RING_DIP, self.RING_TIP)
-        pinky_not_extended = not self._is_finger_extended(landmarks, self.PINKY_MCP, self.PINKY_PIP, self.PINKY_DIP, self.PINKY_TIP)
+        extended = features.extended
+        middle_not_extended = not extended[1]
+        ring_not_extended = not extended[2]
 
-        return tips_close and index_curved and (middle_not_extended or ring_not_extended)
+        return bool(tips_close and index_curved and (middle_not_extended or ring_not_extended))
 
-    def _get_finger_states(self, landmarks: List[HandLandmark]) -> Dict[str, bool]:
-        """Get the extension state of each finger."""
-        return {
-            "thumb": self._is_thumb_extended(landmarks),
-            "index": self._is_finger_extended(landmarks, self.INDEX_MCP, self.INDEX_PIP, self.INDEX_DIP, self.INDEX_TIP),
-            "middle": self._is_finger_extended(landmarks, self.MIDDLE_MCP, self.MIDDLE_PIP, self.MIDDLE_DIP, self.MIDDLE_TIP),
-            "ring": self._is_finger_extended(landmarks, self.RING_MCP, self.RING_PIP, self.RING_DIP, self.RING_TIP),
-            "pinky": self._is_finger_extended(landmarks, self.PINKY_MCP, self.PINKY_PIP, self.PINKY_DIP, self.PINKY_TIP),
-        }
-
-    def _classify_gesture(self, landmarks: List[HandLandmark]) -> Tuple[GestureLabel, float]:
+    def _classify_gesture(self, features: HandFeatures) -> Tuple[GestureLabel, float]:
         """
-        Classify hand gesture from landmarks.
+        Classify hand gesture from this frame's hand features.
 
         Returns:
             Tuple of (gesture label, confidence score)
         """
-        if len(landmarks) != 21:
+        if len(features.landmarks) != 21:
             return GestureLabel.NONE, 0.0
 
-        finger_states = self._get_finger_states(landmarks)
-        extended_count = sum(finger_states.values())
+        finger_states = features.finger_states
+        extended_count = features.extended_count
 
         # Check specific gestures first (higher priority)
 
         # 1. Thumb Up - thumb extended up, others curled
-        if self._is_thumb_up_gesture(landmarks):
+        if self._is_thumb_up_gesture(features):
             return GestureLabel.THUMB_UP, 0.92
 
         # 2. Heart Hand - thumb and index forming heart
-        if self._is_heart_hand_gesture(landmarks):
+        if self._is_heart_hand_gesture(features):
             return GestureLabel.HEART_HAND, 0.88
 
         # 3. OK Sign - thumb and index tips touching, others extended
-        thumb_tip = landmarks[self.THUMB_TIP]
-        index_tip = landmarks[self.INDEX_TIP]
-        thumb_index_dist = self._distance(thumb_tip, index_tip)
-        palm_size = self._distance(landmarks[self.WRIST], landmarks[self.MIDDLE_MCP])
-
-        if (thumb_index_dist < palm_size * 0.2 and
+        if (features.distances[THUMB_TO_INDEX_TIP] < features.palm_size * 0.2 and
             finger_states["middle"] and
             finger_states["ring"] and
             finger_states["pinky"]):
@@ -287,57 +727,154 @@ class HandGestureDetector:
         else:
             return GestureLabel.CLOSED_FIST, 0.55
 
-    def _smooth_landmarks(
+    def _classify_gestures(
         self,
-        current: List[HandLandmark]
-    ) -> List[HandLandmark]:
-        """Apply exponential moving average smoothing to landmarks."""
-        if self._last_landmarks is None or len(self._last_landmarks) != len(current):
-            self._last_landmarks = current
-            return current
+        landmarks: np.ndarray,
+        features: List[HandFeatures],
+        image_size: Tuple[int, int]
+    ) -> List[Tuple[GestureLabel, float]]:
+        """
+        Classify the gesture of every hand with the configured backend.
 
-        alpha = self._smoothing_alpha
-        smoothed = []
-        for curr, prev in zip(current, self._last_landmarks):
-            smoothed.append(HandLandmark(
-                x=alpha * curr.x + (1 - alpha) * prev.x,
-                y=alpha * curr.y + (1 - alpha) * prev.y,
-                z=alpha * curr.z + (1 - alpha) * prev.z,
-            ))
+        Args:
+            landmarks: (n, 21, 3) smoothed landmarks
+            features: HandFeatures for each hand (rule-based backend)
+            image_size: (width, height) of the frame
 
-        self._last_landmarks = smoothed
-        return smoothed
+        Returns:
+            (gesture label, confidence) per hand
+        """
+        if self._keypoint_classifier is not None:
+            return self._keypoint_classifier.classify(landmarks, image_size)
+        return [self._classify_gesture(hand) for hand in features]
 
-    def _stabilize_gesture(self, gesture: GestureLabel) -> GestureLabel:
-        """Apply stability filtering to gesture detection."""
-        self._gesture_history.append(gesture)
+    def _is_two_hand_heart(self, a: HandFeatures, b: HandFeatures) -> bool:
+        """
+        Detect the two-handed heart.
+        Index tips touch at the top and thumb tips touch at the bottom.
+        """
+        la, lb = a.landmarks, b.landmarks
+        palm_size = (a.palm_size + b.palm_size) / 2
+        index_tips = math.dist(la[self.INDEX_TIP, :2], lb[self.INDEX_TIP, :2])
+        thumb_tips = math.dist(la[self.THUMB_TIP, :2], lb[self.THUMB_TIP, :2])
+
+        # Heart is upright: index tips above thumb tips
+        index_y = (la[self.INDEX_TIP, 1] + lb[self.INDEX_TIP, 1]) / 2
+        thumb_y = (la[self.THUMB_TIP, 1] + lb[self.THUMB_TIP, 1]) / 2
+
+        return bool(
+            index_tips < palm_size * 0.4 and
+            thumb_tips < palm_size * 0.4 and
+            index_y < thumb_y - palm_size * 0.3
+        )
 
-        # Count occurrences of each gesture in history
-        if len(self._gesture_history) < 3:
-            return gesture
+    def _classify_two_hand_gesture(
+        self,
+        features: List[HandFeatures]
+    ) -> Optional[Tuple[GestureLabel, float]]:
+        """Classify gestures formed by the first two hands, if any."""
+        if len(features) < 2:
+            return None
 
-        from collections import Counter
-        gesture_counts = Counter(self._gesture_history)
-        most_common = gesture_counts.most_common(1)[0]
+        if self._is_two_hand_heart(features[0], features[1]):
+            return GestureLabel.TWO_HAND_HEART, 0.90
 
-        # Require majority for stability
-        if most_common[1] >= len(self._gesture_history) // 2 + 1:
-            self._last_stable_gesture = most_common[0]
+        return None
+
+    def _next_roi(self, image_shape: Tuple[int, ...]) -> Optional[Tuple[int, int, int, int]]:
+        """ROI for this frame's MediaPipe pass, or None for the full frame."""
+        if not self.config.hand_roi_tracking or not self._roi_boxes:
+            self._frames_since_full_frame = 0
+            self._roi = None
+            return None
+
+        # Periodic full-frame pass so hands outside the ROI are still found
+        # (unless MediaPipe already tracks as many hands as it reports)
+        self._frames_since_full_frame += 1
+        if (len(self._roi_boxes) < self.config.max_num_hands and
+                self._frames_since_full_frame >= self.config.hand_roi_full_frame_interval):
+            self._frames_since_full_frame = 0
+            self._roi = None
+            return None
+
+        # Keep the crop until a hand nears its edge: every crop change costs
+        # a MediaPipe restart (see _set_input_roi)
+        if self._roi is None or not self._preprocessor.covers(self._roi, self._roi_boxes, image_shape):
+            self._roi = self._preprocessor.roi(self._roi_boxes, image_shape)
+        return self._roi
+
+    def _set_input_roi(self, roi: Optional[Tuple[int, int, int, int]]) -> None:
+        """
+        Switch the MediaPipe input region.
+
+        In video mode MediaPipe tracks hands from the last input's landmarks,
+        in that input's normalized coordinates. After a crop change they
+        would point at the wrong part of the image, so the graph is restarted
+        and finds the hands with palm detection instead.
+        """
+        if roi != self._input_roi and self._mediapipe_tracking and not self.config.static_image_mode:
+            self.hands.reset()
+            self.roi_resets += 1
+        self._input_roi = roi
+
+    def _match_tracks(self, handedness: List[str]) -> List[HandTrack]:
+        """Get the track for each hand, creating new and dropping stale ones."""
+        matched = []
+        for label in handedness:
+            # Two hands with the same handedness get distinct keys
+            key = label
+            suffix = 2
+            while any(track.key == key for track in matched):
+                key = f"{label}#{suffix}"
+                suffix += 1
+
+            track = self._tracks.get(key)
+            if track is None:
+                track = self._tracks[key] = HandTrack(key, self._smoothing_alpha)
+            track.missed_frames = 0
+            matched.append(track)
+
+        for key, track in list(self._tracks.items()):
+            if track not in matched:
+                track.missed_frames += 1
+                if track.missed_frames > self.config.hand_track_max_missed_frames:
+                    del self._tracks[key]
+
+        return matched
+
+    def _update_motion_gesture(self, image_size: Tuple[int, int]) -> MotionGestureLabel:
+        """
+        Classify index tip motion when the point history has a new valid point.
 
-        return self._last_stable_gesture
+        Frames without pointing skip the model entirely.
 
+        Returns:
+            Most common motion label over recent pointing frames
+        """
+        history = self._point_history
+        if not history.has_new_point:
+            self._motion_history.clear()
+            return MotionGestureLabel.NONE
+        history.has_new_point = False
+
+        if self._point_history_classifier is None or not history.is_full:
+            return MotionGestureLabel.NONE
+
+        motion, _ = self._point_history_classifier.classify(
+            history.ordered(self._ordered_points), image_size
+        )
+        self._motion_history.append(motion)
+        return Counter(self._motion_history).most_common(1)[0][0]
+
+    @staticmethod
     def _calc_bounding_box(
-        self,
-        landmarks: List[HandLandmark],
+        points: np.ndarray,
         image_width: int,
         image_height: int
     ) -> Tuple[int, int, int, int]:
-        """Calculate bounding box around hand landmarks."""
-        x_coords = [int(lm.x * image_width) for lm in landmarks]
-        y_coords = [int(lm.y * image_height) for lm in landmarks]
-
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
+        """Calculate bounding box around hand landmarks from (21, 2) pixel positions."""
+        x_min, y_min = points.min(axis=0).tolist()
+        x_max, y_max = points.max(axis=0).tolist()
 
         # Add padding
         padding = 20
@@ -348,75 +885,117 @@ class HandGestureDetector:
 
         return (x_min, y_min, x_max - x_min, y_max - y_min)
 
-    def detect(self, image: np.ndarray) -> Optional[HandGestureResult]:
+    def detect_all(self, image: np.ndarray) -> List[HandGestureResult]:
         """
-        Detect hand gesture in an image.
+        Detect every hand (up to max_num_hands) and its gesture.
+
+        Each hand keeps its own smoothing and stability state, and gesture
+        geometry for all hands is computed in one batched pass. Hands taking
+        part in a two-hand gesture both report it.
 
         Args:
             image: BGR image from OpenCV (numpy array)
 
         Returns:
-            HandGestureResult if hand detected, None otherwise
+            One HandGestureResult per hand, in MediaPipe order
         """
-        # Convert BGR to RGB for MediaPipe
-        image_rgb = cv.cvtColor(image, cv.COLOR_BGR2RGB)
-        image_rgb.flags.writeable = False
+        # Scaled (and possibly cropped) RGB input for MediaPipe
+        roi = self._next_roi(image.shape)
+        self._set_input_roi(roi)
+        image_rgb = self._preprocessor.prepare(image, roi)
 
         # Process with MediaPipe
         results = self.hands.process(image_rgb)
+        self._mediapipe_tracking = bool(results.multi_hand_landmarks)
 
         if not results.multi_hand_landmarks:
             # No hand detected
-            self._point_history.append((0, 0))
-            return None
-
-        # Get first hand (TODO: support multiple hands)
-        hand_landmarks = results.multi_hand_landmarks[0]
-        handedness = results.multi_handedness[0].classification[0].label
+            self._roi_boxes = []
+            self._match_tracks([])
+            self._point_history.append(None)
+            self._motion_history.clear()
+            return []
+
+        handedness = [
+            hand.classification[0].label for hand in results.multi_handedness
+        ]
+        tracks = self._match_tracks(handedness)
 
-        # Convert to our landmark format
+        # Convert to our landmark format in full-frame coordinates, then smooth per hand
         h, w = image.shape[:2]
-        landmarks = [
-            HandLandmark(x=lm.x, y=lm.y, z=lm.z)
-            for lm in hand_landmarks.landmark
-        ]
+        raw = self._preprocessor.to_frame(np.array(
+            [[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in results.multi_hand_landmarks],
+            dtype=np.float32,
+        ), (w, h))
+        landmarks = np.stack([track.smooth(hand) for track, hand in zip(tracks, raw)])
+
+        # Classify gestures (geometry batched over hands, shared with results)
+        features = HandFeatures.batch(landmarks)
+        gestures = self._classify_gestures(landmarks, features, (w, h))
+
+        # Pixel positions once for all hands, shared by bounding boxes, motion and drawing
+        pixels = pixel_landmarks(landmarks, (w, h))
+
+        # Two-hand gestures override the per-hand labels of both hands
+        two_hand = self._classify_two_hand_gesture(features)
+        if two_hand is not None:
+            gestures[0] = gestures[1] = two_hand
+
+        hand_results = []
+        pointing_tip = None
+        pointing_result = None
+        for track, hand, points, label, (gesture, confidence) in zip(
+            tracks, features, pixels, handedness, gestures
+        ):
+            # Apply stability
+            stable_gesture = track.stabilize(gesture)
+
+            # Track index finger tip of the first pointing hand
+            if stable_gesture == GestureLabel.INDEX_POINTING and pointing_tip is None:
+                pointing_tip = tuple(points[self.INDEX_TIP].tolist())
+
+            hand_results.append(HandGestureResult(
+                gesture=stable_gesture,
+                confidence=confidence,
+                landmarks=hand.landmarks,
+                bounding_box=self._calc_bounding_box(points, w, h),
+                handedness=label,
+                finger_states=hand.finger_states,
+                pixel_landmarks=points,
+                frame_size=(w, h),
+            ))
+            if pointing_tip is not None and pointing_result is None:
+                pointing_result = hand_results[-1]
 
-        # Smooth landmarks
-        landmarks = self._smooth_landmarks(landmarks)
+        self._roi_boxes = [result.bounding_box for result in hand_results]
 
-        # Classify gesture
-        gesture, confidence = self._classify_gesture(landmarks)
+        # Motion tracking for the index finger tip
+        self._point_history.append(pointing_tip)
+        motion_gesture = self._update_motion_gesture((w, h))
+        if pointing_result is not None:
+            pointing_result.motion_gesture = motion_gesture
 
-        # Apply stability
-        stable_gesture = self._stabilize_gesture(gesture)
+        return hand_results
 
-        # Calculate bounding box
-        bbox = self._calc_bounding_box(landmarks, w, h)
+    def detect(self, image: np.ndarray) -> Optional[HandGestureResult]:
+        """
+        Detect hand gesture in an image.
 
-        # Get finger states
-        finger_states = self._get_finger_states(landmarks)
+        Args:
+            image: BGR image from OpenCV (numpy array)
 
-        # Track index finger tip for motion detection
-        if stable_gesture == GestureLabel.INDEX_POINTING:
-            index_tip = landmarks[self.INDEX_TIP]
-            self._point_history.append((int(index_tip.x * w), int(index_tip.y * h)))
-        else:
-            self._point_history.append((0, 0))
-
-        return HandGestureResult(
-            gesture=stable_gesture,
-            confidence=confidence,
-            landmarks=landmarks,
-            bounding_box=bbox,
-            handedness=handedness,
-            finger_states=finger_states,
-        )
+        Returns:
+            HandGestureResult for the first hand if detected, None otherwise
+        """
+        results = self.detect_all(image)
+        return results[0] if results else None
 
     def draw_landmarks(
         self,
         image: np.ndarray,
         result: HandGestureResult,
-        draw_gesture_label: bool = True
+        draw_gesture_label: bool = True,
+        draw_point_history: bool = True
     ) -> np.ndarray:
         """
         Draw hand landmarks and gesture label on image.
@@ -425,6 +1004,7 @@ class HandGestureDetector:
             image: BGR image to draw on
             result: Detection result
             draw_gesture_label: Whether to draw gesture label
+            draw_point_history: Whether to draw the index tip motion trail
 
         Returns:
             Image with drawings
@@ -433,69 +1013,105 @@ class HandGestureDetector:
             return image
 
         h, w = image.shape[:2]
-        landmarks = result.landmarks
-
-        # Draw connections (simplified)
-        connections = [
-            # Thumb
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            # Index
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            # Middle
-            (0, 9), (9, 10), (10, 11), (11, 12),
-            # Ring
-            (0, 13), (13, 14), (14, 15), (15, 16),
-            # Pinky
-            (0, 17), (17, 18), (18, 19), (19, 20),
-            # Palm
-            (5, 9), (9, 13), (13, 17),
-        ]
+        draw_skeletons(image, [result_pixels(result, (w, h))])
+        _draw_box_and_label(image, result, draw_gesture_label)
 
-        for start, end in connections:
-            pt1 = (int(landmarks[start].x * w), int(landmarks[start].y * h))
-            pt2 = (int(landmarks[end].x * w), int(landmarks[end].y * h))
-            cv.line(image, pt1, pt2, (255, 255, 255), 2)
-            cv.line(image, pt1, pt2, (142, 85, 114), 1)  # Purple overlay
-
-        # Draw landmark points
-        for i, lm in enumerate(landmarks):
-            cx, cy = int(lm.x * w), int(lm.y * h)
-            # Fingertips larger
-            size = 8 if i in [4, 8, 12, 16, 20] else 5
-            cv.circle(image, (cx, cy), size, (255, 255, 255), -1)
-            cv.circle(image, (cx, cy), size, (142, 85, 114), 2)
-
-        # Draw bounding box
-        x, y, bw, bh = result.bounding_box
-        cv.rectangle(image, (x, y), (x + bw, y + bh), (142, 85, 114), 2)
-
-        # Draw gesture label
-        if draw_gesture_label:
-            label = f"{result.gesture.value} ({result.confidence:.0%})"
-            label_bg_y = max(y - 30, 30)
-
-            # Background for text
-            (text_w, text_h), _ = cv.getTextSize(label, cv.FONT_HERSHEY_SIMPLEX, 0.7, 2)
-            cv.rectangle(image, (x, label_bg_y - text_h - 5), (x + text_w + 10, label_bg_y + 5), (142, 85, 114), -1)
-            cv.putText(image, label, (x + 5, label_bg_y), cv.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-
-        # Draw point history (motion trail)
-        for i, point in enumerate(self._point_history):
-            if point[0] != 0 or point[1] != 0:
-                thickness = 1 + i // 4
-                cv.circle(image, point, thickness, (152, 251, 152), -1)
+        if draw_point_history:
+            self.draw_point_history(image)
 
         return image
 
+    def draw_all_landmarks(
+        self,
+        image: np.ndarray,
+        results: List[HandGestureResult],
+        draw_gesture_label: bool = True,
+        point_history: Optional[PointHistory] = None
+    ) -> np.ndarray:
+        """
+        Draw every hand from detect_all() (skeletons batched) and the motion trail once.
+
+        point_history overrides this detector's trail (see draw_hand_results).
+        """
+        history = self._point_history if point_history is None else point_history
+        return draw_hand_results(image, results, history, draw_gesture_label)
+
+    @property
+    def point_history(self) -> PointHistory:
+        """Index finger tip trail of the pointing hand."""
+        return self._point_history
+
+    def draw_point_history(
+        self,
+        image: np.ndarray,
+        point_history: Optional[PointHistory] = None
+    ) -> np.ndarray:
+        """Draw the index finger tip motion trail (this detector's unless one is given)."""
+        return draw_point_history(image, self._point_history if point_history is None else point_history)
+
+    def reset(self) -> None:
+        """
+        Reset smoothing, stability and motion tracking state.
+
+        MediaPipe's own tracking (video mode) is not reset; use static
+        image mode where images are unrelated.
+        """
+        self._tracks.clear()
+        self._roi_boxes = []
+        self._roi = None
+        self._frames_since_full_frame = 0
+        self._point_history.clear()
+        self._motion_history.clear()
+
     def close(self) -> None:
         """Release resources."""
         self.hands.close()
 
 
+# Shared detector behind the convenience function
+_shared_detector: Optional[HandGestureDetector] = None
+_shared_lock = threading.RLock()
+
+
+def get_shared_hand_detector() -> HandGestureDetector:
+    """
+    Get the process-wide detector used by detect_gesture().
+
+    Created on first use, so the MediaPipe Hands graph is built once per
+    process. The graph runs in static image mode: in video mode MediaPipe
+    tracks hands from the previous image's landmarks, so one caller's image
+    would change the next caller's result. Callers using it directly from
+    several threads must serialize access themselves; detect_gesture()
+    already does.
+    """
+    global _shared_detector
+    with _shared_lock:
+        if _shared_detector is None:
+            _shared_detector = HandGestureDetector(replace(DEFAULT_CONFIG.vision, static_image_mode=True))
+        return _shared_detector
+
+
+def release_shared_hand_detector() -> None:
+    """Close the shared detector's MediaPipe graph; the next call creates a new one."""
+    global _shared_detector
+    with _shared_lock:
+        if _shared_detector is not None:
+            _shared_detector.close()
+            _shared_detector = None
+
+
+atexit.register(release_shared_hand_detector)
+
+
 # Convenience function for quick detection
 def detect_gesture(image: np.ndarray) -> Optional[HandGestureResult]:
-    """Quick gesture detection without managing detector instance."""
-    detector = HandGestureDetector()
-    result = detector.detect(image)
-    detector.close()
-    return result
+    """
+    Quick gesture detection without managing detector instance.
+
+    Thread-safe. Reuses the shared detector but resets its smoothing and
+    stability state, so every call is classified on its own.
+    """
+    with _shared_lock:
+        detector = get_shared_hand_detector()
+        detector.reset()
+        return detector.detect(image)
@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Empathic-01 Staged Pipeline
+
+Optional multi-process architecture for EmpathicSystem:
+- capture process: reads the camera (or another FrameSource) and mirrors
+  frames into a SharedFrameRing
+- face process: FaceEmotionDetector on the newest frame
+- hands process: HandGestureDetector on the newest frame
+- main process: fusion (state machine), UI and audio
+
+Frames go through shared memory (each reader takes one memcpy out of
+the ring); only FrameRef values and detector results go through queues. Each detector process always takes the newest frame,
+so a slow stage skips frames instead of building a backlog (unpaced replay
+instead makes capture wait until every detector has taken each frame), and
+DeepFace and MediaPipe no longer compete for one interpreter's GIL. A stage that
+crashes is restarted without taking the others down; a detector stage that
+keeps crashing is disabled and the rest run on without it.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from pathlib import Path
+import multiprocessing as mp
+import queue
+import time
+
+import numpy as np
+import cv2 as cv
+
+# Add parent to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.config import VisionConfig, DEFAULT_CONFIG
+from senses.frame_sources import create_frame_source
+from senses.shared_frame_ring import FrameRef, SharedFrameRing
+
+
+DETECTOR_STAGES = ("face", "hands")
+STAGES = ("capture",) + DETECTOR_STAGES
+
+
+@dataclass
+class StageResult:
+    """Detector output for one frame, sent from a stage process to fusion."""
+    stage: str  # "face" or "hands"
+    frame: FrameRef
+    payload: Any  # face: Optional[EmotionResult]; hands: (List[HandGestureResult], PointHistory)
+    inference_ms: float
+    skipped_frames: int  # Frames published while the stage was busy, since the stage started
+    overwritten_frames: int  # Frames lost because the slot was reused before it could be copied
+
+
+@dataclass
+class StageStats:
+    """Per-stage counters kept by the main process."""
+    results: int = 0
+    skipped_frames: int = 0
+    overwritten_frames: int = 0
+    restarts: int = 0
+    last_sequence: int = -1  # Newest frame a result arrived for
+    disabled: bool = False  # Ran out of restarts; fusion gets no results from it
+
+
+def _wait_taken(taken: List[Any], taken_event: Any, sequence: int, ready: List[Any], stop: Any) -> None:
+    """Block until every detector has copied frame `sequence` out of the ring."""
+    while not stop.is_set():
+        taken_event.clear()
+        if all(value.value >= sequence for value in taken):
+            return
+        if not taken_event.wait(0.1):
+            for event in ready:
+                event.set()  # A restarted stage may have missed the wake-up
+
+
+def _capture_main(
+    config: VisionConfig,
+    source: Union[int, str],
+    ring_name: str,
+    shape: Tuple[int, int, int],
+    slots: int,
+    ready: List[Any],
+    stop: Any,
+    realtime: bool,
+    taken: List[Any],
+    taken_event: Any
+) -> None:
+    """
+    Capture process: read, mirror into the next ring slot, wake the detectors.
+
+    Unpaced replay then waits until every detector has taken the frame,
+    so none is skipped; live and real-time input never waits.
+    """
+    capture = create_frame_source(source, config, realtime=realtime)
+    if not capture.open():
+        print(f"[StagedPipeline] capture: could not open {capture}")
+        sys.exit(1)
+    ring = SharedFrameRing(shape, slots, name=ring_name, create=False)
+
+    h, w = shape[:2]
+    failures = 0
+    try:
+        while not stop.is_set():
+            ret, frame = capture.read()
+            if not ret:
+                if not capture.isOpened():
+                    break  # End of a recording
+                failures += 1
+                if failures % 100 == 0:
+                    print(f"[StagedPipeline] capture: {failures} failed reads")
+                time.sleep(0.01)
+                continue
+
+            if frame.shape != shape:
+                frame = cv.resize(frame, (w, h))
+            slot, view = ring.begin_write()
+            cv.flip(frame, 1, dst=view)  # Mirror straight into shared memory
+            view = None
+            ref = ring.end_write(slot, time.time())
+            for event in ready:
+                event.set()
+            if not (capture.live or capture.realtime):
+                _wait_taken(taken, taken_event, ref.sequence, ready, stop)
+    finally:
+        capture.release()
+        ring.close()
+
+
+def _create_detector(stage: str, config: VisionConfig) -> Callable[[np.ndarray], Any]:
+    """Build a stage's detector inside its process; returns frame -> payload."""
+    if stage == "face":
+        from senses.vision_face import FaceEmotionDetector
+
+        face_detector = FaceEmotionDetector(config)
+        return face_detector.detect
+
+    from senses.vision_hands import HandGestureDetector
+
+    hand_detector = HandGestureDetector(config)
+    return lambda frame: (hand_detector.detect_all(frame), hand_detector.point_history)
+
+
+def _detector_main(
+    stage: str,
+    config: VisionConfig,
+    ring_name: str,
+    shape: Tuple[int, int, int],
+    slots: int,
+    ready: Any,
+    stop: Any,
+    results: Any,
+    taken: Any,
+    taken_event: Any
+) -> None:
+    """Detector process: run on the newest frame each time one is published."""
+    results.cancel_join_thread()  # Never block process exit on undelivered results
+    ring = SharedFrameRing(shape, slots, name=ring_name, create=False)
+    detect = _create_detector(stage, config)
+
+    frame = np.empty(shape, dtype=np.uint8)  # Private copy, so capture can lap the ring meanwhile
+    last_sequence = -1
+    skipped = overwritten = 0
+    try:
+        while not stop.is_set():
+            if not ready.wait(0.1):
+                continue
+            ready.clear()
+            ref = ring.latest()
+            if ref is None or ref.sequence <= last_sequence:
+                continue
+            if last_sequence >= 0:
+                skipped += ref.sequence - last_sequence - 1
+            last_sequence = ref.sequence
+
+            # One memcpy per frame; detection then cannot see a half-overwritten slot
+            copied = ring.copy(ref, frame) is not None
+            taken.value = ref.sequence
+            taken_event.set()
+            if not copied:
+                overwritten += 1
+                continue
+
+            start = time.perf_counter()
+            payload = detect(frame)
+            inference_ms = (time.perf_counter() - start) * 1000
+            results.put(StageResult(stage, ref, payload, inference_ms, skipped, overwritten))
+    finally:
+        ring.close()
+
+
+class StagedPipeline:
+    """
+    Capture and detector processes around a shared-memory frame ring.
+
+    The main process owns the ring and the result queue, polls results,
+    copies the frames it displays out of the ring, and restarts stages
+    that die (up to max_restarts each; then a detector stage is disabled).
+    """
+
+    def __init__(
+        self,
+        config: Optional[VisionConfig] = None,
+        source: Union[int, str, None] = None,
+        slots: int = 6,
+        max_restarts: int = 3,
+        realtime: bool = True
+    ):
+        """
+        Args:
+            config: Vision configuration, passed to every stage process
+            source: Camera index, video file, image directory or "synthetic"
+                (default: config.camera_device; see create_frame_source)
+            slots: Ring slots; more slots give slow readers longer to copy a
+                frame before the capture process reuses its slot
+            max_restarts: Restarts per stage before a detector stage is
+                disabled, or the pipeline stops (capture)
+            realtime: Replay recorded and synthetic input at its frame rate;
+                False reads as fast as capture can go (detectors still skip
+                to the newest frame)
+        """
+        self.config = config or DEFAULT_CONFIG.vision
+        self.source = self.config.camera_device if source is None else source
+        self.slots = slots
+        self.max_restarts = max_restarts
+        self.realtime = realtime
+        self.shape = (self.config.frame_height, self.config.frame_width, 3)
+        self.stats: Dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+        self.finished = False  # Source ended (video files)
+        self._final_sequence = -1  # Last frame of an ended source
+
+        # Unpaced replay: detectors see every frame, and results are grouped per frame
+        probe = create_frame_source(self.source, self.config, realtime=realtime)
+        self.every_frame = not (probe.live or probe.realtime)
+        self._waiting: Dict[int, Dict[str, StageResult]] = {}
+
+        # Spawn: MediaPipe and TensorFlow do not survive fork() after their threads start
+        self._ctx = mp.get_context("spawn")
+        self.ring: Optional[SharedFrameRing] = None
+        self._processes: Dict[str, Any] = {}
+        self._stop = self._ctx.Event()
+        self._results = self._ctx.Queue()
+        self._ready = {stage: self._ctx.Event() for stage in DETECTOR_STAGES}
+        # Newest sequence each detector copied out of the ring (capture waits on it)
+        self._taken = {stage: self._ctx.Value("q", -1, lock=False) for stage in DETECTOR_STAGES}
+        self._taken_event = self._ctx.Event()
+
+    def start(self) -> None:
+        """Create the frame ring and start every stage process."""
+        self.ring = SharedFrameRing(self.shape, self.slots)
+        self._stop.clear()
+        for stage in STAGES:
+            self._start_stage(stage)
+        print(f"[StagedPipeline] Started {', '.join(STAGES)} processes "
+              f"({self.slots} x {self.shape[1]}x{self.shape[0]} frame ring)")
+
+    def _start_stage(self, stage: str) -> None:
+        if stage == "capture":
+            target = _capture_main
+            args = (self.config, self.source, self.ring.name, self.shape, self.slots,
+                    list(self._ready.values()), self._stop, self.realtime,
+                    list(self._taken.values()), self._taken_event)
+        else:
+            target = _detector_main
+            args = (stage, self.config, self.ring.name, self.shape, self.slots,
+                    self._ready[stage], self._stop, self._results,
+                    self._taken[stage], self._taken_event)
+        process = self._ctx.Process(target=target, args=args, name=f"empathic-{stage}", daemon=True)
+        process.start()
+        self._processes[stage] = process
+
+    def poll(self, timeout: float = 0.05) -> List[StageResult]:
+        """
+        Wait up to timeout for results, then drain everything queued.
+
+        Returns:
+            Results in arrival order (possibly empty)
+        """
+        results = []
+        try:
+            results.append(self._results.get(timeout=timeout))
+            while True:
+                results.append(self._results.get_nowait())
+        except queue.Empty:
+            pass
+
+        for result in results:
+            stats = self.stats[result.stage]
+            stats.results += 1
+            stats.skipped_frames = result.skipped_frames
+            stats.overwritten_frames = result.overwritten_frames
+            stats.last_sequence = max(stats.last_sequence, result.frame.sequence)
+        return results
+
+    def frame_results(self, results: List[StageResult], flush: bool = False) -> List[List[StageResult]]:
+        """
+        Group polled results into the batches fusion should handle, oldest first.
+
+        Live and real-time input: all results as one batch (fusion takes
+        the newest frame). Unpaced replay: one batch per frame, once every
+        running detector has reported it, or a newer frame has been
+        completed, or on flush (the pipeline is ending).
+        """
+        if not self.every_frame:
+            return [results] if results else []
+
+        for result in results:
+            self._waiting.setdefault(result.frame.sequence, {})[result.stage] = result
+        running = set(DETECTOR_STAGES) - set(self.disabled_stages())
+        complete = [sequence for sequence, stages in self._waiting.items() if running <= set(stages)]
+        if flush:
+            ready = sorted(self._waiting)
+        elif complete:
+            newest = max(complete)
+            ready = sorted(sequence for sequence in self._waiting if sequence <= newest)
+        else:
+            return []
+        return [list(self._waiting.pop(sequence).values()) for sequence in ready]
+
+    def frame(self, ref: FrameRef, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Copy a frame out of the ring (into out, if given); None if it has already been overwritten."""
+        return self.ring.copy(ref, out)
+
+    def disabled_stages(self) -> List[str]:
+        """Detector stages that ran out of restarts."""
+        return [stage for stage in DETECTOR_STAGES if self.stats[stage].disabled]
+
+    def _drained(self) -> bool:
+        """Whether every running detector has reported the ended source's last frame."""
+        return all(
+            self.stats[stage].disabled or self.stats[stage].last_sequence >= self._final_sequence
+            for stage in DETECTOR_STAGES
+        )
+
+    def check_stages(self) -> bool:
+        """
+        Restart stages that exited; disable detector stages that keep exiting.
+
+        Returns:
+            False once the source has ended and the detectors have reported
+            its last frame, or when capture ran out of restarts
+        """
+        for stage, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            if stage == "capture" and process.exitcode == 0:
+                if not self.finished:
+                    self.finished = True
+                    latest = self.ring.latest()
+                    self._final_sequence = latest.sequence if latest is not None else -1
+                continue
+            stats = self.stats[stage]
+            if stats.restarts >= self.max_restarts:
+                if stage == "capture":
+                    print(f"[StagedPipeline] capture stage exited (code {process.exitcode}); giving up")
+                    return False
+                print(f"[StagedPipeline] {stage} stage exited (code {process.exitcode}); "
+                      f"disabled, running without it")
+                stats.disabled = True
+                del self._processes[stage]
+                self._taken[stage].value = sys.maxsize  # Capture must not wait for it
+                self._taken_event.set()
+                continue
+            print(f"[StagedPipeline] {stage} stage exited (code {process.exitcode}); restarting")
+            stats.restarts += 1
+            self._start_stage(stage)
+        return not (self.finished and self._drained())
+
+    def stop(self) -> None:
+        """Stop every stage process and release the frame ring."""
+        self._stop.set()
+        for process in self._processes.values():
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1.0)
+        self._processes.clear()
+
+        # Drop results still queued so the queue's feeder thread can exit
+        try:
+            while True:
+                self._results.get_nowait()
+        except queue.Empty:
+            pass
+
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+        summary = ", ".join(
+            f"{stage} {stats.results} results / {stats.skipped_frames} skipped"
+            + (" (disabled)" if stats.disabled else "")
+            for stage, stats in self.stats.items() if stage in DETECTOR_STAGES
+        )
+        print(f"[StagedPipeline] Stopped ({summary})")
@@ -0,0 +1,38 @@
+"""
+Shared test setup: import path and allocation measurement.
+
+Run from src_python with: python -m pytest -q tests
+"""
+
+from typing import Callable, List
+import tracemalloc
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _allocation_peaks(fn: Callable[[], object], calls: int, warmup: int = 5) -> List[int]:
+    """Transient peak bytes allocated by each of `calls` calls, after warm-up calls."""
+    for _ in range(warmup):
+        fn()
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+@pytest.fixture
+def allocation_peaks() -> Callable[..., List[int]]:
+    """Measure per-call peak allocations with tracemalloc: allocation_peaks(fn, calls)."""
+    return _allocation_peaks
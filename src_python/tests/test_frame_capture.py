@@ -0,0 +1,92 @@
+"""ThreadedCapture newest-frame delivery, dropped-frame counting and release."""
+
+import threading
+import time
+
+from senses.frame_capture import ThreadedCapture
+from senses.frame_sources import SyntheticSource
+
+
+def _wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        time.sleep(0.005)
+    assert condition()
+
+
+def test_unread_frames_are_dropped():
+    source = SyntheticSource(width=64, height=48, frames=50, realtime=False)
+    capture = ThreadedCapture(source=source)
+    assert capture.open()
+    # The thread reads the whole recording before any read()
+    _wait_until(lambda: not capture.isOpened())
+
+    ret, frame = capture.read()
+    assert ret and frame.shape == (48, 64, 3)
+    assert capture.frames_read == 50
+    # Frames 0..48 were each replaced by a newer one before anyone read them
+    assert capture.dropped_frames == 49
+    assert capture.read() == (False, None)
+    capture.release()
+
+
+def test_read_returns_newest_frame():
+    source = SyntheticSource(width=64, height=48, frames=0, fps=200.0)
+    capture = ThreadedCapture(source=source)
+    assert capture.open()
+
+    indices = []
+    for _ in range(10):
+        time.sleep(0.02)  # A slow consumer: several frames arrive per read
+        newest = capture.frames_read - 1
+        captured = capture.latest()
+        assert captured is not None and captured.index >= newest
+        indices.append(captured.index)
+    capture.release()
+
+    assert indices == sorted(set(indices))
+    # Every frame was either returned, dropped, or is the newest one still unread
+    unread = capture.frames_read - len(indices) - capture.dropped_frames
+    assert unread in (0, 1)
+    assert capture.dropped_frames > 0
+
+
+class BlockingSource(SyntheticSource):
+    """Synthetic source whose reads after the first block until unblocked."""
+
+    def __init__(self):
+        super().__init__(width=64, height=48, frames=0, realtime=False)
+        self.in_read = threading.Event()
+        self.unblock = threading.Event()
+        self.reading = False
+        self.released_while_reading = False
+        self.release_calls = 0
+
+    def _read(self, image):
+        if self.frames_read > 0:
+            self.reading = True
+            self.in_read.set()
+            self.unblock.wait()
+            self.reading = False
+        return super()._read(image)
+
+    def _release(self):
+        self.released_while_reading |= self.reading
+        self.release_calls += 1
+        super()._release()
+
+
+def test_release_waits_for_read_in_progress():
+    source = BlockingSource()
+    capture = ThreadedCapture(source=source)
+    assert capture.open()
+    assert source.in_read.wait(1.0)
+
+    capture.release(timeout=0.05)
+    assert source.release_calls == 0  # The thread is still inside read()
+
+    source.unblock.set()
+    _wait_until(lambda: source.release_calls > 0)
+    assert source.release_calls == 1
+    assert not source.released_while_reading
+    assert not source.isOpened()
@@ -0,0 +1,112 @@
+"""FrameBufferPool reuse and thread safety, and the pooled per-frame loop."""
+
+import threading
+
+import numpy as np
+
+from senses.frame_pool import FrameBufferPool
+
+SHAPE = (48, 64, 3)
+
+
+def test_acquire_reuses_released_buffers():
+    pool = FrameBufferPool(SHAPE, size=2)
+    a, b = pool.acquire(), pool.acquire()
+    assert a is not b and a.shape == SHAPE and a.dtype == np.uint8
+    assert pool.free == 0
+
+    pool.release(a)
+    pool.release(a)  # Released twice, handed out once
+    assert pool.free == 1
+    assert pool.acquire() is a
+    assert pool.allocations == 2
+
+
+def test_dry_pool_grows_and_keeps_the_extra_buffer():
+    pool = FrameBufferPool(SHAPE, size=1)
+    buffers = [pool.acquire() for _ in range(3)]
+    assert pool.allocations == 3
+    for buffer in buffers:
+        pool.release(buffer)
+    assert pool.free == 3
+
+
+def test_release_ignores_views_and_other_shapes():
+    pool = FrameBufferPool(SHAPE, size=1)
+    buffer = pool.acquire()
+    pool.release(buffer[:10])
+    pool.release(np.empty((10, 10, 3), dtype=np.uint8))
+    pool.release(None)
+    assert pool.free == 0
+
+
+def test_new_shape_drops_old_buffers():
+    pool = FrameBufferPool(SHAPE, size=2)
+    old = pool.acquire()
+    new = pool.acquire((24, 32, 3))
+    assert new.shape == (24, 32, 3) and pool.free == 0
+    pool.release(old)  # Old shape: not taken back
+    pool.release(new)
+    assert pool.free == 1 and pool.allocations == 1
+
+
+def test_concurrent_acquire_release_never_shares_a_buffer():
+    pool = FrameBufferPool(SHAPE, size=2)
+    threads, iterations = 8, 500
+    errors = []
+    start = threading.Barrier(threads)
+
+    def worker(marker: int):
+        start.wait()
+        for _ in range(iterations):
+            buffer = pool.acquire()
+            buffer.fill(marker)
+            if not (buffer == marker).all():  # Another thread wrote to it meanwhile
+                errors.append(marker)
+            pool.release(buffer)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    assert not errors
+    # Never more buffers than holders, and every one came back exactly once
+    assert pool.allocations <= threads
+    assert pool.free == pool.allocations
+    assert len({id(buffer) for buffer in pool._free}) == pool.free
+
+
+def test_pooled_frame_loop_allocates_no_frames(allocation_peaks):
+    # Read, mirror, draw the UI and release, as the main loop does per frame
+    from benchmark import _ui_system
+    from main import FrameData
+    from senses.frame_sources import SyntheticSource
+
+    w, h = 320, 240
+    system, template = _ui_system((w, h))
+    source = SyntheticSource(w, h, frames=0, realtime=False)
+    source.open()
+    system.camera = source
+    preallocated = system._frame_pool.allocations
+
+    def frame():
+        _, captured = system._read_frame()
+        mirrored = system._mirror(captured)
+        frame_data = FrameData(
+            frame=mirrored,
+            emotion_result=template.emotion_result,
+            gesture_result=template.gesture_result,
+            gesture_results=template.gesture_results,
+            fps=30.0,
+        )
+        system._frame_pool.release(system._draw_ui(frame_data))
+        system._frame_pool.release(mirrored)
+
+    try:
+        peaks = allocation_peaks(frame, 50)
+    finally:
+        source.release()
+    assert max(peaks) < w * h * 3
+    assert system._frame_pool.allocations == preallocated
@@ -0,0 +1,254 @@
+"""
+Vectorized hand geometry and rule classification vs the original per-landmark
+rules, plus the two-hand rules and per-hand tracks (no MediaPipe graph needed).
+"""
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from core.config import GestureLabel, VisionConfig
+from evaluation.gesture_data import GESTURE_ORDER, canonical_pose, synthetic_hand
+from evaluation.gesture_reference import ReferenceGestureRules, to_landmark_list
+from senses.vision_hands import (
+    FINGER_NAMES,
+    HandFeatures,
+    hand_geometry,
+    joint_angles,
+    key_distances,
+)
+
+REFERENCE = ReferenceGestureRules()
+
+
+def _canonical_hands() -> List[np.ndarray]:
+    hands = []
+    for label in GESTURE_ORDER:
+        pose = canonical_pose(label)
+        if pose is not None:
+            hands.extend(pose)
+    return hands
+
+
+# Finger bends whose joint angles (180 - bend) sit on the rules' thresholds:
+# extended > 150, curled < 130, thumb > 120, heart index 90..160
+THRESHOLD_BENDS = np.array([30.0, 50.0, 60.0, 20.0, 90.0])
+
+
+def _random_hands(count: int = 2500) -> List[np.ndarray]:
+    """
+    Seeded poses: random finger bends, bends within a degree of a rule
+    threshold, noisy canonical poses, canonical poses with the thumb tip
+    moved around the index tip (OK sign, heart), and unstructured points.
+    """
+    rng = np.random.default_rng(0)
+    canonical = _canonical_hands()
+    hands = []
+    for i in range(count):
+        kind = i % 5
+        if kind == 0:
+            hand = synthetic_hand(tuple(rng.uniform(0, 180, 5)))
+        elif kind == 1:
+            # Thumb bent either way from a random direction, so its angle and tip
+            # distance vary independently; landmark jitter puts a finger's two
+            # joints on different sides of a threshold
+            bends = rng.choice(THRESHOLD_BENDS, 5) + rng.uniform(-1.0, 1.0, 5)
+            bends[0] *= rng.choice([-1.0, 1.0])
+            direction = rng.uniform(0, 2 * np.pi)
+            hand = synthetic_hand(tuple(bends), (np.cos(direction), np.sin(direction)))
+            hand[:, :2] += rng.normal(0, 0.0005, (21, 2)).astype(np.float32)
+        elif kind == 2:
+            hand = canonical[i % len(canonical)].copy()
+            hand[:, :2] += rng.normal(0, rng.uniform(0.002, 0.03), (21, 2)).astype(np.float32)
+        elif kind == 3:
+            if rng.random() < 0.5:
+                hand = canonical[i % len(canonical)].copy()
+            else:
+                hand = synthetic_hand(tuple(rng.choice(THRESHOLD_BENDS, 5) + rng.uniform(-1.0, 1.0, 5)))
+            hand[4, :2] = hand[8, :2] + rng.uniform(-0.06, 0.06, 2)
+        else:
+            hand = rng.uniform(0, 1, (21, 3)).astype(np.float32)
+        hands.append(hand)
+    return hands
+
+
+def _degenerate_hands() -> List[np.ndarray]:
+    """Zero-length bones: joints collapsed onto their neighbor, and a hand in one point."""
+    base = synthetic_hand((30, 60, 90, 120, 150))
+    hands = [np.zeros((21, 3), dtype=np.float32), np.full((21, 3), 0.5, dtype=np.float32)]
+    for joint in range(1, 21):
+        hand = base.copy()
+        hand[joint] = hand[joint - 1]
+        hands.append(hand)
+    fingers_collapsed = base.copy()
+    for mcp in (5, 9, 13, 17):
+        fingers_collapsed[mcp:mcp + 4] = fingers_collapsed[mcp]
+    hands.append(fingers_collapsed)
+    return hands
+
+
+HANDS = {
+    "canonical": _canonical_hands(),
+    "random": _random_hands(),
+    "degenerate": _degenerate_hands(),
+}
+
+
+@pytest.mark.parametrize("kind", HANDS)
+def test_angles_and_distances_match_reference(kind):
+    hands = HANDS[kind]
+    expected_angles = np.array([REFERENCE.angles(to_landmark_list(hand)) for hand in hands])
+    expected_distances = np.array([REFERENCE.distances(to_landmark_list(hand)) for hand in hands])
+
+    # Per hand and batched
+    for angles, distances in (
+        (np.array([joint_angles(hand) for hand in hands]), np.array([key_distances(hand) for hand in hands])),
+        (joint_angles(np.stack(hands)), key_distances(np.stack(hands))),
+    ):
+        assert np.all(np.isfinite(angles))
+        np.testing.assert_allclose(angles, expected_angles, atol=1e-3)
+        np.testing.assert_allclose(distances, expected_distances, atol=1e-6)
+
+
+@pytest.mark.parametrize("kind", HANDS)
+def test_finger_states_match_reference(kind):
+    for hand in HANDS[kind]:
+        expected = REFERENCE.finger_states(to_landmark_list(hand))
+        _, _, extended, _ = hand_geometry(hand)
+        assert dict(zip(FINGER_NAMES, extended.tolist())) == {name: expected[name] for name in FINGER_NAMES}
+        assert HandFeatures(hand).finger_states == expected
+
+
+@pytest.fixture(scope="module")
+def detector():
+    mp = pytest.importorskip("mediapipe")
+    if not hasattr(mp, "solutions"):
+        pytest.skip("mediapipe.solutions is not available")
+    from senses.vision_hands import HandGestureDetector
+
+    detector = HandGestureDetector()
+    yield detector
+    detector.close()
+
+
+@pytest.mark.parametrize("kind", HANDS)
+def test_classification_matches_reference(detector, kind):
+    hands = HANDS[kind]
+    expected = [REFERENCE.classify(to_landmark_list(hand)) for hand in hands]
+    assert [detector._classify_gesture(HandFeatures(hand)) for hand in hands] == expected
+    assert [detector._classify_gesture(features) for features in HandFeatures.batch(np.stack(hands))] == expected
+
+
+def test_random_poses_cover_the_single_hand_rules(detector):
+    # Guards the comparison above against only ever exercising one or two labels
+    labels = {detector._classify_gesture(HandFeatures(hand))[0] for hand in HANDS["random"]}
+    assert {
+        GestureLabel.OPEN_PALM, GestureLabel.CLOSED_FIST, GestureLabel.INDEX_POINTING,
+        GestureLabel.PEACE_SIGN, GestureLabel.THUMB_UP,
+    } <= labels
+
+
+@pytest.fixture
+def rules_detector():
+    """Detector without a MediaPipe graph: two-hand rules and per-hand tracks only."""
+    from senses.vision_hands import HandGestureDetector
+
+    detector = object.__new__(HandGestureDetector)
+    detector.config = VisionConfig()
+    detector._smoothing_alpha = detector.config.landmark_smoothing_alpha
+    detector._tracks = {}
+    return detector
+
+
+TWO_HAND_HEART = canonical_pose(GestureLabel.TWO_HAND_HEART)
+
+
+def test_two_hand_heart_detected_in_either_order(rules_detector):
+    right, left = HandFeatures.batch(TWO_HAND_HEART)
+
+    assert rules_detector._is_two_hand_heart(right, left)
+    assert rules_detector._is_two_hand_heart(left, right)
+    assert rules_detector._classify_two_hand_gesture([right, left]) == (GestureLabel.TWO_HAND_HEART, 0.90)
+
+
+def _moved(hands: np.ndarray, hand: int, landmark: int, dx: float, dy: float) -> np.ndarray:
+    hands = hands.copy()
+    hands[hand, landmark, :2] += (dx, dy)
+    return hands
+
+
+@pytest.mark.parametrize("hands", [
+    _moved(TWO_HAND_HEART, 1, 8, 0.2, 0.0),  # Index tips apart
+    _moved(TWO_HAND_HEART, 1, 4, 0.2, 0.0),  # Thumb tips apart
+    TWO_HAND_HEART * (1.0, -1.0, 1.0) + (0.0, 1.0, 0.0),  # Upside down
+    np.concatenate([canonical_pose(GestureLabel.OPEN_PALM)] * 2) + [[[0.0, 0, 0]], [[0.4, 0, 0]]],  # Side by side
+], ids=["index-apart", "thumbs-apart", "upside-down", "two-palms"])
+def test_two_hand_heart_rejected(rules_detector, hands):
+    a, b = HandFeatures.batch(hands.astype(np.float32))
+    assert not rules_detector._is_two_hand_heart(a, b)
+    assert rules_detector._classify_two_hand_gesture([a, b]) is None
+
+
+def test_two_hand_gesture_needs_two_hands(rules_detector):
+    assert rules_detector._classify_two_hand_gesture(HandFeatures.batch(TWO_HAND_HEART[:1])) is None
+
+
+def test_hand_tracks_follow_handedness(rules_detector):
+    left, right = rules_detector._match_tracks(["Left", "Right"])
+    assert (left.key, right.key) == ("Left", "Right")
+
+    # Order of MediaPipe's results does not matter, the track does
+    assert rules_detector._match_tracks(["Right", "Left"]) == [right, left]
+
+    # Two hands reported with the same handedness get separate tracks
+    first, second = rules_detector._match_tracks(["Left", "Left"])
+    assert first is left
+    assert second.key == "Left#2" and second is not left
+
+
+def test_hand_tracks_keep_separate_smoothing_and_stability(rules_detector):
+    left, right = rules_detector._match_tracks(["Left", "Right"])
+    palm, fist = canonical_pose(GestureLabel.OPEN_PALM)[0], canonical_pose(GestureLabel.CLOSED_FIST)[0]
+
+    for _ in range(3):
+        left.stabilize(GestureLabel.OPEN_PALM)
+        right.stabilize(GestureLabel.CLOSED_FIST)
+    assert left.stable_gesture == GestureLabel.OPEN_PALM
+    assert right.stable_gesture == GestureLabel.CLOSED_FIST
+
+    left.smooth(palm)
+    right.smooth(fist)
+    np.testing.assert_array_equal(left.last_landmarks, palm)
+    np.testing.assert_array_equal(right.last_landmarks, fist)
+    # Smoothing one hand toward the fist leaves the other hand's state alone
+    smoothed = left.smooth(fist)
+    np.testing.assert_allclose(smoothed, palm + left.smoothing_alpha * (fist - palm), atol=1e-6)
+    np.testing.assert_array_equal(right.last_landmarks, fist)
+
+
+def test_hand_tracks_evicted_after_max_missed_frames(rules_detector):
+    max_missed = rules_detector.config.hand_track_max_missed_frames
+    left, right = rules_detector._match_tracks(["Left", "Right"])
+
+    for _ in range(max_missed):
+        assert rules_detector._match_tracks(["Left"]) == [left]
+    assert set(rules_detector._tracks) == {"Left", "Right"}
+
+    rules_detector._match_tracks(["Left"])
+    assert set(rules_detector._tracks) == {"Left"}
+    assert rules_detector._match_tracks(["Left", "Right"])[1] is not right
+
+
+def test_landmark_list_matches_array():
+    from senses.vision_hands import HandGestureResult, HandLandmark
+
+    hand = canonical_pose(GestureLabel.OPEN_PALM)[0]
+    result = HandGestureResult(
+        gesture=GestureLabel.OPEN_PALM, confidence=0.9, landmarks=hand,
+        bounding_box=(0, 0, 1, 1), handedness="Left", finger_states={},
+    )
+
+    points = result.landmark_list
+    assert len(points) == 21 and isinstance(points[0], HandLandmark)
+    np.testing.assert_allclose([(p.x, p.y, p.z) for p in points], hand)
@@ -0,0 +1,47 @@
+"""DetectorScheduler budget decisions, on a simulated frame loop."""
+
+from typing import Dict, List
+
+from core.scheduler import DetectorScheduler
+
+
+def _simulate(scheduler: DetectorScheduler, latencies_ms: Dict[str, float], frames: int = 120) -> List[List[str]]:
+    """Plan and record frames back to back, each detector taking its given latency."""
+    plans = []
+    for _ in range(frames):
+        stages = scheduler.plan()
+        for stage in stages:
+            scheduler.record(stage, latencies_ms[stage])
+        plans.append(stages)
+    return plans
+
+
+def test_stage_well_under_budget_runs_every_frame():
+    # Main loop configuration with --budget 33: hands 0.4 ms, face 60 ms
+    scheduler = DetectorScheduler(("hands", "face"), 33.0, min_interval_ms={"face": 50})
+    plans = _simulate(scheduler, {"hands": 0.4, "face": 60.0})
+
+    assert all("hands" in stages for stages in plans)
+    assert scheduler.stages["hands"].runs == len(plans)
+    # The expensive stage is what gets skipped
+    assert 0 < scheduler.stages["face"].runs <= len(plans) // 2
+
+
+def test_min_interval_throttles_only_its_stage():
+    scheduler = DetectorScheduler(("hands", "face"), 33.0, min_interval_ms={"face": 100}, concurrent=True)
+    plans = _simulate(scheduler, {"hands": 0.4, "face": 1.0}, frames=30)
+
+    assert all("hands" in stages for stages in plans)
+    # The frame clock advances at least 33 ms per frame: face runs every 4th frame
+    face_frames = [i for i, stages in enumerate(plans) if "face" in stages]
+    assert face_frames == list(range(0, 30, 4))
+
+
+def test_stale_result_runs_over_budget():
+    scheduler = DetectorScheduler(("hands", "face"), 33.0, max_age_ms=500)
+    plans = _simulate(scheduler, {"hands": 30.0, "face": 200.0}, frames=60)
+
+    # Face never fits the budget, but runs whenever its result reaches max_age_ms
+    face_frames = [i for i, stages in enumerate(plans) if "face" in stages]
+    assert len(face_frames) >= 3
+    assert all(b - a <= 16 for a, b in zip(face_frames, face_frames[1:]))
@@ -0,0 +1,86 @@
+"""StagedPipeline stage supervision, with stand-in processes."""
+
+import numpy as np
+
+from core.config import VisionConfig
+from senses.shared_frame_ring import FrameRef, SharedFrameRing
+from staged_pipeline import StagedPipeline, StageResult
+
+
+class FakeProcess:
+    def __init__(self, alive: bool = True, exitcode: int = 1):
+        self.alive = alive
+        self.exitcode = None if alive else exitcode
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+
+def _pipeline(realtime: bool = True, **processes) -> StagedPipeline:
+    config = VisionConfig(frame_width=64, frame_height=48)
+    pipeline = StagedPipeline(config, source="synthetic", max_restarts=2, realtime=realtime)
+    pipeline._processes = {"capture": FakeProcess(), "face": FakeProcess(), "hands": FakeProcess()}
+    pipeline._processes.update(processes)
+    return pipeline
+
+
+def test_detector_stage_out_of_restarts_is_disabled():
+    pipeline = _pipeline(hands=FakeProcess(alive=False))
+    pipeline.stats["hands"].restarts = pipeline.max_restarts
+
+    assert pipeline.check_stages()
+    assert pipeline.disabled_stages() == ["hands"]
+    assert "hands" not in pipeline._processes
+    # Still running on the next check, with face and capture untouched
+    assert pipeline.check_stages()
+    assert set(pipeline._processes) == {"capture", "face"}
+
+
+def test_capture_out_of_restarts_stops_the_pipeline():
+    pipeline = _pipeline(capture=FakeProcess(alive=False))
+    pipeline.stats["capture"].restarts = pipeline.max_restarts
+
+    assert not pipeline.check_stages()
+    assert not pipeline.finished
+
+
+def _result(stage: str, sequence: int) -> StageResult:
+    return StageResult(stage, FrameRef(0, sequence, 0.0), None, 1.0, 0, 0)
+
+
+def test_unpaced_replay_fuses_every_frame_once_both_stages_report():
+    pipeline = _pipeline(realtime=False)
+    assert pipeline.every_frame
+
+    assert pipeline.frame_results([_result("face", 0), _result("face", 1)]) == []
+    batches = pipeline.frame_results([_result("hands", 0)])
+    assert [[(r.stage, r.frame.sequence) for r in batch] for batch in batches] == [[("face", 0), ("hands", 0)]]
+    # A lost result does not hold back newer frames, and flush hands out the rest
+    batches = pipeline.frame_results([_result("face", 2), _result("hands", 2), _result("face", 3)])
+    assert [batch[0].frame.sequence for batch in batches] == [1, 2]
+    assert [batch[0].frame.sequence for batch in pipeline.frame_results([], flush=True)] == [3]
+
+
+def test_realtime_results_are_one_batch():
+    pipeline = _pipeline()
+    assert not pipeline.every_frame
+    results = [_result("face", 4), _result("hands", 3)]
+    assert pipeline.frame_results(results) == [results]
+    assert pipeline.frame_results([]) == []
+
+
+def test_ended_source_is_drained_before_stopping():
+    pipeline = _pipeline(capture=FakeProcess(alive=False, exitcode=0))
+    pipeline.ring = SharedFrameRing(pipeline.shape, 2)
+    try:
+        for _ in range(3):
+            pipeline.ring.write(np.zeros(pipeline.shape, dtype=np.uint8), 0.0)
+        pipeline.stats["face"].last_sequence = 2
+        pipeline.stats["hands"].last_sequence = 1
+
+        assert pipeline.check_stages()
+        assert pipeline.finished
+        pipeline.stats["hands"].last_sequence = 2
+        assert not pipeline.check_stages()
+    finally:
+        pipeline.ring.close()
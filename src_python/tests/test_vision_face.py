@@ -0,0 +1,344 @@
+"""Tests for face preprocessing, tracking, the per-frame emotion path and the emotion cascade."""
+
+from dataclasses import replace
+from typing import List
+
+import numpy as np
+import pytest
+
+from core.config import EmotionLabel, VisionConfig
+from senses.face_detectors import FaceDetectorBackend, FaceDetectionResult, YuNetFaceDetector
+from senses.vision_face import (
+    CHEAP_EMOTION_MODEL_PATH,
+    CHEAP_EMOTION_ORDER,
+    DEEPFACE_EMOTION_ORDER,
+    EMOTION_INDEX,
+    EMOTION_INPUT_SIZE,
+    FaceEmotionDetector,
+    FacePreprocessor,
+    FaceTracker,
+    TFLiteEmotionModel,
+)
+
+# One float32 emotion model input; steady-state frames must allocate less than this
+MODEL_INPUT_BYTES = EMOTION_INPUT_SIZE[0] * EMOTION_INPUT_SIZE[1] * 4
+
+
+class FixedFaceDetector(FaceDetectorBackend):
+    """Reports the same faces on every frame, so every frame takes the per-face path."""
+
+    name = "fixed"
+
+    def __init__(self, config: VisionConfig, boxes):
+        super().__init__(config)
+        self.boxes = boxes
+
+    def _detect(self, image: np.ndarray, gray: np.ndarray) -> List[FaceDetectionResult]:
+        return [FaceDetectionResult(bounding_box=box, confidence=0.9) for box in self.boxes]
+
+
+@pytest.fixture
+def frames():
+    config = VisionConfig()
+    rng = np.random.default_rng(0)
+    return [
+        rng.integers(0, 256, (config.frame_height, config.frame_width, 3), dtype=np.uint8)
+        for _ in range(2)
+    ]
+
+
+def test_preprocessing_does_not_allocate_per_frame(frames, allocation_peaks):
+    config = VisionConfig()
+    preprocessor = FacePreprocessor(config.frame_width, config.frame_height)
+    boxes = [(200, 120, 200, 200), (600, 100, 150, 150)]  # Grows the batch once, in warm-up
+
+    def preprocess():
+        preprocessor.emotion_batch(preprocessor.to_gray(frames[0]), boxes)
+
+    assert max(allocation_peaks(preprocess, 50)) < MODEL_INPUT_BYTES
+
+
+@pytest.mark.parametrize("change_threshold", [0.0, VisionConfig().emotion_change_threshold])
+def test_detect_all_steady_state_allocations(frames, allocation_peaks, change_threshold):
+    # Threshold 0 classifies every frame; the default reuses scores while the face is unchanged
+    config = replace(VisionConfig(), emotion_change_threshold=change_threshold)
+    detector = FaceEmotionDetector(config, use_deepface=False)
+    detector.face_detector = FixedFaceDetector(config, [(200, 120, 200, 200)])
+    frame_index = [0]
+
+    def detect():
+        frame_index[0] ^= 1
+        assert len(detector.detect_all(frames[frame_index[0]])) == 1
+
+    peaks = allocation_peaks(detect, 50)
+    # The allocating version made a gray frame copy (~500 KB) per frame
+    assert max(peaks) < MODEL_INPUT_BYTES
+
+
+class StubYuNet:
+    """cv.FaceDetectorYN stand-in returning fixed rows (x, y, w, h, 10 landmarks, score)."""
+
+    def __init__(self, boxes):
+        self.rows = np.array([[*box, *([0.0] * 10), 0.9] for box in boxes], dtype=np.float32)
+
+    def setInputSize(self, size):
+        pass
+
+    def detect(self, image):
+        return 1, self.rows
+
+
+def test_yunet_boxes_clipped_to_frame(frames):
+    height, width = frames[0].shape[:2]
+    detector = object.__new__(YuNetFaceDetector)  # No model file needed
+    detector._input_size = (width, height)
+    detector.detector = StubYuNet([
+        (100, 80, 200, 220),                    # Inside
+        (-30, -20, 200, 220),                   # Past the top left corner
+        (width - 150, height - 100, 200, 220),  # Past the bottom right corner
+        (-250, 80, 200, 220),                   # Entirely outside
+    ])
+
+    boxes = [face.bounding_box for face in detector._detect(frames[0], None)]
+
+    assert boxes == [
+        (100, 80, 200, 220),
+        (0, 0, 170, 200),
+        (width - 150, height - 100, 150, 100),
+    ]
+
+
+def track_ids(tracker: FaceTracker, boxes) -> List[int]:
+    return [track.track_id for track in tracker.update(boxes)]
+
+
+def test_tracker_keeps_ids_for_moving_faces():
+    tracker = FaceTracker()
+    assert track_ids(tracker, [(100, 100, 100, 100), (400, 100, 100, 100)]) == [1, 2]
+
+    for step in range(1, 10):
+        a = (100 + 5 * step, 100, 100, 100)
+        b = (400 - 5 * step, 100 + 5 * step, 100, 100)
+        # Detection order changes frame to frame; IDs follow the faces, not the order
+        boxes = [a, b] if step % 2 else [b, a]
+        expected = [1, 2] if step % 2 else [2, 1]
+        assert track_ids(tracker, boxes) == expected
+
+    assert len(tracker.tracks) == 2
+
+
+def test_tracker_falls_back_to_centroid_for_fast_motion():
+    # A diagonal jump of 35 px leaves IoU at 0.27 (below 0.3), but the
+    # centers are 0.49 box sizes apart, within max_center_distance
+    jump = [(100, 100, 100, 100), (135, 135, 100, 100)]
+
+    tracker = FaceTracker(iou_threshold=0.3, max_center_distance=0.5)
+    assert [track_ids(tracker, [box]) for box in jump] == [[1], [1]]
+
+    tracker = FaceTracker(iou_threshold=0.3, max_center_distance=0.0)
+    assert [track_ids(tracker, [box]) for box in jump] == [[1], [2]]
+
+    # Further than max_center_distance starts a new track
+    tracker = FaceTracker(iou_threshold=0.3, max_center_distance=0.5)
+    assert [track_ids(tracker, [box]) for box in [(100, 100, 100, 100), (140, 140, 100, 100)]] == [[1], [2]]
+
+
+def test_tracker_prefers_iou_over_centroid():
+    tracker = FaceTracker(max_center_distance=10.0)
+    track_ids(tracker, [(100, 100, 100, 100), (500, 100, 100, 100)])
+
+    # The first box is nearer track 1 by centroid, but the second overlaps it
+    assert track_ids(tracker, [(250, 100, 100, 100), (110, 100, 100, 100)]) == [2, 1]
+
+
+def test_tracker_evicts_after_max_missed_frames():
+    tracker = FaceTracker(max_missed_frames=3)
+    face = (100, 100, 100, 100)
+    track_ids(tracker, [face])
+
+    # Missing for max_missed_frames frames keeps the track and its ID
+    for _ in range(3):
+        tracker.update([])
+    assert len(tracker.tracks) == 1
+    assert track_ids(tracker, [face]) == [1]
+
+    # One more missed frame evicts it; the face comes back with a new ID
+    for _ in range(4):
+        tracker.update([])
+    assert tracker.tracks == []
+    assert track_ids(tracker, [face]) == [2]
+
+
+class StubEmotionModel:
+    """Returns the same scores for every face and records each call's batch size."""
+
+    def __init__(self, scores, labels=DEEPFACE_EMOTION_ORDER, input_size=EMOTION_INPUT_SIZE):
+        self.labels = tuple(labels)
+        self.input_size = input_size
+        self.centered = True
+        self.scores = np.array([scores.get(name, 0.0) for name in self.labels], dtype=np.float32)
+        self.batch_sizes: List[int] = []
+
+    def predict_on_batch(self, batch: np.ndarray) -> np.ndarray:
+        assert batch.shape[1:3] == self.input_size[::-1]
+        self.batch_sizes.append(len(batch))
+        return np.tile(self.scores, (len(batch), 1))
+
+
+def cascade_detector(boxes, cheap, expensive):
+    """Detector with stub cheap and DeepFace tiers, classifying every frame."""
+    config = replace(VisionConfig(), emotion_change_threshold=0.0)
+    detector = FaceEmotionDetector(config, use_deepface=False)
+    detector.face_detector = FixedFaceDetector(config, boxes)
+    detector._deepface_available = True
+    detector._emotion_model = expensive
+    detector._set_cheap_model(cheap)
+    return detector
+
+
+def test_cascade_accepts_confident_cheap_result_after_deepface(frames):
+    cheap = StubEmotionModel({"neutral": 0.9, "happy": 0.1}, input_size=(64, 64))
+    expensive = StubEmotionModel({"neutral": 0.8, "sad": 0.2})
+    detector = cascade_detector([(200, 120, 200, 200)], cheap, expensive)
+
+    for _ in range(4):
+        detector.detect_all(frames[0])
+
+    # DeepFace scores the new face once, then agreeing confident cheap results are kept
+    assert expensive.batch_sizes == [1]
+    assert cheap.batch_sizes == [1, 1, 1, 1]
+    assert detector.get_stats()["cascade"]["cheap_accept_ratio"] == 0.75
+
+
+@pytest.mark.parametrize("cheap_scores", [
+    {"neutral": 0.5, "happy": 0.5},  # Below emotion_cascade_threshold
+    {"happy": 0.9, "neutral": 0.1},  # Disagrees with the stable emotion
+])
+def test_cascade_escalates_unsure_or_disagreeing_faces(frames, cheap_scores):
+    cheap = StubEmotionModel(cheap_scores, input_size=(64, 64))
+    expensive = StubEmotionModel({"neutral": 0.8, "sad": 0.2})
+    detector = cascade_detector([(200, 120, 200, 200)], cheap, expensive)
+
+    for _ in range(4):
+        results = detector.detect_all(frames[0])
+
+    assert expensive.batch_sizes == [1, 1, 1, 1]
+    assert results[0].emotion == EmotionLabel.NEUTRAL
+
+
+def test_cascade_requires_deepface_run_per_track(frames):
+    cheap = StubEmotionModel({"neutral": 0.9, "happy": 0.1}, input_size=(64, 64))
+    expensive = StubEmotionModel({"neutral": 0.8, "sad": 0.2})
+    boxes = [(200, 120, 200, 200)]
+    detector = cascade_detector(boxes, cheap, expensive)
+    detector.detect_all(frames[0])
+    detector.detect_all(frames[0])
+
+    # A second face appears: its stable emotion starts at NEUTRAL, which the
+    # cheap tier agrees with, but it still needs its own DeepFace run
+    boxes.append((700, 100, 150, 150))
+    detector.detect_all(frames[0])
+    detector.detect_all(frames[0])
+
+    assert expensive.batch_sizes == [1, 1]
+    assert [track.expensive_runs for track in detector.tracker.tracks] == [1, 1]
+
+
+def test_cascade_keeps_scores_for_labels_cheap_model_does_not_predict(frames):
+    cheap = StubEmotionModel(
+        {"neutral": 0.9, "happy": 0.1},
+        labels=("happy", "sad", "surprise", "neutral"),
+        input_size=(64, 64),
+    )
+    expensive = StubEmotionModel({"neutral": 0.7, "angry": 0.2, "fear": 0.1})
+    detector = cascade_detector([(200, 120, 200, 200)], cheap, expensive)
+    detector.detect_all(frames[0])
+    detector.detect_all(frames[0])
+
+    track = detector.tracker.tracks[0]
+    assert expensive.batch_sizes == [1]
+    assert track.gate_scores[EMOTION_INDEX["angry"]] == pytest.approx(0.2)
+    assert track.gate_scores[EMOTION_INDEX["fear"]] == pytest.approx(0.1)
+    assert track.gate_scores[EMOTION_INDEX["neutral"]] == pytest.approx(0.9)
+    assert track.smoothed_scores[EMOTION_INDEX["angry"]] == pytest.approx(0.2)
+
+
+def test_cascade_load_failure_raises():
+    config = replace(VisionConfig(), emotion_cascade=True, emotion_cheap_model_path="missing.tflite")
+    detector = FaceEmotionDetector(config, use_deepface=False)
+    with pytest.raises(RuntimeError, match="cheap model"):
+        detector._load_cheap_emotion_model()
+
+
+def test_bundled_cheap_model_predicts_all_labels(frames):
+    try:
+        model = TFLiteEmotionModel(CHEAP_EMOTION_MODEL_PATH)
+    except ImportError:
+        pytest.skip("No TFLite runtime installed")
+    preprocessor = FacePreprocessor(frames[0].shape[1], frames[0].shape[0])
+    boxes = [(200, 120, 200, 200), (600, 100, 150, 150)]
+    batch = preprocessor.emotion_batch(
+        preprocessor.to_gray(frames[0]), boxes, model.input_size, model.centered
+    )
+
+    scores = model.predict_on_batch(batch)
+
+    assert batch.min() >= -1.0 and batch.max() <= 1.0
+    assert scores.shape == (2, len(CHEAP_EMOTION_ORDER))
+    np.testing.assert_allclose(scores.sum(axis=1), 1.0, atol=1e-3)
+
+
+def gated_detector(model, **config_changes):
+    """Detector with a stub direct emotion model and one fixed face."""
+    config = replace(VisionConfig(), **config_changes)
+    detector = FaceEmotionDetector(config, use_deepface=False)
+    detector.face_detector = FixedFaceDetector(config, [(200, 120, 200, 200)])
+    detector._deepface_available = True
+    detector._emotion_model = model
+    return detector
+
+
+def test_change_gate_reuses_scores_below_threshold(frames):
+    model = StubEmotionModel({"happy": 0.9, "neutral": 0.1})
+    detector = gated_detector(model, emotion_change_threshold=3.0, emotion_max_reuse_frames=100)
+    # Sensor noise of +-1 gray level stays far below the threshold
+    noise = np.random.default_rng(1).integers(-1, 2, frames[0].shape)
+    noisy = np.clip(frames[0] + noise, 0, 255).astype(np.uint8)
+
+    reused = [detector.detect_all(frame)[0].scores_reused for frame in [frames[0], noisy] * 5]
+
+    assert model.batch_sizes == [1]
+    assert reused == [False] + [True] * 9
+    assert detector.get_stats()["model_skips"] == 9
+
+
+def test_change_gate_reruns_model_on_change(frames):
+    model = StubEmotionModel({"happy": 0.9, "neutral": 0.1})
+    detector = gated_detector(model, emotion_change_threshold=3.0)
+
+    reused = [detector.detect_all(frame)[0].scores_reused for frame in frames * 3]
+
+    assert model.batch_sizes == [1] * 6
+    assert reused == [False] * 6
+
+
+def test_change_gate_reruns_model_at_max_reuse_frames(frames):
+    model = StubEmotionModel({"happy": 0.9, "neutral": 0.1})
+    detector = gated_detector(model, emotion_change_threshold=3.0, emotion_max_reuse_frames=3)
+
+    reused = [detector.detect_all(frames[0])[0].scores_reused for _ in range(9)]
+
+    # Classified, reused 3 times, classified again, ...
+    assert reused == [False, True, True, True] * 2 + [False]
+    assert model.batch_sizes == [1] * 3
+
+
+def test_change_gate_disabled_at_zero_threshold(frames):
+    model = StubEmotionModel({"happy": 0.9, "neutral": 0.1})
+    detector = gated_detector(model, emotion_change_threshold=0.0)
+
+    results = [detector.detect_all(frames[0])[0] for _ in range(4)]
+
+    assert model.batch_sizes == [1] * 4
+    assert not any(result.scores_reused for result in results)
+    assert results[-1].emotion == EmotionLabel.HAPPY
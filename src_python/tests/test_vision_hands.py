@@ -0,0 +1,129 @@
+"""Tests for MediaPipe hand detection (skipped without mediapipe.solutions)."""
+
+from dataclasses import replace
+from typing import Optional, Sequence
+
+import numpy as np
+import cv2 as cv
+import pytest
+
+mp = pytest.importorskip("mediapipe")
+if not hasattr(mp, "solutions"):
+    pytest.skip("mediapipe.solutions is not available", allow_module_level=True)
+
+from core.config import VisionConfig
+from senses.vision_hands import (
+    HandGestureDetector,
+    HandGestureResult,
+    detect_gesture,
+    release_shared_hand_detector,
+)
+
+BACKGROUND = (60, 80, 90)
+SKIN = (140, 170, 220)
+
+
+def draw_hand(
+    center: Sequence[int] = (320, 300),
+    fingers: Sequence[int] = (1, 1, 1, 1, 1),
+    scale: float = 1.0,
+    size: Sequence[int] = (640, 480)
+) -> np.ndarray:
+    """
+    Draw a flat, skin-colored hand that MediaPipe Hands detects.
+
+    Args:
+        center: Palm center in pixels
+        fingers: Thumb..pinky, 1 = extended, 0 = curled
+        scale: Hand size factor
+        size: (width, height) of the image
+    """
+    image = np.full((size[1], size[0], 3), BACKGROUND, dtype=np.uint8)
+    cx, cy = center
+    cv.ellipse(image, (cx, cy), (int(70 * scale), int(85 * scale)), 0, 0, 360, SKIN, -1, cv.LINE_AA)
+    angles = (-150, -110, -95, -80, -65)  # Thumb, then index..pinky, degrees from +x
+    lengths = (80, 120, 130, 120, 95)
+    for i, (angle, length, extended) in enumerate(zip(angles, lengths, fingers)):
+        if i == 0:
+            base = (cx - int(65 * scale), cy)
+        else:
+            base = (cx + int((-55 + i * 27) * scale), cy - int(55 * scale))
+        reach = (length if extended else 30) * scale
+        tip = (
+            int(base[0] + reach * np.cos(np.deg2rad(angle))),
+            int(base[1] + reach * np.sin(np.deg2rad(angle))),
+        )
+        cv.line(image, base, tip, SKIN, max(1, int(24 * scale)), cv.LINE_AA)
+        cv.circle(image, tip, int(12 * scale), SKIN, -1, cv.LINE_AA)
+    return image
+
+
+def _same_result(a: Optional[HandGestureResult], b: Optional[HandGestureResult]) -> bool:
+    if a is None or b is None:
+        return a is b
+    return a.gesture == b.gesture and np.allclose(a.landmarks, b.landmarks, atol=1e-5)
+
+
+def test_detect_gesture_ignores_previous_calls():
+    images = {
+        "open": draw_hand(),
+        "shifted": draw_hand(center=(400, 260)),
+        "pointing": draw_hand(fingers=(0, 1, 0, 0, 0)),
+        "thumb": draw_hand(fingers=(1, 0, 0, 0, 0)),
+        "empty": np.full((480, 640, 3), BACKGROUND, dtype=np.uint8),
+    }
+
+    # Each image on a freshly built detector
+    alone = {}
+    for name, image in images.items():
+        release_shared_hand_detector()
+        alone[name] = detect_gesture(image)
+    assert alone["open"] is not None, "synthetic hand not detected; the test would prove nothing"
+
+    # Every ordered pair in a row on the shared detector
+    try:
+        for first, first_image in images.items():
+            for second, second_image in images.items():
+                assert _same_result(detect_gesture(first_image), alone[first])
+                assert _same_result(detect_gesture(second_image), alone[second]), f"{first} -> {second}"
+    finally:
+        release_shared_hand_detector()
+
+
+def test_roi_tracking_follows_a_moving_hand_across_crop_changes():
+    # Video mode tracks from the previous input's landmarks; a moved crop must not
+    # leave it tracking stale rects
+    frames = [draw_hand(center=(160 + i * 12, 300), scale=0.8, size=(960, 540)) for i in range(45)]
+    config = replace(VisionConfig(), landmark_smoothing_alpha=1.0)
+
+    # Ground truth: every frame detected from scratch on the full frame
+    reference = HandGestureDetector(replace(config, static_image_mode=True))
+    try:
+        expected = [reference.detect(frame) for frame in frames]
+    finally:
+        reference.close()
+    assert sum(result is not None for result in expected) > 30, "synthetic hand not detected"
+
+    detector = HandGestureDetector(replace(config, hand_roi_tracking=True))
+    crops = []
+    prepare = detector._preprocessor.prepare
+
+    def record_crop(image, roi=None):
+        crops.append(roi)
+        return prepare(image, roi)
+
+    detector._preprocessor.prepare = record_crop
+    try:
+        for i, (frame, truth) in enumerate(zip(frames, expected)):
+            result = detector.detect(frame)
+            if truth is None:
+                continue
+            assert result is not None, f"hand lost on frame {i}"
+            error = np.abs(result.pixel_landmarks - truth.pixel_landmarks).max()
+            assert error < 40, f"frame {i}: landmarks {error}px off"
+    finally:
+        detector.close()
+
+    # The hand crosses half the frame, so the crop must have moved
+    assert len({crop for crop in crops if crop is not None}) >= 2
+    assert detector.roi_resets > 0